@@ -0,0 +1,392 @@
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from adapters.loggers.logger_adapter import app_logger
+from core.domain.tts_model import AudioBytes
+from core.interfaces.audio_cache_interface import AudioCacheInterface
+
+_SEGMENT_MAGIC = b"TTSA"
+_SEGMENT_HEADER = struct.Struct("<4s32sII")
+_INDEX_RECORD = struct.Struct("<B32sIQI")
+_INDEX_CRC = struct.Struct("<I")
+_INDEX_RECORD_SIZE = _INDEX_RECORD.size + _INDEX_CRC.size
+
+_OP_PUT = 1
+_OP_DELETE = 2
+_OP_INDEXED_END = 3
+
+Location = Tuple[int, int, int]
+
+
+class DiskAudioCache(AudioCacheInterface):
+    """
+    Persistent audio cache shared by every worker process on a host.
+
+    Audio is appended to segment files as self-describing records
+    (magic, key, length, CRC32, payload) and located through an append-only
+    index log of fixed-size PUT/DELETE records. Hits are served as
+    memoryviews over read-only mmaps of the segments, so the payload lives
+    in the page cache once per host rather than once per worker heap.
+
+    Writers serialize on an flock'd lock file. On open, the index log is
+    replayed up to its last intact record and segment tails written after
+    the last index record are re-scanned, so a crash mid-write loses at most
+    the entry being written. Evicted entries are reclaimed by compacting
+    mostly-dead segments into the active one. A compacted index keeps how far
+    each segment was indexed, so evicted records are not recovered as tails.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        compaction_threshold: float = 0.5,
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_max_bytes = segment_max_bytes
+        self.compaction_threshold = compaction_threshold
+
+        self._index_path = os.path.join(directory, "index.log")
+        self._lock_file = open(os.path.join(directory, "lock"), "a+b")
+        self._thread_lock = threading.Lock()
+
+        self._index: "OrderedDict[bytes, Location]" = OrderedDict()
+        self._segment_live: Dict[int, int] = {}
+        self._indexed_end: Dict[int, int] = {}
+        self._live_bytes = 0
+        self._index_pos = 0
+        self._index_inode: Optional[int] = None
+        self._maps: Dict[int, mmap.mmap] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._compactions = 0
+
+        with self._exclusive():
+            self._recover()
+
+    def get(self, key: str) -> Optional[memoryview]:
+        digest = bytes.fromhex(key)
+        with self._thread_lock:
+            location = self._index.get(digest)
+            if location is None:
+                self._refresh()
+                location = self._index.get(digest)
+
+            view = self._view(location) if location is not None else None
+            if view is None:
+                if location is not None:
+                    self._forget(digest)
+                self._misses += 1
+                return None
+
+            self._index.move_to_end(digest)
+            self._hits += 1
+            return view
+
+    def put(self, key: str, audio: AudioBytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+
+        digest = bytes.fromhex(key)
+        with self._exclusive():
+            self._refresh()
+            if digest in self._index:
+                return
+            self._append_entry(digest, audio)
+            self._enforce_budget()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._thread_lock:
+            segment_ids = self._segment_ids()
+            disk_bytes = sum(
+                self._segment_size(segment_id) for segment_id in segment_ids
+            )
+            return {
+                "backend": "disk",
+                "entries": len(self._index),
+                "bytes": self._live_bytes,
+                "diskBytes": disk_bytes,
+                "segments": len(segment_ids),
+                "maxBytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "compactions": self._compactions,
+            }
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        with self._thread_lock:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _segment_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment_id:08d}.dat")
+
+    def _segment_ids(self) -> List[int]:
+        segment_ids = []
+        for name in os.listdir(self.directory):
+            if name.startswith("segment-") and name.endswith(".dat"):
+                try:
+                    segment_ids.append(int(name[len("segment-") : -len(".dat")]))
+                except ValueError:
+                    continue
+        return sorted(segment_ids)
+
+    def _segment_size(self, segment_id: int) -> int:
+        try:
+            return os.path.getsize(self._segment_path(segment_id))
+        except FileNotFoundError:
+            return 0
+
+    def _reset_index_state(self) -> None:
+        self._index.clear()
+        self._segment_live.clear()
+        self._indexed_end.clear()
+        self._live_bytes = 0
+        self._index_pos = 0
+
+    def _recover(self) -> None:
+        if not os.path.exists(self._index_path):
+            open(self._index_path, "ab").close()
+
+        self._reset_index_state()
+        self._index_inode = os.stat(self._index_path).st_ino
+        self._replay_index(truncate=True)
+
+        segment_ids = self._segment_ids()
+        sizes = {
+            segment_id: self._segment_size(segment_id) for segment_id in segment_ids
+        }
+        for digest, (segment_id, offset, length) in list(self._index.items()):
+            if offset + length > sizes.get(segment_id, 0):
+                self._forget(digest)
+
+        for segment_id in segment_ids:
+            self._recover_segment_tail(segment_id)
+        self._enforce_budget()
+
+        app_logger.info(
+            "Disk audio cache opened at %s with %d entries (%d bytes)",
+            self.directory,
+            len(self._index),
+            self._live_bytes,
+        )
+
+    def _recover_segment_tail(self, segment_id: int) -> None:
+        path = self._segment_path(segment_id)
+        position = self._indexed_end.get(segment_id, 0)
+        recovered: List[Tuple[bytes, Location]] = []
+
+        with open(path, "r+b") as segment_file:
+            segment_file.seek(position)
+            while True:
+                header = segment_file.read(_SEGMENT_HEADER.size)
+                if len(header) < _SEGMENT_HEADER.size:
+                    break
+                magic, digest, length, crc = _SEGMENT_HEADER.unpack(header)
+                if magic != _SEGMENT_MAGIC:
+                    break
+                payload = segment_file.read(length)
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    break
+                offset = position + _SEGMENT_HEADER.size
+                recovered.append((digest, (segment_id, offset, length)))
+                position = offset + length
+
+            if position < os.fstat(segment_file.fileno()).st_size:
+                app_logger.info(
+                    "Truncating torn write in cache segment %s at offset %d",
+                    path,
+                    position,
+                )
+                segment_file.truncate(position)
+
+        for digest, (segment_id, offset, length) in recovered:
+            if digest not in self._index:
+                self._write_index(_OP_PUT, digest, segment_id, offset, length)
+
+    def _refresh(self) -> None:
+        try:
+            index_stat = os.stat(self._index_path)
+        except FileNotFoundError:
+            return
+
+        if index_stat.st_ino != self._index_inode:
+            self._reset_index_state()
+            self._index_inode = index_stat.st_ino
+            self._replay_index(truncate=False)
+        elif index_stat.st_size > self._index_pos:
+            self._replay_index(truncate=False)
+
+    def _replay_index(self, truncate: bool) -> None:
+        with open(self._index_path, "r+b" if truncate else "rb") as index_file:
+            index_file.seek(self._index_pos)
+            data = index_file.read()
+
+            position = 0
+            while position + _INDEX_RECORD_SIZE <= len(data):
+                body = data[position : position + _INDEX_RECORD.size]
+                (crc,) = _INDEX_CRC.unpack_from(data, position + _INDEX_RECORD.size)
+                if zlib.crc32(body) != crc:
+                    break
+                self._apply(*_INDEX_RECORD.unpack(body))
+                position += _INDEX_RECORD_SIZE
+
+            self._index_pos += position
+            if truncate and position < len(data):
+                app_logger.info(
+                    "Truncating corrupt cache index %s at offset %d",
+                    self._index_path,
+                    self._index_pos,
+                )
+                index_file.truncate(self._index_pos)
+
+    def _apply(
+        self, op: int, digest: bytes, segment_id: int, offset: int, length: int
+    ) -> None:
+        if op == _OP_PUT:
+            previous = self._index.get(digest)
+            if previous is not None:
+                self._segment_live[previous[0]] -= previous[2]
+                self._live_bytes -= previous[2]
+            self._index[digest] = (segment_id, offset, length)
+            self._segment_live[segment_id] = (
+                self._segment_live.get(segment_id, 0) + length
+            )
+            self._live_bytes += length
+            self._indexed_end[segment_id] = max(
+                self._indexed_end.get(segment_id, 0), offset + length
+            )
+        elif op == _OP_DELETE:
+            self._forget(digest)
+        elif op == _OP_INDEXED_END:
+            self._indexed_end[segment_id] = max(
+                self._indexed_end.get(segment_id, 0), offset
+            )
+
+    def _forget(self, digest: bytes) -> None:
+        location = self._index.pop(digest, None)
+        if location is not None:
+            self._segment_live[location[0]] -= location[2]
+            self._live_bytes -= location[2]
+
+    def _write_index(
+        self, op: int, digest: bytes, segment_id: int, offset: int, length: int
+    ) -> None:
+        body = _INDEX_RECORD.pack(op, digest, segment_id, offset, length)
+        with open(self._index_path, "ab") as index_file:
+            index_file.write(body + _INDEX_CRC.pack(zlib.crc32(body)))
+        self._index_pos += _INDEX_RECORD_SIZE
+        self._apply(op, digest, segment_id, offset, length)
+
+    def _active_segment(self, record_size: int) -> int:
+        segment_ids = self._segment_ids()
+        if not segment_ids:
+            return 1
+        active = segment_ids[-1]
+        size = self._segment_size(active)
+        if size and size + record_size > self.segment_max_bytes:
+            return active + 1
+        return active
+
+    def _append_entry(self, digest: bytes, audio: AudioBytes) -> None:
+        length = len(audio)
+        segment_id = self._active_segment(_SEGMENT_HEADER.size + length)
+        header = _SEGMENT_HEADER.pack(_SEGMENT_MAGIC, digest, length, zlib.crc32(audio))
+
+        with open(self._segment_path(segment_id), "ab") as segment_file:
+            offset = segment_file.tell() + _SEGMENT_HEADER.size
+            segment_file.write(header)
+            segment_file.write(audio)
+
+        self._write_index(_OP_PUT, digest, segment_id, offset, length)
+
+    def _enforce_budget(self) -> None:
+        while self._live_bytes > self.max_bytes and self._index:
+            digest = next(iter(self._index))
+            self._write_index(_OP_DELETE, digest, 0, 0, 0)
+            self._evictions += 1
+
+        self._compact_segments()
+        self._compact_index()
+
+    def _compact_segments(self) -> None:
+        segment_ids = self._segment_ids()
+        for segment_id in segment_ids[:-1]:
+            size = self._segment_size(segment_id)
+            live = self._segment_live.get(segment_id, 0)
+            if size and live > size * self.compaction_threshold:
+                continue
+
+            survivors = [
+                (digest, location)
+                for digest, location in self._index.items()
+                if location[0] == segment_id
+            ]
+            with open(self._segment_path(segment_id), "rb") as segment_file:
+                for digest, (_, offset, length) in survivors:
+                    segment_file.seek(offset)
+                    self._append_entry(digest, segment_file.read(length))
+
+            os.remove(self._segment_path(segment_id))
+            self._maps.pop(segment_id, None)
+            self._segment_live.pop(segment_id, None)
+            self._indexed_end.pop(segment_id, None)
+            self._compactions += 1
+
+    def _compact_index(self) -> None:
+        if self._index_pos // _INDEX_RECORD_SIZE <= 2 * len(self._index) + 1024:
+            return
+
+        records = [
+            (_OP_INDEXED_END, bytes(32), segment_id, end, 0)
+            for segment_id, end in self._indexed_end.items()
+        ]
+        records.extend(
+            (_OP_PUT, digest, segment_id, offset, length)
+            for digest, (segment_id, offset, length) in self._index.items()
+        )
+        temp_path = self._index_path + ".tmp"
+        with open(temp_path, "wb") as index_file:
+            for record in records:
+                body = _INDEX_RECORD.pack(*record)
+                index_file.write(body + _INDEX_CRC.pack(zlib.crc32(body)))
+            index_file.flush()
+            os.fsync(index_file.fileno())
+        os.replace(temp_path, self._index_path)
+
+        self._index_inode = os.stat(self._index_path).st_ino
+        self._index_pos = len(records) * _INDEX_RECORD_SIZE
+
+    def _view(self, location: Location) -> Optional[memoryview]:
+        segment_id, offset, length = location
+        segment_map = self._maps.get(segment_id)
+        if segment_map is None or len(segment_map) < offset + length:
+            try:
+                with open(self._segment_path(segment_id), "rb") as segment_file:
+                    segment_map = mmap.mmap(
+                        segment_file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+            except (FileNotFoundError, ValueError):
+                return None
+            self._maps[segment_id] = segment_map
+
+        if len(segment_map) < offset + length:
+            return None
+        return memoryview(segment_map)[offset : offset + length]
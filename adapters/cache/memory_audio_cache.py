@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from core.domain.tts_model import AudioBytes
+from core.interfaces.audio_cache_interface import AudioCacheInterface
+
+
+class MemoryAudioCache(AudioCacheInterface):
+    """
+    In-process LRU cache of synthesized audio, bounded by total payload bytes.
+
+    Entries larger than the whole budget are never stored, so a single huge
+    clip cannot flush every other entry out of the cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, AudioBytes]" = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[AudioBytes]:
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return audio
+
+    def put(self, key: str, audio: AudioBytes) -> None:
+        size = len(audio)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= len(previous)
+
+            self._entries[key] = audio
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= len(evicted)
+                self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
@@ -0,0 +1,35 @@
+from typing import List
+
+from core.domain.tts_model import TTSRequest, TTSResponse, Voice
+from core.interfaces.audio_cache_interface import AudioCacheInterface
+from core.interfaces.google_tts_client_interface import GoogleTTSClientInterface
+
+
+class CachedTTSClient(GoogleTTSClientInterface):
+    """
+    Decorates a TTS client with a content-addressed audio cache.
+
+    Only successful syntheses are cached; failures always reach the wrapped
+    client so transient upstream errors are never pinned in the cache.
+    """
+
+    def __init__(
+        self, client: GoogleTTSClientInterface, cache: AudioCacheInterface
+    ) -> None:
+        self.client = client
+        self.cache = cache
+
+    def synthesize_speech(self, request: TTSRequest) -> TTSResponse:
+        key = request.cache_key()
+
+        cached_audio = self.cache.get(key)
+        if cached_audio is not None:
+            return TTSResponse(audio_content=cached_audio, success=True)
+
+        response = self.client.synthesize_speech(request)
+        if response.success:
+            self.cache.put(key, response.audio_content)
+        return response
+
+    def list_voices(self) -> List[Voice]:
+        return self.client.list_voices()
@@ -1,11 +1,15 @@
-import base64
 import os
 from typing import Dict, Any
 
 from google.cloud import speech
 from google.api_core import exceptions as gcp_exceptions
 
-from core.domain.stt_model import STTRequest, STTResponse, WordTimestamp
+from core.domain.stt_model import (
+    NO_SPEECH_DETECTED,
+    STTRequest,
+    STTResponse,
+    WordTimestamp,
+)
 from core.interfaces.google_stt_client_interface import GoogleSTTClientInterface
 
 
@@ -27,8 +31,6 @@ class GoogleSTTClient(GoogleSTTClientInterface):
     def transcribe_speech(self, request: STTRequest) -> STTResponse:
         try:
 
-            audio_data = base64.b64decode(request.audio_data)
-
             encoding = self.FORMAT_MAPPING.get(request.format.lower())
             if not encoding:
                 return STTResponse(
@@ -41,31 +43,40 @@ class GoogleSTTClient(GoogleSTTClientInterface):
             config = speech.RecognitionConfig(
                 encoding=encoding,
                 sample_rate_hertz=request.sample_rate,
+                audio_channel_count=request.audio_channel_count,
                 language_code=request.language,
                 enable_automatic_punctuation=request.enable_automatic_punctuation,
                 enable_word_time_offsets=request.enable_word_timestamps,
                 model=request.model,
             )
 
-            audio = speech.RecognitionAudio(content=audio_data)
+            audio = speech.RecognitionAudio(content=request.audio_data)
 
             response = self.client.recognize(config=config, audio=audio)
 
-            if response.results:
-                result = response.results[0]
-                alternative = result.alternatives[0]
-                transcription = alternative.transcript
-                confidence = alternative.confidence or 0.0
+            alternatives = [
+                result.alternatives[0]
+                for result in response.results
+                if result.alternatives and result.alternatives[0].transcript.strip()
+            ]
+            if alternatives:
+                transcription = " ".join(
+                    alternative.transcript.strip() for alternative in alternatives
+                )
+                confidence = sum(
+                    alternative.confidence or 0.0 for alternative in alternatives
+                ) / len(alternatives)
 
                 word_timestamps = None
-                if request.enable_word_timestamps and hasattr(alternative, "words"):
+                if request.enable_word_timestamps:
                     word_timestamps = [
                         WordTimestamp(
                             word=word.word,
                             start_time=word.start_time.total_seconds(),
                             end_time=word.end_time.total_seconds(),
                         )
-                        for word in alternative.words
+                        for alternative in alternatives
+                        for word in getattr(alternative, "words", [])
                     ]
 
                 return STTResponse(
@@ -79,7 +90,7 @@ class GoogleSTTClient(GoogleSTTClientInterface):
                     transcription="",
                     confidence=0.0,
                     success=False,
-                    error_message="No speech detected",
+                    error_message=NO_SPEECH_DETECTED,
                 )
 
         except (
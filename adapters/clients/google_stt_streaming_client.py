@@ -1,14 +1,30 @@
+import asyncio
 import queue
 import threading
-from typing import Dict, Any, Optional, Callable
+import time
+from typing import AsyncIterator, Dict, Any, List, Optional, Callable
 
 from google.cloud import speech
 from google.api_core import exceptions as gcp_exceptions
 
 from adapters.loggers.logger_adapter import app_logger
+from core.services.audio_header import probe_audio
+from core.services.audio_ingress_buffer import AudioIngressBuffer, PressureCallback
+from core.services.audio_replay_ring import AudioReplayRing
+from core.services.frame_aggregator import (
+    FrameAggregator,
+    audio_bytes_per_second,
+    frame_target_bytes,
+)
+from core.services.resampler import PcmStreamConverter
+from core.services.streaming_metrics import StreamingMetrics
+from core.services.voice_activity import StreamingVadGate
 from core.interfaces.google_stt_streaming_client_interface import (
     GoogleSTTStreamingClientInterface,
 )
+from core.interfaces.voice_activity_detector_interface import (
+    VoiceActivityDetectorInterface,
+)
 
 
 class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
@@ -23,16 +39,113 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
         "amr": speech.RecognitionConfig.AudioEncoding.AMR,
         "amr_wb": speech.RecognitionConfig.AudioEncoding.AMR_WB,
     }
+    CONTAINER_ENCODINGS = ("WEBM_OPUS", "OGG_OPUS")
+    # Replayed audio starts at an arbitrary frame, which only raw PCM and
+    # FLAC frames can be decoded from.
+    ENDLESS_ENCODINGS = ("LINEAR16", "FLAC")
+    SPEECH_END_EVENTS = (
+        speech.StreamingRecognizeResponse.SpeechEventType.SPEECH_ACTIVITY_END,
+        speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE,
+    )
 
-    def __init__(self) -> None:
-        self.client = speech.SpeechClient()
+    _speech_clients: Dict[asyncio.AbstractEventLoop, speech.SpeechAsyncClient] = {}
+    _speech_clients_lock = threading.Lock()
+
+    def __init__(
+        self,
+        stream_limit_seconds: float = 290.0,
+        replay_max_bytes: int = 4 * 1024 * 1024,
+        ingress_max_bytes: int = 1024 * 1024,
+        ingress_policy: str = "drop_oldest",
+        ingress_high_watermark: float = 0.75,
+        ingress_low_watermark: float = 0.25,
+        frame_target_ms: int = 100,
+        frame_max_delay: float = 0.15,
+        metrics: Optional[StreamingMetrics] = None,
+        target_sample_rate: int = 16000,
+        probe_headers: bool = True,
+        voice_activity_detector: Optional[VoiceActivityDetectorInterface] = None,
+        vad_enabled: bool = False,
+        vad_hangover_ms: int = 300,
+        vad_keepalive_ms: int = 5000,
+    ) -> None:
+        self.stream_limit_seconds = stream_limit_seconds
+        self.replay_max_bytes = replay_max_bytes
+        self.ingress_max_bytes = ingress_max_bytes
+        self.ingress_policy = ingress_policy
+        self.ingress_high_watermark = ingress_high_watermark
+        self.ingress_low_watermark = ingress_low_watermark
+        self.frame_target_ms = frame_target_ms
+        self.frame_max_delay = frame_max_delay
+        self.metrics = metrics
+        self.target_sample_rate = target_sample_rate
+        self.probe_headers = probe_headers
+        self.voice_activity_detector = voice_activity_detector
+        self.vad_enabled = vad_enabled
+        self.vad_hangover_ms = vad_hangover_ms
+        self.vad_keepalive_ms = vad_keepalive_ms
         self.config: Optional[speech.RecognitionConfig] = None
+        self._config_data: Dict[str, Any] = {}
+        self._probe_pending = False
         self.streaming_config: Optional[speech.StreamingRecognitionConfig] = None
-        self.audio_queue: Optional[queue.Queue] = None
+        self.audio_queue: Optional[AudioIngressBuffer] = None
+        self.endless = False
         self.is_streaming = False
         self._stop_event = threading.Event()
+        self._keep_header = False
+        self._header_sent = False
+        self._aggregator: Optional[FrameAggregator] = None
+        self._converter: Optional[PcmStreamConverter] = None
+        self._vad_gate: Optional[StreamingVadGate] = None
+        self._replay_ring = AudioReplayRing(replay_max_bytes)
+        self._offset_ms = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._data_ready: Optional[asyncio.Event] = None
+        self._bytes_per_second = 1
+        self._configured_at: Optional[float] = None
+        self._first_audio_at: Optional[float] = None
+        self._awaiting_first_result = False
+        self._speech_ended_at: Optional[float] = None
 
-    def setup_config(self, config_data: Dict[str, Any]) -> None:
+    @classmethod
+    def shared_speech_client(cls) -> speech.SpeechAsyncClient:
+        """Return the async client shared by every session on the running loop."""
+        loop = asyncio.get_running_loop()
+        with cls._speech_clients_lock:
+            client = cls._speech_clients.get(loop)
+            if client is None:
+                client = speech.SpeechAsyncClient()
+                cls._speech_clients[loop] = client
+            return client
+
+    def setup_config(
+        self,
+        config_data: Dict[str, Any],
+        on_backpressure: Optional[PressureCallback] = None,
+    ) -> None:
+        self.endless = config_data.get("endless", False)
+        self._config_data = dict(config_data)
+        self._configure_recognition(self._config_data)
+
+        self.audio_queue = AudioIngressBuffer(
+            self.ingress_max_bytes,
+            policy=self.ingress_policy,
+            high_watermark=self.ingress_high_watermark,
+            low_watermark=self.ingress_low_watermark,
+            on_pressure=on_backpressure,
+        )
+        self._header_sent = False
+        self._replay_ring = AudioReplayRing(self.replay_max_bytes)
+        self._offset_ms = 0.0
+        self._configured_at = time.monotonic()
+        self._first_audio_at = None
+        self._awaiting_first_result = True
+        self._speech_ended_at = None
+        self._probe_pending = self.probe_headers
+        self._stop_event.clear()
+        app_logger.info("STT streaming configuration setup completed")
+
+    def _configure_recognition(self, config_data: Dict[str, Any]) -> None:
         encoding_str = config_data.get("encoding", "WEBM_OPUS").upper()
         if encoding_str not in [
             "WEBM_OPUS",
@@ -43,11 +156,49 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
             "AMR_WB",
         ]:
             encoding_str = "WEBM_OPUS"
+        self._keep_header = encoding_str in self.CONTAINER_ENCODINGS
+        if self.endless and encoding_str not in self.ENDLESS_ENCODINGS:
+            app_logger.info(
+                "Endless streaming is not supported for %s audio, "
+                "the stream will end at the upstream limit",
+                encoding_str,
+            )
+            self.endless = False
         encoding = getattr(speech.RecognitionConfig.AudioEncoding, encoding_str)
 
+        sample_rate = config_data.get("sampleRateHertz", 48000)
+        channels = config_data.get("audioChannelCount", 1)
+        self._converter = None
+        if (
+            encoding_str == "LINEAR16"
+            and self.target_sample_rate
+            and (channels > 1 or sample_rate > self.target_sample_rate)
+        ):
+            upstream_rate = min(sample_rate, self.target_sample_rate)
+            self._converter = PcmStreamConverter(channels, sample_rate, upstream_rate)
+            sample_rate, channels = upstream_rate, 1
+
+        self._vad_gate = None
+        use_vad = config_data.get("vad")
+        if use_vad is None:
+            use_vad = self.vad_enabled
+        if (
+            use_vad
+            and self.voice_activity_detector is not None
+            and encoding_str == "LINEAR16"
+            and channels == 1
+        ):
+            self._vad_gate = StreamingVadGate(
+                self.voice_activity_detector,
+                sample_rate,
+                hangover_ms=self.vad_hangover_ms,
+                keepalive_ms=self.vad_keepalive_ms,
+            )
+
         self.config = speech.RecognitionConfig(
             encoding=encoding,
-            sample_rate_hertz=config_data.get("sampleRateHertz", 48000),
+            sample_rate_hertz=sample_rate,
+            audio_channel_count=channels,
             language_code=config_data.get("languageCode", "en-US"),
             max_alternatives=config_data.get("maxAlternatives", 1),
             enable_word_time_offsets=config_data.get("enableWordTimeOffsets", False),
@@ -59,29 +210,114 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
         self.streaming_config = speech.StreamingRecognitionConfig(
             config=self.config,
             interim_results=config_data.get("interimResults", True),
-            single_utterance=config_data.get("singleUtterance", False),
+            single_utterance=(
+                config_data.get("singleUtterance", False) and not self.endless
+            ),
+            enable_voice_activity_events=self.metrics is not None,
         )
-
-        self.audio_queue = queue.Queue()
-        self._stop_event.clear()
-        app_logger.info("STT streaming configuration setup completed")
+        self._aggregator = FrameAggregator(
+            frame_target_bytes(encoding_str, sample_rate, self.frame_target_ms),
+            self.frame_max_delay,
+        )
+        self._bytes_per_second = audio_bytes_per_second(encoding_str, sample_rate)
 
     def add_audio_chunk(self, audio_data: bytes) -> None:
         if self.audio_queue and not self._stop_event.is_set():
-            self.audio_queue.put(audio_data)
+            if self._probe_pending:
+                audio_data = self._apply_audio_header(audio_data)
+            if self._converter is not None:
+                audio_data = self._converter.convert(audio_data)
+            if self._vad_gate is not None:
+                audio_data = self._vad_gate.process(audio_data)
+            if not audio_data:
+                return
+            if not self.audio_queue.put(audio_data):
+                app_logger.debug(
+                    "STT ingress buffer full, dropped %d bytes", len(audio_data)
+                )
+                return
+            if self._first_audio_at is None:
+                self._first_audio_at = time.monotonic()
+            self._wake()
+
+    def _apply_audio_header(self, chunk: bytes) -> bytes:
+        """
+        Correct the declared encoding, rate and channel count from the
+        header at the start of the first chunk, before the configuration is
+        sent upstream. A WAV header is cut off so it is not sent as audio.
+        """
+        info = probe_audio(chunk)
+        if info is not None and info.encoding is not None:
+            declared = (
+                self._config_data.get("encoding", "WEBM_OPUS").upper(),
+                self._config_data.get("sampleRateHertz", 48000),
+                self._config_data.get("audioChannelCount", 1),
+            )
+            detected = (info.encoding, info.sample_rate, info.channels)
+            if detected != declared:
+                app_logger.info(
+                    "Audio header says %s at %d Hz with %d channel(s), "
+                    "correcting the declared %s at %d Hz with %d channel(s)",
+                    *detected,
+                    *declared,
+                )
+                self._config_data.update(
+                    encoding=info.encoding,
+                    sampleRateHertz=info.sample_rate,
+                    audioChannelCount=info.channels,
+                )
+                self._configure_recognition(self._config_data)
+            if info.encoding == "LINEAR16":
+                chunk = chunk[info.data_offset :]
+        self._probe_pending = False
+        return chunk
 
-    def _audio_generator(self):
+    def _wake(self) -> None:
+        loop, data_ready = self._loop, self._data_ready
+        if loop is None or data_ready is None:
+            return
+        try:
+            loop.call_soon_threadsafe(data_ready.set)
+        except RuntimeError:
+            pass
+
+    async def _audio_generator(
+        self, deadline: Optional[float] = None
+    ) -> AsyncIterator[bytes]:
         while not self._stop_event.is_set():
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+
+            self._data_ready.clear()
             try:
-                chunk = self.audio_queue.get(timeout=0.1)
-                if chunk is None:
-                    break
-                yield chunk
+                chunk = self.audio_queue.get(timeout=0)
             except queue.Empty:
+                flush_at = self._aggregator.flush_at()
+                if flush_at is not None and now >= flush_at:
+                    yield self._aggregator.flush()
+                    continue
+                wake_at = [at for at in (deadline, flush_at) if at is not None]
+                timeout = min(wake_at) - now if wake_at else None
+                try:
+                    await asyncio.wait_for(self._data_ready.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
                 continue
-            except Exception as e:
-                app_logger.error("Error in audio generator: %s", e)
+
+            if chunk is None:
                 break
+            self._observe_backlog()
+            if self._keep_header and not self._header_sent:
+                self._header_sent = True
+                yield chunk
+                continue
+            for frame in self._aggregator.push(chunk):
+                yield frame
+
+        pending = self._aggregator.flush()
+        if pending:
+            yield pending
 
     async def start_streaming(
         self, result_callback: Callable[[Dict[str, Any]], None]
@@ -89,52 +325,36 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
         if not self.config or not self.streaming_config:
             raise ValueError("Configuration not set. Call setup_config() first.")
         self.is_streaming = True
-
-        def request_generator():
-
-            for audio_chunk in self._audio_generator():
-                yield speech.StreamingRecognizeRequest(audio_content=audio_chunk)
+        self._loop = asyncio.get_running_loop()
+        self._data_ready = asyncio.Event()
 
         app_logger.info("Starting STT streaming recognition")
 
-        responses = self.client.streaming_recognize(
-            self.streaming_config, request_generator()
-        )
-
+        replay: List[bytes] = []
         try:
-            for response in responses:
-                if self._stop_event.is_set():
-                    break
+            speech_client = self.shared_speech_client()
+            while not self._stop_event.is_set():
+                started_at = time.monotonic()
+                responses = await speech_client.streaming_recognize(
+                    requests=self._request_generator(replay, started_at)
+                )
+                try:
+                    await self._process_responses(responses, result_callback)
+                except gcp_exceptions.OutOfRange:
+                    if not self.endless:
+                        raise
 
-                if (
-                    getattr(response, "speech_event_type", None)
-                    == speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE
-                ):
-                    await result_callback({"type": "end_of_utterance"})
-                    continue
+                if not self.endless or self._stop_event.is_set():
+                    break
 
-                for result in response.results:
-                    if not result.alternatives:
-                        continue
-                    alt = result.alternatives[0]
-                    ts = None
-                    if hasattr(alt, "words") and alt.words:
-                        ts = [
-                            {
-                                "word": w.word,
-                                "startTime": w.start_time.total_seconds(),
-                                "endTime": w.end_time.total_seconds(),
-                            }
-                            for w in alt.words
-                        ]
-                    payload = {
-                        "type": "final_result" if result.is_final else "interim_result",
-                        "transcript": alt.transcript,
-                        "confidence": getattr(alt, "confidence", 0.0),
-                    }
-                    if result.is_final:
-                        payload["wordTimestamps"] = ts
-                    await result_callback(payload)
+                replay, offset_ms = self._replay_ring.rollover()
+                self._offset_ms += offset_ms
+                app_logger.info(
+                    "STT stream rolled over, replaying %d chunks", len(replay)
+                )
+                await result_callback(
+                    {"type": "stream_rollover", "offset": self._offset_ms / 1000}
+                )
 
         except gcp_exceptions.GoogleAPICallError as e:
             app_logger.error("Google API error during streaming: %s", e)
@@ -146,13 +366,124 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
             await result_callback({"type": "error", "message": f"Streaming error: {e}"})
         finally:
             self.is_streaming = False
+            self._loop = None
             app_logger.info("STT streaming recognition stopped")
 
+    async def _request_generator(
+        self, replay: List[bytes], started_at: float
+    ) -> AsyncIterator[speech.StreamingRecognizeRequest]:
+        deadline = None
+        if self.endless:
+            deadline = started_at + self.stream_limit_seconds
+
+        if self._configured_at is not None:
+            self._observe(
+                "configToUpstreamOpenSeconds", time.monotonic() - self._configured_at
+            )
+            self._configured_at = None
+        while self._probe_pending and not self._stop_event.is_set():
+            self._data_ready.clear()
+            if self._probe_pending:
+                await self._data_ready.wait()
+        yield speech.StreamingRecognizeRequest(streaming_config=self.streaming_config)
+
+        for audio_chunk in replay:
+            self._replay_ring.append(audio_chunk, self._duration_ms(audio_chunk))
+            yield speech.StreamingRecognizeRequest(audio_content=audio_chunk)
+
+        async for audio_chunk in self._audio_generator(deadline):
+            if self.endless:
+                self._replay_ring.append(audio_chunk, self._duration_ms(audio_chunk))
+            yield speech.StreamingRecognizeRequest(audio_content=audio_chunk)
+
+    async def _process_responses(
+        self, responses, result_callback: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        offset = self._offset_ms / 1000
+        async for response in responses:
+            if self._stop_event.is_set():
+                break
+
+            event_type = getattr(response, "speech_event_type", None)
+            if event_type in self.SPEECH_END_EVENTS:
+                self._speech_ended_at = time.monotonic()
+            if (
+                event_type
+                == speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE
+            ):
+                await result_callback({"type": "end_of_utterance"})
+                continue
+
+            for result in response.results:
+                if self.endless and result.result_end_time:
+                    self._replay_ring.observe(
+                        result.result_end_time.total_seconds() * 1000, result.is_final
+                    )
+                if not result.alternatives:
+                    continue
+                self._observe_result(result.is_final)
+                alt = result.alternatives[0]
+                ts = None
+                if hasattr(alt, "words") and alt.words:
+                    ts = [
+                        {
+                            "word": w.word,
+                            "startTime": self._client_time(
+                                w.start_time.total_seconds() + offset
+                            ),
+                            "endTime": self._client_time(
+                                w.end_time.total_seconds() + offset
+                            ),
+                        }
+                        for w in alt.words
+                    ]
+                payload = {
+                    "type": "final_result" if result.is_final else "interim_result",
+                    "transcript": alt.transcript,
+                    "confidence": getattr(alt, "confidence", 0.0),
+                }
+                if result.is_final:
+                    payload["wordTimestamps"] = ts
+                await result_callback(payload)
+
+    def _client_time(self, upstream_seconds: float) -> float:
+        """Map a time in the audio sent upstream to the audio the client sent."""
+        if self._vad_gate is None:
+            return upstream_seconds
+        return self._vad_gate.original_time(upstream_seconds)
+
+    def _duration_ms(self, audio: bytes) -> float:
+        """Milliseconds of audio in ``audio``; exact for LINEAR16."""
+        return len(audio) * 1000 / self._bytes_per_second
+
+    def _observe(self, name: str, value: float) -> None:
+        if self.metrics is not None:
+            self.metrics.observe(name, value)
+
+    def _observe_backlog(self) -> None:
+        if self.metrics is None:
+            return
+        stats = self.audio_queue.stats()
+        self.metrics.observe("ingressQueueDepthChunks", stats["bufferedChunks"])
+        self.metrics.observe(
+            "ingressBacklogSeconds", stats["bufferedBytes"] / self._bytes_per_second
+        )
+
+    def _observe_result(self, is_final: bool) -> None:
+        now = time.monotonic()
+        if self._awaiting_first_result and self._first_audio_at is not None:
+            self._awaiting_first_result = False
+            self._observe("firstAudioToFirstResultSeconds", now - self._first_audio_at)
+        if is_final and self._speech_ended_at is not None:
+            self._observe("endOfSpeechToFinalSeconds", now - self._speech_ended_at)
+            self._speech_ended_at = None
+
     def stop_streaming(self) -> None:
         app_logger.info("Stopping STT streaming recognition")
         self._stop_event.set()
         if self.audio_queue:
-            self.audio_queue.put(None)
+            self.audio_queue.close()
+        self._wake()
         self.is_streaming = False
 
     def is_active(self) -> bool:
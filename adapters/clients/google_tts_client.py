@@ -1,10 +1,11 @@
-import base64
 import os
+from typing import List
 
 from google.cloud import texttospeech
 from google.api_core import exceptions as gcp_exceptions
 
-from core.domain.tts_model import TTSRequest, TTSResponse
+from core.domain.exceptions import TTSProcessingError
+from core.domain.tts_model import TTSRequest, TTSResponse, Voice
 from core.interfaces.google_tts_client_interface import GoogleTTSClientInterface
 
 
@@ -26,18 +27,24 @@ class GoogleTTSClient(GoogleTTSClientInterface):
                 ),
             )
 
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=request.voice_config.speaking_rate,
-                pitch=request.voice_config.pitch,
-            )
+            audio_config_params = {
+                "audio_encoding": getattr(
+                    texttospeech.AudioEncoding, request.voice_config.audio_encoding
+                ),
+                "speaking_rate": request.voice_config.speaking_rate,
+                "pitch": request.voice_config.pitch,
+            }
+            if request.voice_config.sample_rate_hertz:
+                audio_config_params["sample_rate_hertz"] = (
+                    request.voice_config.sample_rate_hertz
+                )
+            audio_config = texttospeech.AudioConfig(**audio_config_params)
 
             response = self.client.synthesize_speech(
                 input=synthesis_input, voice=voice, audio_config=audio_config
             )
 
-            audio_b64 = base64.b64encode(response.audio_content).decode("utf-8")
-            return TTSResponse(audio_content=audio_b64, success=True)
+            return TTSResponse(audio_content=response.audio_content, success=True)
 
         except (
             gcp_exceptions.GoogleAPICallError,
@@ -45,14 +52,30 @@ class GoogleTTSClient(GoogleTTSClientInterface):
             AttributeError,
         ) as e:
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"TTS synthesis failed: {str(e)}",
             )
         except (OSError, IOError, RuntimeError) as system_error:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"System error during TTS synthesis: {str(system_error)}",
             )
+
+    def list_voices(self) -> List[Voice]:
+        try:
+            response = self.client.list_voices()
+        except (gcp_exceptions.GoogleAPICallError, OSError, RuntimeError) as e:
+            raise TTSProcessingError(f"Listing voices failed: {str(e)}")
+
+        return [
+            Voice(
+                name=voice.name,
+                language_codes=tuple(voice.language_codes),
+                ssml_gender=texttospeech.SsmlVoiceGender(voice.ssml_gender).name,
+                natural_sample_rate_hertz=voice.natural_sample_rate_hertz,
+            )
+            for voice in response.voices
+        ]
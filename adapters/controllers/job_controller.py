@@ -0,0 +1,116 @@
+import uuid
+from typing import Any, Dict, Tuple
+
+from flask import Blueprint, request
+from marshmallow import Schema, fields, validate, ValidationError
+
+from adapters.controllers.stt_controller import STTRequestSchema, build_stt_request
+from adapters.controllers.tts_controller import TTSRequestSchema, build_tts_request
+from adapters.loggers.logger_adapter import app_logger
+from app.api_response import ApiResponse
+from core.domain.job_model import JOB_TYPES, Job, JobStatus
+from core.interfaces.job_controller_interface import JobControllerInterface
+from usecases.get_job_use_case import GetJobUseCase
+from usecases.submit_job_use_case import SubmitJobUseCase
+
+
+class JobRequestSchema(Schema):
+    type = fields.String(required=True, validate=validate.OneOf(JOB_TYPES))
+    payload = fields.Dict(keys=fields.String(), values=fields.Raw(), required=True)
+    priority = fields.Integer(missing=0, validate=validate.Range(min=-100, max=100))
+    maxAttempts = fields.Integer(missing=3, validate=validate.Range(min=1, max=10))
+
+
+def serialize_job(job: Job) -> Dict[str, Any]:
+    job_data = {
+        "jobId": job.job_id,
+        "type": job.job_type,
+        "status": job.status,
+        "priority": job.priority,
+        "attempts": job.attempts,
+        "maxAttempts": job.max_attempts,
+        "createdAt": job.created_at,
+        "updatedAt": job.updated_at,
+        "finishedAt": job.finished_at,
+    }
+    if job.status == JobStatus.SUCCEEDED:
+        job_data["result"] = job.result
+    if job.error_message:
+        job_data["error"] = job.error_message
+    return job_data
+
+
+class JobController(JobControllerInterface):
+    def __init__(
+        self, submit_use_case: SubmitJobUseCase, get_use_case: GetJobUseCase
+    ) -> None:
+        self.submit_use_case = submit_use_case
+        self.get_use_case = get_use_case
+
+    def submit_job(self) -> Tuple[Dict[str, Any], int, Dict[str, str]]:
+        try:
+            validated_data = JobRequestSchema().load(request.get_json() or {})
+            self._validate_payload(validated_data["type"], validated_data["payload"])
+
+            job = self.submit_use_case.execute(
+                Job(
+                    job_id=uuid.uuid4().hex,
+                    job_type=validated_data["type"],
+                    payload=validated_data["payload"],
+                    priority=validated_data["priority"],
+                    max_attempts=validated_data["maxAttempts"],
+                )
+            )
+
+            return (
+                ApiResponse.success(serialize_job(job), "Job accepted"),
+                202,
+                {"Location": f"/api/jobs/{job.job_id}"},
+            )
+
+        except ValidationError as validation_error:
+            app_logger.error("Job validation failed: %s", validation_error.messages)
+            return (
+                ApiResponse.error(
+                    "Validation error", details=validation_error.messages
+                ),
+                400,
+                {},
+            )
+
+        except (ValueError, TypeError) as processing_error:
+            app_logger.error("Job payload rejected: %s", str(processing_error))
+            return ApiResponse.error(str(processing_error)), 400, {}
+
+    def get_job(self, job_id: str) -> Tuple[Dict[str, Any], int]:
+        job = self.get_use_case.execute(job_id)
+        if job is None:
+            return ApiResponse.error("Job not found"), 404
+        return ApiResponse.success(serialize_job(job)), 200
+
+    @staticmethod
+    def _validate_payload(job_type: str, payload: Dict[str, Any]) -> None:
+        try:
+            if job_type == "tts":
+                build_tts_request(TTSRequestSchema().load(payload))
+            else:
+                build_stt_request(STTRequestSchema().load(payload))
+        except ValidationError as validation_error:
+            raise ValidationError({"payload": validation_error.messages})
+
+
+def create_job_blueprint(
+    submit_use_case: SubmitJobUseCase, get_use_case: GetJobUseCase
+) -> Blueprint:
+    blueprint = Blueprint("jobs", __name__, url_prefix="/api/jobs")
+    controller = JobController(submit_use_case, get_use_case)
+
+    @blueprint.route("", methods=["POST"])
+    def submit():
+        return controller.submit_job()
+
+    @blueprint.route("/<job_id>", methods=["GET"])
+    def get(job_id):
+        return controller.get_job(job_id)
+
+    return blueprint
@@ -1,66 +1,132 @@
-from typing import Tuple, Dict, Any
+import base64
+import binascii
+from typing import Tuple, Dict, Any, Optional
 
 from flask import Blueprint, request
 from marshmallow import Schema, fields, ValidationError
 
 from adapters.loggers.logger_adapter import app_logger
 from app.api_response import ApiResponse
-from core.domain.stt_model import STTRequest
+from core.domain.stt_model import STTRequest, STTResponse
 from core.interfaces.stt_controller_interface import STTControllerInterface
 from usecases.transcribe_speech_use_case import TranscribeSpeechUseCase
 
+AUDIO_CONTENT_TYPES = {
+    "audio/wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-wav": "wav",
+    "audio/l16": "wav",
+    "audio/flac": "flac",
+    "audio/x-flac": "flac",
+    "audio/webm": "webm",
+    "audio/ogg": "opus",
+    "audio/opus": "opus",
+    "audio/mpeg": "mp3",
+}
 
-class STTRequestSchema(Schema):
-    audio_data = fields.String(required=True, validate=fields.Length(min=1))
+
+class AudioTooLargeError(ValueError):
+    pass
+
+
+class Base64Audio(fields.Field):
+    def _deserialize(self, value, attr, data, **kwargs) -> bytes:
+        if not isinstance(value, str):
+            raise ValidationError("Audio data must be a base64 string")
+        try:
+            return base64.b64decode(value, validate=True)
+        except (binascii.Error, ValueError):
+            raise ValidationError("Audio data is not valid base64")
+
+
+class STTOptionsSchema(Schema):
     format = fields.String(missing="webm")
     language = fields.String(missing="en-US")
     enable_word_timestamps = fields.Boolean(missing=False)
     sample_rate = fields.Integer(missing=48000)
     enable_automatic_punctuation = fields.Boolean(missing=True)
     model = fields.String(missing="latest_long")
+    long_audio = fields.Boolean(missing=False)
+
+
+class STTRequestSchema(STTOptionsSchema):
+    audio_data = Base64Audio(required=True, validate=fields.Length(min=1))
+
+
+def build_stt_request(
+    validated_data: Dict[str, Any], audio_data: Optional[bytes] = None
+) -> STTRequest:
+    return STTRequest(
+        audio_data=(validated_data["audio_data"] if audio_data is None else audio_data),
+        format=validated_data["format"],
+        language=validated_data["language"],
+        enable_word_timestamps=validated_data["enable_word_timestamps"],
+        sample_rate=validated_data["sample_rate"],
+        enable_automatic_punctuation=validated_data["enable_automatic_punctuation"],
+        model=validated_data["model"],
+        long_audio=validated_data["long_audio"],
+    )
+
+
+def serialize_transcription(response: STTResponse) -> Dict[str, Any]:
+    response_data = {
+        "transcription": response.transcription,
+        "confidence": response.confidence,
+    }
+
+    if response.word_timestamps:
+        response_data["word_timestamps"] = [
+            {
+                "word": wt.word,
+                "start_time": wt.start_time,
+                "end_time": wt.end_time,
+            }
+            for wt in response.word_timestamps
+        ]
+
+    return response_data
+
+
+def read_audio(stream, max_bytes: int, length: Optional[int] = None) -> bytes:
+    """
+    Read an upload of at most ``max_bytes``. With a known ``length`` it is
+    read in one call into a buffer of that size; otherwise chunk by chunk
+    until the limit is exceeded.
+    """
+    if length is not None:
+        if length > max_bytes:
+            raise AudioTooLargeError(f"Audio exceeds {max_bytes} bytes")
+        return stream.read(length)
+
+    chunks, size = [], 0
+    while True:
+        chunk = stream.read(min(64 * 1024, max_bytes + 1 - size))
+        if not chunk:
+            return b"".join(chunks)
+        size += len(chunk)
+        if size > max_bytes:
+            raise AudioTooLargeError(f"Audio exceeds {max_bytes} bytes")
+        chunks.append(chunk)
 
 
 class STTController(STTControllerInterface):
-    def __init__(self, use_case: TranscribeSpeechUseCase) -> None:
+    def __init__(
+        self, use_case: TranscribeSpeechUseCase, max_upload_bytes: int = 64 * 1024**2
+    ) -> None:
         self.use_case = use_case
+        self.max_upload_bytes = max_upload_bytes
 
     def transcribe_speech(self) -> Tuple[Dict[str, Any], int]:
         try:
-            data = request.get_json() or {}
-            validated_data = STTRequestSchema().load(data)
-
-            stt_request = STTRequest(
-                audio_data=validated_data["audio_data"],
-                format=validated_data["format"],
-                language=validated_data["language"],
-                enable_word_timestamps=validated_data["enable_word_timestamps"],
-                sample_rate=validated_data["sample_rate"],
-                enable_automatic_punctuation=validated_data[
-                    "enable_automatic_punctuation"
-                ],
-                model=validated_data["model"],
-            )
+            stt_request = self._parse_request()
 
             response = self.use_case.execute(stt_request)
 
             if response.success:
-                response_data = {
-                    "transcription": response.transcription,
-                    "confidence": response.confidence,
-                }
-
-                if response.word_timestamps:
-                    response_data["word_timestamps"] = [
-                        {
-                            "word": wt.word,
-                            "start_time": wt.start_time,
-                            "end_time": wt.end_time,
-                        }
-                        for wt in response.word_timestamps
-                    ]
-
                 return (
-                    ApiResponse.success(response_data, "Transcription successful"),
+                    ApiResponse.success(
+                        serialize_transcription(response), "Transcription successful"
+                    ),
                     200,
                 )
 
@@ -70,6 +136,10 @@ class STTController(STTControllerInterface):
                 500,
             )
 
+        except AudioTooLargeError as too_large:
+            app_logger.error("STT upload rejected: %s", str(too_large))
+            return ApiResponse.error(str(too_large)), 413
+
         except ValidationError as validation_error:
             app_logger.error("Request validation failed: %s", validation_error.messages)
             return (
@@ -89,10 +159,44 @@ class STTController(STTControllerInterface):
             )
             return ApiResponse.error("Request processing failed"), 400
 
-
-def create_stt_blueprint(use_case: TranscribeSpeechUseCase) -> Blueprint:
+    def _parse_request(self) -> STTRequest:
+        """
+        Build the request from a JSON body with base64 audio, a multipart
+        form with an ``audio`` file, or a raw ``audio/*`` body whose options
+        come from the query string.
+        """
+        length = request.content_length
+        if length is not None and length > self.max_upload_bytes:
+            raise AudioTooLargeError(f"Audio exceeds {self.max_upload_bytes} bytes")
+
+        mimetype = request.mimetype
+        if mimetype == "multipart/form-data":
+            upload = request.files.get("audio")
+            if upload is None:
+                raise ValidationError({"audio": ["Missing audio file."]})
+            options = self._load_options(request.form.to_dict(), upload.mimetype)
+            audio = read_audio(upload.stream, self.max_upload_bytes)
+            return build_stt_request(options, audio)
+
+        if mimetype.startswith("audio/"):
+            options = self._load_options(request.args.to_dict(), mimetype)
+            audio = read_audio(request.stream, self.max_upload_bytes, length)
+            return build_stt_request(options, audio)
+
+        return build_stt_request(STTRequestSchema().load(request.get_json() or {}))
+
+    @staticmethod
+    def _load_options(data: Dict[str, Any], mimetype: str) -> Dict[str, Any]:
+        if "format" not in data and mimetype in AUDIO_CONTENT_TYPES:
+            data["format"] = AUDIO_CONTENT_TYPES[mimetype]
+        return STTOptionsSchema().load(data)
+
+
+def create_stt_blueprint(
+    use_case: TranscribeSpeechUseCase, max_upload_bytes: int = 64 * 1024**2
+) -> Blueprint:
     blueprint = Blueprint("stt", __name__, url_prefix="/api/stt")
-    controller = STTController(use_case)
+    controller = STTController(use_case, max_upload_bytes)
 
     @blueprint.route("", methods=["POST"])
     def transcribe():
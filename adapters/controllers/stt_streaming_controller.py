@@ -1,18 +1,30 @@
-import threading
-from typing import Dict, Any
+from concurrent.futures import CancelledError, Future
+from typing import Callable, Dict, Any, Optional, Set
 
 from flask import request, Blueprint
 from flask_socketio import SocketIO, emit
-from marshmallow import Schema, fields, ValidationError
+from marshmallow import Schema, fields, validate, ValidationError
 
 from adapters.loggers.logger_adapter import app_logger
+from adapters.sessions.stt_session_reaper import STTSessionReaper
+from core.domain.exceptions import STTSessionLimitError
 from core.interfaces.stt_controller_interface import STTControllerInterface
 from usecases.stt_streaming_use_case import STTStreamingUseCase
 
+ENDLESS_ENCODINGS = ("LINEAR16", "FLAC")
+
+STOP_MESSAGES = {
+    "client_stop": "Streaming stopped",
+    "idle_timeout": "Streaming stopped: no audio received for too long",
+    "max_duration": "Streaming stopped: maximum stream duration reached",
+    "no_audio": "Streaming stopped: no audio received after configuration",
+}
+
 
 class STTStreamingConfigSchema(Schema):
     encoding = fields.String(missing="WEBM_OPUS")
     sampleRateHertz = fields.Integer(missing=48000)
+    audioChannelCount = fields.Integer(missing=1, validate=validate.Range(min=1, max=8))
     languageCode = fields.String(missing="en-US")
     interimResults = fields.Boolean(missing=True)
     singleUtterance = fields.Boolean(missing=False)
@@ -20,13 +32,24 @@ class STTStreamingConfigSchema(Schema):
     maxAlternatives = fields.Integer(missing=1)
     enableAutomaticPunctuation = fields.Boolean(missing=True)
     model = fields.String(missing="latest_long")
+    endless = fields.Boolean(missing=False)
+    interimMaxRate = fields.Float(missing=None, validate=validate.Range(min=0))
+    interimMinChange = fields.Integer(missing=None, validate=validate.Range(min=0))
+    interimDelta = fields.Boolean(missing=None)
+    vad = fields.Boolean(missing=None)
 
 
 class STTStreamingController(STTControllerInterface):
-    def __init__(self, socketio: SocketIO, use_case: STTStreamingUseCase) -> None:
+    def __init__(
+        self,
+        socketio: SocketIO,
+        use_case: STTStreamingUseCase,
+        allow_json_audio: bool = True,
+    ) -> None:
         self.socketio = socketio
         self.use_case = use_case
-        self.active_sessions: Dict[str, Dict[str, Any]] = {}
+        self.allow_json_audio = allow_json_audio
+        self._json_audio_clients: Set[str] = set()
         self.schema = STTStreamingConfigSchema()
         self.logger = app_logger
         self._register_handlers()
@@ -36,22 +59,28 @@ class STTStreamingController(STTControllerInterface):
         @self.socketio.on("connect", namespace="/api/stt/stream")
         def handle_connect(auth=None):
             client_id = self._get_client_id()
-            self.logger.info("STT streaming client connected: %s", client_id)
 
-            self.active_sessions[client_id] = {"configured": False, "streaming": False}
+            try:
+                self.use_case.open_session(client_id)
+            except STTSessionLimitError as e:
+                self.logger.error(
+                    "STT streaming client %s rejected: %s", client_id, e.message
+                )
+                raise ConnectionRefusedError(e.message)
 
+            self.logger.info("STT streaming client connected: %s", client_id)
             emit("connected", {"status": "connected", "message": "Ready for streaming"})
 
         @self.socketio.on("disconnect", namespace="/api/stt/stream")
         def handle_disconnect():
             try:
                 client_id = self._get_client_id()
+                self._json_audio_clients.discard(client_id)
 
-                if client_id in self.active_sessions:
+                if self.use_case.get_session(client_id) is not None:
 
-                    self.use_case.stop_streaming()
+                    self.use_case.close_session(client_id)
 
-                    del self.active_sessions[client_id]
                     self.logger.info(
                         f"Client {client_id} disconnected and session cleaned up"
                     )
@@ -63,25 +92,41 @@ class STTStreamingController(STTControllerInterface):
             except Exception as e:
                 self.logger.error(f"Error handling disconnect: {str(e)}")
 
-                try:
-                    client_id = self._get_client_id()
-                    if client_id in self.active_sessions:
-                        del self.active_sessions[client_id]
-                except Exception:
-                    pass
-
         @self.socketio.on("config", namespace="/api/stt/stream")
         def handle_config(data):
+            configure(data, endless=False)
+
+        @self.socketio.on("stt_endless_streaming", namespace="/api/stt/stream")
+        def handle_endless_streaming(data):
+            configure(data, endless=True)
+
+        def configure(data, endless: bool) -> None:
             client_id = self._get_client_id()
 
             try:
 
                 config_data = self.schema.load(data.get("config", {}))
+                config_data["endless"] = config_data["endless"] or endless
+                if (
+                    config_data["endless"]
+                    and config_data["encoding"].upper() not in ENDLESS_ENCODINGS
+                ):
+                    raise ValidationError(
+                        {"encoding": ["Endless streaming requires LINEAR16 or FLAC."]}
+                    )
 
-                self.use_case.execute(config_data)
+                def backpressure_callback(paused: bool) -> None:
+                    self.socketio.emit(
+                        "pause" if paused else "resume",
+                        {"status": "paused" if paused else "resumed"},
+                        room=client_id,
+                        namespace="/api/stt/stream",
+                    )
 
-                if client_id in self.active_sessions:
-                    self.active_sessions[client_id]["configured"] = True
+                session = self.use_case.execute(
+                    client_id, config_data, backpressure_callback
+                )
+                if session is not None:
 
                     def result_callback(result: Dict[str, Any]) -> None:
                         try:
@@ -98,18 +143,24 @@ class STTStreamingController(STTControllerInterface):
                                 f"Error sending result to client {client_id}: {str(e)}"
                             )
 
-                    threading.Thread(
-                        target=self._start_streaming_thread,
-                        args=(client_id, result_callback),
-                        daemon=True,
-                    ).start()
+                    task = self.use_case.launch_streaming(client_id, result_callback)
+                    if task is not None:
+                        task.add_done_callback(
+                            lambda done: self._on_streaming_done(
+                                done, client_id, result_callback
+                            )
+                        )
 
                     self.logger.info(
                         f"Client {client_id} configured and streaming started"
                     )
                     emit(
                         "configured",
-                        {"status": "success", "message": "Streaming configured"},
+                        {
+                            "status": "success",
+                            "message": "Streaming configured",
+                            "endless": config_data["endless"],
+                        },
                     )
 
             except ValidationError as e:
@@ -131,44 +182,35 @@ class STTStreamingController(STTControllerInterface):
             client_id = self._get_client_id()
 
             try:
-                if client_id not in self.active_sessions:
+                session = self.use_case.get_session(client_id)
+                if session is None:
                     emit(
                         "error",
                         {"status": "error", "message": "No active session found"},
                     )
                     return
 
-                if not self.active_sessions[client_id].get("configured"):
+                if not session.configured:
                     emit(
                         "error",
                         {"status": "error", "message": "Session not configured"},
                     )
                     return
 
-                audio_data = data.get("data")
-                if not audio_data:
-                    emit(
-                        "error",
-                        {"status": "error", "message": "No audio data received"},
-                    )
+                try:
+                    audio_bytes = self._audio_bytes(client_id, data)
+                except ValueError as e:
+                    emit("error", {"status": "error", "message": str(e)})
                     return
 
-                try:
-                    if isinstance(audio_data, list):
-                        audio_bytes = bytes(audio_data)
-                    else:
-                        audio_bytes = audio_data
-                except Exception as e:
+                if not audio_bytes:
                     emit(
                         "error",
-                        {
-                            "status": "error",
-                            "message": f"Invalid audio data format: {str(e)}",
-                        },
+                        {"status": "error", "message": "No audio data received"},
                     )
                     return
 
-                self.use_case.add_audio_data(audio_bytes)
+                self.use_case.add_audio_data(client_id, audio_bytes)
 
             except Exception as e:
                 self.logger.error(f"Audio processing error: {str(e)}")
@@ -178,78 +220,103 @@ class STTStreamingController(STTControllerInterface):
         def handle_stop():
             client_id = self._get_client_id()
 
-            if client_id in self.active_sessions:
-                self.use_case.stop_streaming()
-                self.active_sessions[client_id]["streaming"] = False
+            if self.use_case.get_session(client_id) is not None:
+                self.use_case.stop_streaming(client_id)
                 self.logger.info(f"Streaming stopped for client {client_id}")
-                emit("stopped", {"status": "stopped", "message": "Streaming stopped"})
+                emit("stopped", self._stopped_payload("client_stop"))
+
+    def notify_stopped(self, client_id: str, reason: str) -> None:
+        self.socketio.emit(
+            "stopped",
+            self._stopped_payload(reason),
+            room=client_id,
+            namespace="/api/stt/stream",
+        )
+
+    @staticmethod
+    def _stopped_payload(reason: str) -> Dict[str, str]:
+        return {
+            "status": "stopped",
+            "reason": reason,
+            "message": STOP_MESSAGES.get(reason, "Streaming stopped"),
+        }
 
     def transcribe_speech(self):
         return {"error": "Use streaming endpoint instead"}, 400
 
+    def _audio_bytes(self, client_id: str, data: Any) -> bytes:
+        audio_data = data.get("data") if isinstance(data, dict) else data
+
+        if isinstance(audio_data, bytes):
+            return audio_data
+        if isinstance(audio_data, (bytearray, memoryview)):
+            return bytes(audio_data)
+
+        if isinstance(audio_data, list):
+            if not self.allow_json_audio:
+                raise ValueError(
+                    "JSON audio is no longer accepted, send a binary attachment"
+                )
+            if client_id not in self._json_audio_clients:
+                self._json_audio_clients.add(client_id)
+                self.logger.info(
+                    f"Client {client_id} sends deprecated JSON audio lists"
+                )
+            try:
+                return bytes(audio_data)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid audio data format: {str(e)}")
+
+        if not audio_data:
+            return b""
+        raise ValueError("Audio must be sent as a binary attachment")
+
     def _get_client_id(self) -> str:
         try:
             return request.sid
         except Exception:
             return "unknown"
 
-    def _start_streaming_thread(self, client_id: str, callback) -> None:
+    def _on_streaming_done(
+        self,
+        task: Future,
+        client_id: str,
+        callback: Callable[[Dict[str, Any]], None],
+    ) -> None:
         try:
-            if client_id in self.active_sessions:
-                self.active_sessions[client_id]["streaming"] = True
-
-                import asyncio
-
-                try:
-
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                except RuntimeError:
-
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                try:
-
-                    loop.run_until_complete(self.use_case.start_streaming(callback))
-                except Exception as e:
-                    self.logger.error(f"Error in streaming loop: {str(e)}")
-
-                    callback({"type": "error", "message": f"Streaming error: {str(e)}"})
-                finally:
-
-                    if client_id in self.active_sessions:
-                        self.active_sessions[client_id]["streaming"] = False
-                    try:
-                        loop.close()
-                    except:
-                        pass
-
+            task.result()
+        except CancelledError:
+            pass
         except Exception as e:
-            self.logger.error(f"Streaming thread error: {str(e)}")
-            if client_id in self.active_sessions:
-                self.active_sessions[client_id]["streaming"] = False
+            self.logger.error(f"Error in streaming loop: {str(e)}")
 
-            callback(
-                {"type": "error", "message": f"Failed to start streaming: {str(e)}"}
+            self.use_case.dispatch(
+                client_id,
+                callback,
+                {"type": "error", "message": f"Streaming error: {str(e)}"},
             )
 
 
 def register_routes(
-    socketio: SocketIO, use_case: STTStreamingUseCase
+    socketio: SocketIO,
+    use_case: STTStreamingUseCase,
+    allow_json_audio: bool = True,
+    session_reaper: Optional[STTSessionReaper] = None,
 ) -> STTStreamingController:
-    controller = STTStreamingController(socketio, use_case)
+    controller = STTStreamingController(socketio, use_case, allow_json_audio)
+    if session_reaper is not None:
+        session_reaper.on_expired = controller.notify_stopped
     return controller
 
 
 def create_stt_streaming_blueprint(
-    socketio: SocketIO, use_case: STTStreamingUseCase
+    socketio: SocketIO,
+    use_case: STTStreamingUseCase,
+    allow_json_audio: bool = True,
+    session_reaper: Optional[STTSessionReaper] = None,
 ) -> Blueprint:
     blueprint = Blueprint("stt_streaming", __name__)
 
-    STTStreamingController(socketio, use_case)
+    register_routes(socketio, use_case, allow_json_audio, session_reaper)
 
     return blueprint
@@ -1,47 +1,138 @@
-from typing import Tuple, Dict, Any
+import base64
+import json
+from typing import Tuple, Dict, Any, Iterable, Iterator, List, Optional, Union
 
-from flask import Blueprint, request, request
-from marshmallow import Schema, fields, ValidationError
+from flask import Blueprint, Response, request, request
+from marshmallow import Schema, fields, validate, ValidationError
 from flask import make_response
 from adapters.loggers.logger_adapter import app_logger
 from app.api_response import ApiResponse
-from core.domain.tts_model import TTSRequest, VoiceConfig
+from core.domain.exceptions import TTSException, TTSValidationError
+from core.domain.tts_model import (
+    AUDIO_ENCODING_MIMETYPES,
+    MAX_TEXT_LENGTH,
+    SSML_GENDERS,
+    AudioBytes,
+    TTSRequest,
+    TTSResponse,
+    Voice,
+    VoiceConfig,
+)
 from core.interfaces.tts_controller_interface import TTSControllerInterface
+from usecases.batch_synthesize_speech_use_case import BatchSynthesizeSpeechUseCase
+from usecases.list_voices_use_case import ListVoicesUseCase
+from usecases.stream_speech_use_case import StreamSpeechUseCase
 from usecases.synthesize_speech_use_case import SynthesizeSpeechUseCase
 
 
 class TTSRequestSchema(Schema):
-    text = fields.String(required=True, validate=fields.Length(min=1, max=5000))
+    text = fields.String(
+        required=True, validate=fields.Length(min=1, max=MAX_TEXT_LENGTH)
+    )
     voiceConfig = fields.Dict(keys=fields.String(), values=fields.Raw(), missing={})
 
 
+class TTSBatchRequestSchema(Schema):
+    items = fields.List(
+        fields.Dict(keys=fields.String(), values=fields.Raw()),
+        required=True,
+        validate=fields.Length(min=1),
+    )
+
+
+class VoiceQuerySchema(Schema):
+    languageCode = fields.String(missing=None)
+    ssmlGender = fields.String(missing=None, validate=validate.OneOf(SSML_GENDERS))
+
+
+JSON_MIMETYPE = "application/json"
+NDJSON_MIMETYPE = "application/x-ndjson"
+DEFAULT_ENCODING_BY_MIMETYPE = {
+    "audio/mpeg": "MP3",
+    "audio/ogg": "OGG_OPUS",
+    "audio/wav": "LINEAR16",
+}
+VOICES_CACHE_CONTROL = "public, max-age=300"
+
+
+def build_tts_request(
+    validated_data: Dict[str, Any], audio_encoding: Optional[str] = None
+) -> TTSRequest:
+    voice_config_data = validated_data["voiceConfig"]
+    voice_config = VoiceConfig(
+        language_code=voice_config_data.get("languageCode", "en-US"),
+        name=voice_config_data.get("name", "en-US-Wavenet-D"),
+        ssml_gender=voice_config_data.get("ssmlGender", "NEUTRAL"),
+        speaking_rate=voice_config_data.get("speakingRate", 1.0),
+        pitch=voice_config_data.get("pitch", 0.0),
+        audio_encoding=audio_encoding or voice_config_data.get("audioEncoding", "MP3"),
+        sample_rate_hertz=voice_config_data.get("sampleRateHertz"),
+    )
+
+    return TTSRequest(text=validated_data["text"], voice_config=voice_config)
+
+
+def serialize_synthesis(
+    tts_request: TTSRequest, response: TTSResponse
+) -> Dict[str, Any]:
+    return {
+        "audioContent": base64.b64encode(response.audio_content).decode("ascii"),
+        "audioEncoding": tts_request.voice_config.audio_encoding,
+    }
+
+
+def serialize_voice(voice: Voice) -> Dict[str, Any]:
+    return {
+        "name": voice.name,
+        "languageCodes": list(voice.language_codes),
+        "ssmlGender": voice.ssml_gender,
+        "naturalSampleRateHertz": voice.natural_sample_rate_hertz,
+    }
+
+
 class TTSController(TTSControllerInterface):
-    def __init__(self, use_case: SynthesizeSpeechUseCase) -> None:
+    def __init__(
+        self,
+        use_case: SynthesizeSpeechUseCase,
+        stream_use_case: StreamSpeechUseCase,
+        batch_use_case: BatchSynthesizeSpeechUseCase,
+        voices_use_case: ListVoicesUseCase,
+        max_batch_items: int = 1000,
+    ) -> None:
         self.use_case = use_case
+        self.stream_use_case = stream_use_case
+        self.batch_use_case = batch_use_case
+        self.voices_use_case = voices_use_case
+        self.max_batch_items = max_batch_items
 
-    def synthesize_speech(self) -> Tuple[Dict[str, Any], int]:
+    def synthesize_speech(self) -> Union[Response, Tuple[Dict[str, Any], int]]:
         try:
-            data = request.get_json() or {}
-            validated_data = TTSRequestSchema().load(data)
-
-            voice_config_data = validated_data["voiceConfig"]
-            voice_config = VoiceConfig(
-                language_code=voice_config_data.get("languageCode", "en-US"),
-                name=voice_config_data.get("name", "en-US-Wavenet-D"),
-                ssml_gender=voice_config_data.get("ssmlGender", "NEUTRAL"),
-                speaking_rate=voice_config_data.get("speakingRate", 1.0),
-                pitch=voice_config_data.get("pitch", 0.0),
-            )
+            validated_data = TTSRequestSchema().load(request.get_json() or {})
+            requested_encoding = validated_data["voiceConfig"].get("audioEncoding")
+
+            offers = self._audio_offers(requested_encoding)
+            mimetype = self._negotiate_mimetype(offers)
+            if mimetype is None:
+                return (
+                    ApiResponse.error(
+                        "Not acceptable",
+                        details={"supported": [JSON_MIMETYPE, *offers]},
+                    ),
+                    406,
+                )
 
-            tts_request = TTSRequest(
-                text=validated_data["text"], voice_config=voice_config
+            tts_request = build_tts_request(
+                validated_data, offers.get(mimetype, requested_encoding)
             )
 
             response = self.use_case.execute(tts_request)
 
+            if response.success and mimetype != JSON_MIMETYPE:
+                return self._audio_response(response.audio_content, mimetype)
+
             if response.success:
                 return (
-                    ApiResponse.success({"audioContent": response.audio_content}),
+                    ApiResponse.success(serialize_synthesis(tts_request, response)),
                     200,
                 )
 
@@ -70,10 +161,218 @@ class TTSController(TTSControllerInterface):
             )
             return ApiResponse.error("Request processing failed"), 400
 
+    def stream_speech(self) -> Union[Response, Tuple[Dict[str, Any], int]]:
+        try:
+            validated_data = TTSRequestSchema().load(request.get_json() or {})
+            tts_request = build_tts_request(validated_data)
+            audio_chunks = self.stream_use_case.execute(tts_request)
 
-def create_tts_blueprint(use_case: SynthesizeSpeechUseCase) -> Blueprint:
+        except ValidationError as validation_error:
+            app_logger.error("Request validation failed: %s", validation_error.messages)
+            return (
+                ApiResponse.error(
+                    "Validation error", details=validation_error.messages
+                ),
+                400,
+            )
+
+        except TTSValidationError as validation_error:
+            app_logger.error("TTS validation failed: %s", validation_error.message)
+            return ApiResponse.error(validation_error.message), 400
+
+        except (ValueError, TypeError) as processing_error:
+            app_logger.error(
+                "Processing error: %s", str(processing_error), exc_info=True
+            )
+            return ApiResponse.error("Request processing failed"), 400
+
+        return Response(
+            self._guard_stream(audio_chunks),
+            mimetype=tts_request.mimetype,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    def synthesize_batch(self) -> Union[Response, Tuple[Dict[str, Any], int]]:
+        try:
+            validated_data = TTSBatchRequestSchema().load(request.get_json() or {})
+            items = validated_data["items"]
+            if len(items) > self.max_batch_items:
+                return (
+                    ApiResponse.error(
+                        f"Batch exceeds maximum of {self.max_batch_items} items"
+                    ),
+                    400,
+                )
+
+            item_errors, indexed_requests = self._build_batch(items)
+            completions = self.batch_use_case.execute(
+                [tts_request for _, tts_request in indexed_requests]
+            )
+            results = self._batch_results(item_errors, indexed_requests, completions)
+
+            if self._negotiate_mimetype([NDJSON_MIMETYPE]) == NDJSON_MIMETYPE:
+                return Response(
+                    self._ndjson_lines(results),
+                    mimetype=NDJSON_MIMETYPE,
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                )
+
+            ordered = sorted(results, key=lambda result: result["index"])
+            failed = sum(1 for result in ordered if not result["success"])
+            return (
+                ApiResponse.success(
+                    {
+                        "results": ordered,
+                        "succeeded": len(ordered) - failed,
+                        "failed": failed,
+                    },
+                    "Batch synthesis completed",
+                ),
+                200,
+            )
+
+        except ValidationError as validation_error:
+            app_logger.error("Request validation failed: %s", validation_error.messages)
+            return (
+                ApiResponse.error(
+                    "Validation error", details=validation_error.messages
+                ),
+                400,
+            )
+
+        except RuntimeError as runtime_error:
+            app_logger.error("Runtime error: %s", str(runtime_error), exc_info=True)
+            return ApiResponse.error("Internal server error"), 500
+
+    def list_voices(self) -> Tuple[Dict[str, Any], int, Dict[str, str]]:
+        try:
+            validated_data = VoiceQuerySchema().load(request.args)
+        except ValidationError as validation_error:
+            app_logger.error(
+                "Voice query validation failed: %s", validation_error.messages
+            )
+            return (
+                ApiResponse.error(
+                    "Validation error", details=validation_error.messages
+                ),
+                400,
+                {},
+            )
+
+        voices = self.voices_use_case.execute(
+            {
+                "language_code": validated_data["languageCode"],
+                "ssml_gender": validated_data["ssmlGender"],
+            }
+        )
+        if voices is None:
+            return ApiResponse.error("Voice catalog is not loaded yet"), 503, {}
+
+        return (
+            ApiResponse.success(
+                {
+                    "voices": [serialize_voice(voice) for voice in voices],
+                    "count": len(voices),
+                }
+            ),
+            200,
+            {"Cache-Control": VOICES_CACHE_CONTROL},
+        )
+
+    def _build_batch(
+        self, items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[int, TTSRequest]]]:
+        item_errors = []
+        indexed_requests = []
+        for index, item in enumerate(items):
+            try:
+                validated_item = TTSRequestSchema().load(item)
+                indexed_requests.append((index, build_tts_request(validated_item)))
+            except ValidationError as validation_error:
+                item_errors.append(
+                    {
+                        "index": index,
+                        "success": False,
+                        "error": "Validation error",
+                        "details": validation_error.messages,
+                    }
+                )
+            except (ValueError, TypeError) as item_error:
+                item_errors.append(
+                    {"index": index, "success": False, "error": str(item_error)}
+                )
+        return item_errors, indexed_requests
+
+    @staticmethod
+    def _batch_results(
+        item_errors: List[Dict[str, Any]],
+        indexed_requests: List[Tuple[int, TTSRequest]],
+        completions: Iterator[Tuple[int, TTSResponse]],
+    ) -> Iterator[Dict[str, Any]]:
+        yield from item_errors
+        for position, response in completions:
+            index, tts_request = indexed_requests[position]
+            if not response.success:
+                yield {
+                    "index": index,
+                    "success": False,
+                    "error": response.error_message,
+                }
+                continue
+            yield {
+                "index": index,
+                "success": True,
+                **serialize_synthesis(tts_request, response),
+            }
+
+    @staticmethod
+    def _ndjson_lines(results: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+        try:
+            for result in results:
+                yield json.dumps(result).encode("utf-8") + b"\n"
+        except (TTSException, OSError, RuntimeError) as stream_error:
+            app_logger.error("TTS batch stream aborted: %s", str(stream_error))
+
+    @staticmethod
+    def _audio_offers(requested_encoding: Optional[str]) -> Dict[str, str]:
+        if not requested_encoding:
+            return DEFAULT_ENCODING_BY_MIMETYPE
+        encoding = str(requested_encoding).upper()
+        mimetype = AUDIO_ENCODING_MIMETYPES.get(encoding, "audio/mpeg")
+        return {mimetype: encoding}
+
+    @staticmethod
+    def _negotiate_mimetype(offers: Iterable[str]) -> Optional[str]:
+        accept = request.accept_mimetypes
+        if not accept:
+            return JSON_MIMETYPE
+        return accept.best_match([JSON_MIMETYPE, *offers])
+
+    @staticmethod
+    def _audio_response(audio: AudioBytes, mimetype: str) -> Response:
+        if not isinstance(audio, bytes):
+            audio = bytes(audio)
+        return Response(audio, mimetype=mimetype, headers={"Vary": "Accept"})
+
+    @staticmethod
+    def _guard_stream(audio_chunks: Iterator[bytes]) -> Iterator[bytes]:
+        try:
+            yield from audio_chunks
+        except (TTSException, OSError, RuntimeError) as stream_error:
+            app_logger.error("TTS stream aborted: %s", str(stream_error))
+
+
+def create_tts_blueprint(
+    use_case: SynthesizeSpeechUseCase,
+    stream_use_case: StreamSpeechUseCase,
+    batch_use_case: BatchSynthesizeSpeechUseCase,
+    voices_use_case: ListVoicesUseCase,
+    max_batch_items: int = 1000,
+) -> Blueprint:
     blueprint = Blueprint("tts", __name__, url_prefix="/api/tts")
-    controller = TTSController(use_case)
+    controller = TTSController(
+        use_case, stream_use_case, batch_use_case, voices_use_case, max_batch_items
+    )
 
     @blueprint.route("", methods=["POST", "OPTIONS"])
     def synthesize():
@@ -91,4 +390,16 @@ def create_tts_blueprint(use_case: SynthesizeSpeechUseCase) -> Blueprint:
 
         return controller.synthesize_speech()
 
+    @blueprint.route("/stream", methods=["POST"])
+    def stream():
+        return controller.stream_speech()
+
+    @blueprint.route("/batch", methods=["POST"])
+    def batch():
+        return controller.synthesize_batch()
+
+    @blueprint.route("/voices", methods=["GET"])
+    def voices():
+        return controller.list_voices()
+
     return blueprint
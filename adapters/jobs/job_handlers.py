@@ -0,0 +1,48 @@
+from typing import Any, Dict
+
+from marshmallow import ValidationError
+
+from adapters.controllers.stt_controller import (
+    STTRequestSchema,
+    build_stt_request,
+    serialize_transcription,
+)
+from adapters.controllers.tts_controller import (
+    TTSRequestSchema,
+    build_tts_request,
+    serialize_synthesis,
+)
+from adapters.jobs.job_worker_pool import JobHandler
+from core.domain.exceptions import JobExecutionError
+from usecases.synthesize_speech_use_case import SynthesizeSpeechUseCase
+from usecases.transcribe_speech_use_case import TranscribeSpeechUseCase
+
+
+def create_job_handlers(
+    tts_use_case: SynthesizeSpeechUseCase, stt_use_case: TranscribeSpeechUseCase
+) -> Dict[str, JobHandler]:
+    def run_tts(payload: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            tts_request = build_tts_request(TTSRequestSchema().load(payload))
+        except (ValidationError, ValueError, TypeError) as e:
+            raise JobExecutionError(f"Invalid TTS payload: {e}", retryable=False)
+
+        response = tts_use_case.execute(tts_request)
+        if not response.success:
+            raise JobExecutionError(response.error_message or "TTS synthesis failed")
+        return serialize_synthesis(tts_request, response)
+
+    def run_stt(payload: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            stt_request = build_stt_request(STTRequestSchema().load(payload))
+        except (ValidationError, ValueError, TypeError) as e:
+            raise JobExecutionError(f"Invalid STT payload: {e}", retryable=False)
+
+        response = stt_use_case.execute(stt_request)
+        if not response.success:
+            raise JobExecutionError(
+                response.error_message or "STT transcription failed"
+            )
+        return serialize_transcription(response)
+
+    return {"tts": run_tts, "stt": run_stt}
@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from adapters.loggers.logger_adapter import app_logger
+from core.domain.exceptions import JobExecutionError
+from core.domain.job_model import Job
+from core.interfaces.job_store_interface import JobStoreInterface
+
+JobHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class JobWorkerPool:
+    """
+    Fixed pool of threads that drain a job store.
+
+    Failed jobs are retried with exponential backoff until they run out of
+    attempts. A maintenance thread requeues jobs whose worker lease expired
+    (e.g. the process died mid-job) and purges finished jobs once their
+    results are older than the result TTL.
+    """
+
+    def __init__(
+        self,
+        store: JobStoreInterface,
+        handlers: Dict[str, JobHandler],
+        workers: int = 2,
+        poll_interval: float = 0.5,
+        lease_seconds: float = 600.0,
+        retry_backoff: float = 5.0,
+        result_ttl: float = 3600.0,
+        maintenance_interval: float = 60.0,
+    ) -> None:
+        self.store = store
+        self.handlers = handlers
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retry_backoff = retry_backoff
+        self.result_ttl = result_ttl
+        self.maintenance_interval = maintenance_interval
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for index in range(self.workers):
+            self._threads.append(
+                threading.Thread(
+                    target=self._work, name=f"job-worker-{index}", daemon=True
+                )
+            )
+        self._threads.append(
+            threading.Thread(target=self._maintain, name="job-maintenance", daemon=True)
+        )
+        for thread in self._threads:
+            thread.start()
+        app_logger.info("Job worker pool started with %d workers", self.workers)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _work(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                job = self.store.claim_next(self.lease_seconds)
+            except Exception as e:
+                app_logger.error("Failed to claim job: %s", str(e))
+                job = None
+
+            if job is None:
+                self._stop_event.wait(self.poll_interval)
+                continue
+
+            self._run(job)
+
+    def _run(self, job: Job) -> None:
+        handler = self.handlers.get(job.job_type)
+        try:
+            if handler is None:
+                raise JobExecutionError(
+                    f"No handler for job type: {job.job_type}", retryable=False
+                )
+            result = handler(job.payload)
+        except JobExecutionError as e:
+            self._fail(job, e.message, e.retryable)
+        except Exception as e:
+            self._fail(job, str(e), True)
+        else:
+            self.store.complete(job.job_id, result)
+            app_logger.info("Job %s succeeded", job.job_id)
+
+    def _fail(self, job: Job, error_message: str, retryable: bool) -> None:
+        retry_at = None
+        if retryable and job.attempts < job.max_attempts:
+            retry_at = time.time() + self.retry_backoff * 2 ** (job.attempts - 1)
+
+        self.store.fail(job.job_id, error_message, retry_at)
+        app_logger.error(
+            "Job %s failed (attempt %d/%d, %s): %s",
+            job.job_id,
+            job.attempts,
+            job.max_attempts,
+            "retrying" if retry_at is not None else "giving up",
+            error_message,
+        )
+
+    def _maintain(self) -> None:
+        while not self._stop_event.wait(self.maintenance_interval):
+            try:
+                requeued = self.store.requeue_expired_leases()
+                purged = self.store.purge_finished(time.time() - self.result_ttl)
+                if requeued or purged:
+                    app_logger.info(
+                        "Job maintenance requeued %d and purged %d jobs",
+                        requeued,
+                        purged,
+                    )
+            except Exception as e:
+                app_logger.error("Job maintenance failed: %s", str(e))
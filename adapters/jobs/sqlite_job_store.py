@@ -0,0 +1,180 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from core.domain.job_model import Job, JobStatus
+from core.interfaces.job_store_interface import JobStoreInterface
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    result TEXT,
+    error_message TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    run_after REAL NOT NULL,
+    lease_expires_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready
+    ON jobs (status, priority DESC, run_after, created_at);
+CREATE INDEX IF NOT EXISTS jobs_finished
+    ON jobs (finished_at) WHERE finished_at IS NOT NULL;
+"""
+
+
+class SQLiteJobStore(JobStoreInterface):
+    """
+    Durable job queue in a local SQLite database.
+
+    Each thread gets its own connection in WAL mode, and jobs are claimed
+    inside ``BEGIN IMMEDIATE`` transactions, so several worker threads and
+    processes can share one database file without double-claiming a job.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+
+    def enqueue(self, job: Job) -> Job:
+        now = time.time()
+        job.created_at = job.updated_at = now
+        job.run_after = job.run_after or now
+        self._connection().execute(
+            "INSERT INTO jobs (id, type, payload, status, priority, attempts,"
+            " max_attempts, created_at, updated_at, run_after)"
+            " VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?, ?)",
+            (
+                job.job_id,
+                job.job_type,
+                json.dumps(job.payload),
+                JobStatus.QUEUED,
+                job.priority,
+                job.max_attempts,
+                job.created_at,
+                job.updated_at,
+                job.run_after,
+            ),
+        )
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = (
+            self._connection()
+            .execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            .fetchone()
+        )
+        return self._to_job(row) if row else None
+
+    def claim_next(self, lease_seconds: float) -> Optional[Job]:
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE status = ? AND run_after <= ?"
+                " ORDER BY priority DESC, run_after, created_at LIMIT 1",
+                (JobStatus.QUEUED, now),
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+
+            connection.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1,"
+                " lease_expires_at = ?, updated_at = ? WHERE id = ?",
+                (JobStatus.RUNNING, now + lease_seconds, now, row["id"]),
+            )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+
+        job = self._to_job(row)
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        return job
+
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        now = time.time()
+        self._connection().execute(
+            "UPDATE jobs SET status = ?, result = ?, error_message = NULL,"
+            " lease_expires_at = NULL, updated_at = ?, finished_at = ? WHERE id = ?",
+            (JobStatus.SUCCEEDED, json.dumps(result), now, now, job_id),
+        )
+
+    def fail(self, job_id: str, error_message: str, retry_at: Optional[float]) -> None:
+        now = time.time()
+        if retry_at is not None:
+            self._connection().execute(
+                "UPDATE jobs SET status = ?, error_message = ?, run_after = ?,"
+                " lease_expires_at = NULL, updated_at = ? WHERE id = ?",
+                (JobStatus.QUEUED, error_message, retry_at, now, job_id),
+            )
+            return
+
+        self._connection().execute(
+            "UPDATE jobs SET status = ?, error_message = ?, lease_expires_at = NULL,"
+            " updated_at = ?, finished_at = ? WHERE id = ?",
+            (JobStatus.FAILED, error_message, now, now, job_id),
+        )
+
+    def requeue_expired_leases(self) -> int:
+        now = time.time()
+        cursor = self._connection().execute(
+            "UPDATE jobs SET status = CASE WHEN attempts < max_attempts"
+            " THEN ? ELSE ? END,"
+            " error_message = COALESCE(error_message, 'Worker lease expired'),"
+            " finished_at = CASE WHEN attempts < max_attempts THEN NULL ELSE ? END,"
+            " lease_expires_at = NULL, updated_at = ?"
+            " WHERE status = ? AND lease_expires_at < ?",
+            (JobStatus.QUEUED, JobStatus.FAILED, now, now, JobStatus.RUNNING, now),
+        )
+        return cursor.rowcount
+
+    def purge_finished(self, older_than: float) -> int:
+        cursor = self._connection().execute(
+            "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+            (older_than,),
+        )
+        return cursor.rowcount
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            job_id=row["id"],
+            job_type=row["type"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            priority=row["priority"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error_message=row["error_message"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            run_after=row["run_after"],
+            finished_at=row["finished_at"],
+        )
@@ -24,4 +24,6 @@ class LoggerAdapter(ILogger):
         self._logger.error(message, *args, **kwargs)
 
 
-app_logger = LoggerAdapter()
+app_logger = LoggerAdapter(
+    f"tts-service.worker-{Config.WORKER_ID}" if Config.WORKER_ID else "tts-service"
+)
@@ -0,0 +1,64 @@
+import threading
+from typing import Callable, Optional
+
+from adapters.loggers.logger_adapter import app_logger
+from usecases.stt_streaming_use_case import STTStreamingUseCase
+
+ExpiredCallback = Callable[[str, str], None]
+
+
+class STTSessionReaper:
+    """
+    Stops expired streaming sessions every ``interval`` seconds.
+
+    Expiry closes the upstream stream and frees the session's buffers while
+    the connection stays open for a new config; ``on_expired`` is then told
+    the session id and the reason so the client can be notified.
+    """
+
+    def __init__(
+        self,
+        use_case: STTStreamingUseCase,
+        interval: float = 1.0,
+        on_expired: Optional[ExpiredCallback] = None,
+    ) -> None:
+        self.use_case = use_case
+        self.interval = interval
+        self.on_expired = on_expired
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stt-session-reaper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def reap(self) -> int:
+        expired = self.use_case.expire_sessions()
+        for session_id, reason in expired:
+            app_logger.info("STT streaming session %s stopped: %s", session_id, reason)
+            if self.on_expired is not None:
+                try:
+                    self.on_expired(session_id, reason)
+                except Exception as e:
+                    app_logger.error(
+                        "Error notifying expired session %s: %s", session_id, e
+                    )
+        return len(expired)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.reap()
+            except Exception as e:
+                app_logger.error("STT session reaper error: %s", e)
@@ -0,0 +1,62 @@
+import threading
+from typing import Optional
+
+from adapters.loggers.logger_adapter import app_logger
+from core.domain.exceptions import TTSException
+from core.interfaces.google_tts_client_interface import GoogleTTSClientInterface
+from core.services.voice_catalog import VoiceCatalog
+
+
+class VoiceCatalogRefresher:
+    """
+    Keeps a voice catalog in sync with the upstream voice list.
+
+    The first load happens on the refresher thread so startup never waits on
+    the upstream; a failed load is retried after ``retry_interval`` while the
+    previous snapshot, if any, keeps serving.
+    """
+
+    def __init__(
+        self,
+        client: GoogleTTSClientInterface,
+        catalog: VoiceCatalog,
+        refresh_interval: float = 3600.0,
+        retry_interval: float = 30.0,
+    ) -> None:
+        self.client = client
+        self.catalog = catalog
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="voice-catalog-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def refresh(self) -> bool:
+        try:
+            voices = self.client.list_voices()
+        except TTSException as e:
+            app_logger.error("Voice catalog refresh failed: %s", e.message)
+            return False
+
+        self.catalog.replace(voices)
+        app_logger.info("Voice catalog loaded with %d voices", len(voices))
+        return True
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            interval = self.refresh_interval if self.refresh() else self.retry_interval
+            self._stop_event.wait(interval)
@@ -6,13 +6,22 @@ import os
 from typing import Type
 from flask import Flask
 
+from adapters.cache.disk_audio_cache import DiskAudioCache
+from adapters.cache.memory_audio_cache import MemoryAudioCache
+from adapters.clients.cached_tts_client import CachedTTSClient
 from adapters.clients.google_tts_client import GoogleTTSClient
 from adapters.clients.google_stt_client import GoogleSTTClient
 from adapters.clients.google_stt_streaming_client import GoogleSTTStreamingClient
+from adapters.controllers.job_controller import create_job_blueprint
 from adapters.controllers.tts_controller import create_tts_blueprint
 from adapters.controllers.stt_controller import create_stt_blueprint
 from adapters.controllers.stt_streaming_controller import create_stt_streaming_blueprint
+from adapters.jobs.job_handlers import create_job_handlers
+from adapters.jobs.job_worker_pool import JobWorkerPool
+from adapters.jobs.sqlite_job_store import SQLiteJobStore
 from adapters.loggers.logger_adapter import app_logger
+from adapters.sessions.stt_session_reaper import STTSessionReaper
+from adapters.voices.voice_catalog_refresher import VoiceCatalogRefresher
 from app.extensions import register_extensions, get_socketio
 from app.handlers import (
     register_error_handlers,
@@ -21,11 +30,25 @@ from app.handlers import (
 )
 from app.routes import register_routes
 from config import Config, DevelopmentConfig, ProductionConfig
+from usecases.batch_synthesize_speech_use_case import BatchSynthesizeSpeechUseCase
+from usecases.get_job_use_case import GetJobUseCase
+from usecases.list_voices_use_case import ListVoicesUseCase
+from usecases.submit_job_use_case import SubmitJobUseCase
+from usecases.stream_speech_use_case import StreamSpeechUseCase
 from usecases.synthesize_speech_use_case import SynthesizeSpeechUseCase
 from usecases.transcribe_speech_use_case import TranscribeSpeechUseCase
 from usecases.stt_streaming_use_case import STTStreamingUseCase
 from core.services.tts_domain_service import TTSDomainService
 from core.services.stt_domain_service import STTDomainService
+from core.services.async_runtime import AsyncRuntime
+from core.services.ordered_dispatcher import OrderedDispatcher
+from core.services.silence_segmenter import SilenceSegmenter
+from core.services.single_flight import SingleFlight
+from core.services.stt_session_lifecycle import STTSessionLifecycle
+from core.services.streaming_metrics import StreamingMetrics
+from core.services.stt_streaming_session_manager import STTStreamingSessionManager
+from core.services.voice_activity import EnergyZcrVad
+from core.services.voice_catalog import VoiceCatalog
 
 
 class ApplicationFactory:
@@ -49,12 +72,7 @@ class ApplicationFactory:
             Flask: Configured Flask application instance.
         """
         if config_class is None:
-            env = os.environ.get("FLASK_ENV", "development").lower()
-            cfg_map = {
-                "development": DevelopmentConfig,
-                "production": ProductionConfig,
-            }
-            config_class = cfg_map.get(env, DevelopmentConfig)
+            config_class = ApplicationFactory.resolve_config_class()
 
         flask_app = Flask(__name__)
         flask_app.config.from_object(config_class)
@@ -72,44 +90,274 @@ class ApplicationFactory:
         )
         return flask_app
 
+    @staticmethod
+    def resolve_config_class() -> Type[Config]:
+        """Return the configuration class selected by FLASK_ENV."""
+        env = os.environ.get("FLASK_ENV", "development").lower()
+        cfg_map = {
+            "development": DevelopmentConfig,
+            "production": ProductionConfig,
+        }
+        return cfg_map.get(env, DevelopmentConfig)
+
     @staticmethod
     def _register_use_cases(flask_app):
         """Register use cases and dependencies with the Flask application."""
 
-        google_tts_client = GoogleTTSClient()
-        tts_service = TTSDomainService(google_tts_client)
+        google_tts_client = ApplicationFactory._build_tts_client(flask_app)
+        voice_catalog = ApplicationFactory._build_voice_catalog(
+            flask_app, google_tts_client
+        )
+        tts_service = TTSDomainService(
+            google_tts_client,
+            ApplicationFactory._build_single_flight(flask_app),
+            chunk_max_bytes=flask_app.config.get("TTS_CHUNK_MAX_BYTES", 5000),
+            chunk_parallelism=flask_app.config.get("TTS_CHUNK_PARALLELISM", 4),
+            batch_parallelism=flask_app.config.get("TTS_BATCH_PARALLELISM", 8),
+            voice_catalog=voice_catalog,
+        )
         flask_app.synthesize_speech_use_case = SynthesizeSpeechUseCase(tts_service)
+        flask_app.stream_speech_use_case = StreamSpeechUseCase(tts_service)
+        flask_app.batch_synthesize_speech_use_case = BatchSynthesizeSpeechUseCase(
+            tts_service
+        )
+        flask_app.list_voices_use_case = ListVoicesUseCase(voice_catalog)
 
+        flask_app.voice_activity_detector = EnergyZcrVad(
+            threshold_db=flask_app.config.get("STT_VAD_THRESHOLD_DB", -45)
+        )
         google_stt_client = GoogleSTTClient()
-        stt_service = STTDomainService(google_stt_client)
+        stt_service = STTDomainService(
+            google_stt_client,
+            ApplicationFactory._build_single_flight(flask_app),
+            segmenter=SilenceSegmenter(
+                max_segment_seconds=flask_app.config.get(
+                    "STT_LONG_AUDIO_MAX_SEGMENT_SECONDS", 50
+                ),
+                min_silence_ms=flask_app.config.get(
+                    "STT_LONG_AUDIO_MIN_SILENCE_MS", 300
+                ),
+                silence_db=flask_app.config.get("STT_LONG_AUDIO_SILENCE_DB", -40),
+            ),
+            segment_parallelism=flask_app.config.get("STT_LONG_AUDIO_PARALLELISM", 8),
+            target_sample_rate=flask_app.config.get("STT_TARGET_SAMPLE_RATE", 16000),
+            voice_activity_detector=(
+                flask_app.voice_activity_detector
+                if flask_app.config.get("STT_VAD_ENABLED", False)
+                else None
+            ),
+            vad_hangover_ms=flask_app.config.get("STT_VAD_HANGOVER_MS", 300),
+            vad_max_pause_ms=flask_app.config.get("STT_VAD_MAX_PAUSE_MS", 500),
+            probe_headers=flask_app.config.get("STT_PROBE_AUDIO_HEADERS", True),
+            sync_max_seconds=flask_app.config.get("STT_SYNC_MAX_AUDIO_SECONDS", 60),
+        )
         flask_app.transcribe_speech_use_case = TranscribeSpeechUseCase(stt_service)
 
-        google_stt_original_streaming_client = GoogleSTTStreamingClient()
+        ApplicationFactory._register_jobs(flask_app)
+
+        flask_app.stt_streaming_metrics = None
+        if flask_app.config.get("STT_STREAMING_METRICS_ENABLED", True):
+            flask_app.stt_streaming_metrics = StreamingMetrics()
+        flask_app.stt_streaming_runtime = AsyncRuntime(
+            loops=flask_app.config.get("STT_STREAMING_EVENT_LOOPS", 1),
+            name="stt-streaming",
+        )
+        flask_app.stt_streaming_runtime.start()
+        flask_app.stt_streaming_emitter = OrderedDispatcher(
+            workers=flask_app.config.get("STT_STREAMING_EMIT_THREADS", 4),
+            name="stt-emit",
+        )
+        flask_app.stt_streaming_emitter.start()
+        flask_app.stt_streaming_sessions = STTStreamingSessionManager(
+            lambda: ApplicationFactory._build_stt_streaming_client(flask_app),
+            max_sessions=flask_app.config.get("STT_STREAMING_MAX_SESSIONS", 100),
+        )
         flask_app.stt_streaming_use_case = STTStreamingUseCase(
-            google_stt_original_streaming_client
+            flask_app.stt_streaming_sessions,
+            flask_app.stt_streaming_runtime,
+            interim_max_rate=flask_app.config.get("STT_INTERIM_MAX_RATE", 10.0),
+            interim_min_change=flask_app.config.get("STT_INTERIM_MIN_CHANGE", 1),
+            interim_delta=flask_app.config.get("STT_INTERIM_DELTA", False),
+            lifecycle=STTSessionLifecycle(
+                idle_timeout=flask_app.config.get(
+                    "STT_SESSION_IDLE_TIMEOUT_SECONDS", 30
+                ),
+                max_duration=flask_app.config.get(
+                    "STT_SESSION_MAX_DURATION_SECONDS", 14400
+                ),
+                no_audio_timeout=flask_app.config.get(
+                    "STT_SESSION_NO_AUDIO_TIMEOUT_SECONDS", 10
+                ),
+            ),
+            metrics=flask_app.stt_streaming_metrics,
+            emitter=flask_app.stt_streaming_emitter,
+        )
+        flask_app.stt_session_reaper = STTSessionReaper(
+            flask_app.stt_streaming_use_case,
+            interval=flask_app.config.get("STT_SESSION_REAP_INTERVAL_SECONDS", 1),
+        )
+        flask_app.stt_session_reaper.start()
+
+    @staticmethod
+    def _register_jobs(flask_app):
+        """Register the asynchronous job store, its use cases and worker pool."""
+
+        job_store = SQLiteJobStore(flask_app.config.get("JOBS_DB_PATH", "jobs.sqlite3"))
+        flask_app.submit_job_use_case = SubmitJobUseCase(job_store)
+        flask_app.get_job_use_case = GetJobUseCase(job_store)
+
+        flask_app.job_worker_pool = None
+        if flask_app.config.get("JOBS_ENABLED", True):
+            flask_app.job_worker_pool = JobWorkerPool(
+                job_store,
+                create_job_handlers(
+                    flask_app.synthesize_speech_use_case,
+                    flask_app.transcribe_speech_use_case,
+                ),
+                workers=flask_app.config.get("JOBS_WORKERS", 2),
+                poll_interval=flask_app.config.get("JOBS_POLL_INTERVAL", 0.5),
+                lease_seconds=flask_app.config.get("JOBS_LEASE_SECONDS", 600),
+                retry_backoff=flask_app.config.get("JOBS_RETRY_BACKOFF", 5),
+                result_ttl=flask_app.config.get("JOBS_RESULT_TTL", 3600),
+            )
+            flask_app.job_worker_pool.start()
+
+    @staticmethod
+    def _build_voice_catalog(flask_app, tts_client):
+        """Create the voice catalog and start refreshing it in the background."""
+
+        voice_catalog = VoiceCatalog()
+        flask_app.voice_catalog_refresher = None
+        if flask_app.config.get("TTS_VOICE_CATALOG_ENABLED", True):
+            flask_app.voice_catalog_refresher = VoiceCatalogRefresher(
+                tts_client,
+                voice_catalog,
+                refresh_interval=flask_app.config.get(
+                    "TTS_VOICE_CATALOG_REFRESH_SECONDS", 3600
+                ),
+                retry_interval=flask_app.config.get(
+                    "TTS_VOICE_CATALOG_RETRY_SECONDS", 30
+                ),
+            )
+            flask_app.voice_catalog_refresher.start()
+        return voice_catalog
+
+    @staticmethod
+    def _build_stt_streaming_client(flask_app):
+        """Create the recognizer of one streaming session."""
+
+        return GoogleSTTStreamingClient(
+            stream_limit_seconds=flask_app.config.get(
+                "STT_ENDLESS_STREAM_LIMIT_SECONDS", 290
+            ),
+            replay_max_bytes=flask_app.config.get(
+                "STT_ENDLESS_REPLAY_MAX_BYTES", 4 * 1024 * 1024
+            ),
+            ingress_max_bytes=flask_app.config.get(
+                "STT_INGRESS_MAX_BYTES", 1024 * 1024
+            ),
+            ingress_policy=flask_app.config.get("STT_INGRESS_POLICY", "drop_oldest"),
+            ingress_high_watermark=flask_app.config.get(
+                "STT_INGRESS_HIGH_WATERMARK", 0.75
+            ),
+            ingress_low_watermark=flask_app.config.get(
+                "STT_INGRESS_LOW_WATERMARK", 0.25
+            ),
+            frame_target_ms=flask_app.config.get("STT_FRAME_TARGET_MS", 100),
+            frame_max_delay=flask_app.config.get("STT_FRAME_MAX_DELAY_MS", 150) / 1000,
+            metrics=flask_app.stt_streaming_metrics,
+            target_sample_rate=flask_app.config.get("STT_TARGET_SAMPLE_RATE", 16000),
+            probe_headers=flask_app.config.get("STT_PROBE_AUDIO_HEADERS", True),
+            voice_activity_detector=flask_app.voice_activity_detector,
+            vad_enabled=flask_app.config.get("STT_VAD_ENABLED", False),
+            vad_hangover_ms=flask_app.config.get("STT_VAD_HANGOVER_MS", 300),
+            vad_keepalive_ms=flask_app.config.get("STT_VAD_KEEPALIVE_MS", 5000),
+        )
+
+    @staticmethod
+    def _build_single_flight(flask_app):
+        """Create the request coalescer that fronts one upstream service."""
+
+        return SingleFlight(
+            max_workers=flask_app.config.get("UPSTREAM_MAX_WORKERS", 64),
+            timeout=flask_app.config.get("UPSTREAM_TIMEOUT"),
         )
 
+    @staticmethod
+    def _build_tts_client(flask_app):
+        """Wrap the Google TTS client in the configured audio cache tiers."""
+
+        tts_client = GoogleTTSClient()
+        flask_app.tts_audio_caches = []
+
+        disk_cache_dir = flask_app.config.get("TTS_DISK_CACHE_DIR")
+        if disk_cache_dir:
+            disk_cache = DiskAudioCache(
+                disk_cache_dir,
+                max_bytes=flask_app.config["TTS_DISK_CACHE_MAX_BYTES"],
+                segment_max_bytes=flask_app.config["TTS_DISK_CACHE_SEGMENT_BYTES"],
+            )
+            tts_client = CachedTTSClient(tts_client, disk_cache)
+            flask_app.tts_audio_caches.insert(0, disk_cache)
+
+        memory_cache_max_bytes = flask_app.config.get("TTS_CACHE_MAX_BYTES", 0)
+        if memory_cache_max_bytes > 0:
+            memory_cache = MemoryAudioCache(memory_cache_max_bytes)
+            tts_client = CachedTTSClient(tts_client, memory_cache)
+            flask_app.tts_audio_caches.insert(0, memory_cache)
+
+        return tts_client
+
     @staticmethod
     def _register_blueprints(flask_app):
         """Register blueprints with the Flask application."""
 
-        tts_blueprint = create_tts_blueprint(flask_app.synthesize_speech_use_case)
+        tts_blueprint = create_tts_blueprint(
+            flask_app.synthesize_speech_use_case,
+            flask_app.stream_speech_use_case,
+            flask_app.batch_synthesize_speech_use_case,
+            flask_app.list_voices_use_case,
+            max_batch_items=flask_app.config.get("TTS_BATCH_MAX_ITEMS", 1000),
+        )
         flask_app.register_blueprint(tts_blueprint)
 
-        stt_blueprint = create_stt_blueprint(flask_app.transcribe_speech_use_case)
+        stt_blueprint = create_stt_blueprint(
+            flask_app.transcribe_speech_use_case,
+            max_upload_bytes=flask_app.config.get("STT_MAX_UPLOAD_BYTES", 64 * 1024**2),
+        )
         flask_app.register_blueprint(stt_blueprint)
 
+        job_blueprint = create_job_blueprint(
+            flask_app.submit_job_use_case, flask_app.get_job_use_case
+        )
+        flask_app.register_blueprint(job_blueprint)
+
         socketio = get_socketio()
         stt_streaming_blueprint = create_stt_streaming_blueprint(
-            socketio, flask_app.stt_streaming_use_case
+            socketio,
+            flask_app.stt_streaming_use_case,
+            allow_json_audio=flask_app.config.get(
+                "STT_STREAMING_ALLOW_JSON_AUDIO", True
+            ),
+            session_reaper=flask_app.stt_session_reaper,
         )
         flask_app.register_blueprint(stt_streaming_blueprint)
 
 
 create_app = ApplicationFactory.create_app
-app = create_app()
+
+
+def __getattr__(name: str):
+    # The WSGI entry point (``app:app``) is built on first access, so the
+    # process supervisor importing this package does not start a service.
+    if name == "app":
+        instance = globals()["app"] = create_app()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
+    app = create_app()
     socketio_instance = get_socketio()
     socketio_instance.run(
         app,
@@ -1,8 +1,22 @@
-from app import create_app
+import sys
+
+from app import ApplicationFactory, create_app
 from app.extensions import get_socketio
+from app.workers import WorkerSupervisor
 
 
 def main():
+    config = ApplicationFactory.resolve_config_class()
+
+    if not config.DEBUG:
+        supervisor = WorkerSupervisor(
+            config.SERVER_WORKERS,
+            config.HOST,
+            config.PORT,
+            threads=config.SERVER_THREADS,
+        )
+        sys.exit(supervisor.run())
+
     app = create_app()
 
     socketio = get_socketio()
@@ -52,7 +52,11 @@ def register_extensions(app: Flask) -> None:
         socketio_cors_origins = app.config["CORS_ORIGINS"]
 
     socketio.init_app(
-        app, cors_allowed_origins=socketio_cors_origins, async_mode="threading"
+        app,
+        cors_allowed_origins=socketio_cors_origins,
+        async_mode="threading",
+        message_queue=app.config.get("SOCKETIO_MESSAGE_QUEUE") or None,
+        channel=app.config.get("SOCKETIO_CHANNEL", "tts-engine"),
     )
 
     app_logger.debug("Extensions registered")
@@ -61,8 +61,26 @@ def register_request_hooks(app: Flask) -> None:
         return response
 
 
-def register_shutdown_handlers(_app: Flask) -> None:
+def register_shutdown_handlers(app: Flask) -> None:
     def on_exit():
         app_logger.info("TTS Service Application is shutting down")
+        job_worker_pool = getattr(app, "job_worker_pool", None)
+        if job_worker_pool is not None:
+            job_worker_pool.stop()
+        voice_catalog_refresher = getattr(app, "voice_catalog_refresher", None)
+        if voice_catalog_refresher is not None:
+            voice_catalog_refresher.stop()
+        stt_session_reaper = getattr(app, "stt_session_reaper", None)
+        if stt_session_reaper is not None:
+            stt_session_reaper.stop()
+        stt_streaming_sessions = getattr(app, "stt_streaming_sessions", None)
+        if stt_streaming_sessions is not None:
+            stt_streaming_sessions.close_all()
+        stt_streaming_runtime = getattr(app, "stt_streaming_runtime", None)
+        if stt_streaming_runtime is not None:
+            stt_streaming_runtime.stop()
+        stt_streaming_emitter = getattr(app, "stt_streaming_emitter", None)
+        if stt_streaming_emitter is not None:
+            stt_streaming_emitter.stop()
 
     atexit.register(on_exit)
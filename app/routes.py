@@ -11,14 +11,49 @@ def register_routes(app: Flask) -> None:
                 "status": "ok",
                 "service": "tts-stt-service",
                 "version": app.config.get("VERSION", "0.1.0"),
+                "worker": app.config.get("WORKER_ID") or None,
                 "endpoints": {
                     "tts": "/api/tts",
+                    "tts_stream": "/api/tts/stream",
+                    "tts_batch": "/api/tts/batch",
+                    "tts_voices": "/api/tts/voices",
+                    "tts_cache_stats": "/api/tts/cache/stats",
                     "stt": "/api/stt",
+                    "stt_stream_metrics": "/api/stt/stream/metrics",
+                    "jobs": "/api/jobs",
                     "health": "/health",
                 },
             }
         )
 
+    @app.route("/api/tts/cache/stats")
+    def tts_cache_stats():
+        caches = getattr(app, "tts_audio_caches", [])
+        return jsonify(
+            {"enabled": bool(caches), "tiers": [cache.stats() for cache in caches]}
+        )
+
+    @app.route("/api/stt/stream/metrics")
+    def stt_stream_metrics():
+        metrics = getattr(app, "stt_streaming_metrics", None)
+        sessions = getattr(app, "stt_streaming_sessions", None)
+        active = sessions.sessions() if sessions is not None else []
+        return jsonify(
+            {
+                "enabled": metrics is not None,
+                "worker": app.config.get("WORKER_ID") or None,
+                "sessions": len(active),
+                "streaming": sum(1 for session in active if session.streaming),
+                "histograms": metrics.snapshot() if metrics is not None else {},
+            }
+        )
+
     @app.route("/health")
     def health():
-        return jsonify({"status": "healthy", "timestamp": time.time()})
+        return jsonify(
+            {
+                "status": "healthy",
+                "timestamp": time.time(),
+                "worker": app.config.get("WORKER_ID") or None,
+            }
+        )
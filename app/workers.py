@@ -0,0 +1,117 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+from adapters.loggers.logger_adapter import app_logger
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class WorkerSupervisor:
+    """
+    Runs the service as ``workers`` gunicorn processes, worker ``i`` bound to
+    ``port + i``.
+
+    Every process keeps its own streaming session registry, so a client has
+    to stay on the worker it connected to: put a sticky load balancer (see
+    ``deploy/nginx.conf``) in front of the ports, and give all processes the
+    same Socket.IO message queue so emits reach clients on any worker.
+    Workers that exit are restarted after ``restart_delay`` seconds until
+    the supervisor is stopped.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        host: str,
+        port: int,
+        threads: int = 100,
+        restart_delay: float = 1.0,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.host = host
+        self.port = port
+        self.threads = threads
+        self.restart_delay = restart_delay
+        self._processes: Dict[int, subprocess.Popen] = {}
+        self._stopping = False
+
+    def worker_command(self, index: int) -> List[str]:
+        return [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--worker-class",
+            "gthread",
+            "--workers",
+            "1",
+            "--threads",
+            str(self.threads),
+            "--bind",
+            f"{self.host}:{self.port + index}",
+            "app:app",
+        ]
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+
+        if self.workers > 1 and not os.environ.get("SOCKETIO_MESSAGE_QUEUE"):
+            app_logger.error(
+                "SOCKETIO_MESSAGE_QUEUE is not set; emits from one worker "
+                "will not reach clients connected to another"
+            )
+
+        for index in range(self.workers):
+            self._spawn(index)
+
+        while not self._stopping:
+            time.sleep(self.restart_delay)
+            for index, process in list(self._processes.items()):
+                if process.poll() is not None and not self._stopping:
+                    app_logger.error(
+                        "Worker %d exited with code %s, restarting",
+                        index,
+                        process.returncode,
+                    )
+                    self._spawn(index)
+
+        return self._wait()
+
+    def stop(self) -> None:
+        self._stopping = True
+        for process in self._processes.values():
+            if process.poll() is None:
+                process.terminate()
+
+    def _spawn(self, index: int) -> None:
+        env = dict(os.environ, WORKER_ID=str(index), PORT=str(self.port + index))
+        self._processes[index] = subprocess.Popen(
+            self.worker_command(index), env=env, cwd=PROJECT_ROOT
+        )
+        app_logger.info(
+            "Started worker %d (pid %d) on port %d",
+            index,
+            self._processes[index].pid,
+            self.port + index,
+        )
+
+    def _wait(self, timeout: Optional[float] = 30.0) -> int:
+        exit_code = 0
+        for index, process in self._processes.items():
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                app_logger.error("Worker %d did not stop in time, killing it", index)
+                process.kill()
+                process.wait()
+            if process.returncode and process.returncode > 0:
+                exit_code = exit_code or process.returncode
+        return exit_code
+
+    def _handle_signal(self, signum, frame) -> None:
+        app_logger.info("Received signal %d, stopping workers", signum)
+        self.stop()
@@ -23,6 +23,64 @@ class Config:
         HOST (str): Host address for binding.
         PORT (int): Port number for binding.
         CORS_ORIGINS (str): Allowed origins for Cross-Origin Resource Sharing.
+        SERVER_WORKERS (int): Server processes started on consecutive ports from PORT.
+        SERVER_THREADS (int): Request threads per server process.
+        WORKER_ID (str): Index of this server process, set by the supervisor.
+        SOCKETIO_MESSAGE_QUEUE (str): Message queue URL shared by all processes (empty for one process).
+        SOCKETIO_CHANNEL (str): Channel name on the message queue.
+        TTS_CACHE_MAX_BYTES (int): Byte budget of the in-memory TTS audio cache (0 disables it).
+        TTS_DISK_CACHE_DIR (str): Directory of the persistent TTS audio cache (empty disables it).
+        TTS_DISK_CACHE_MAX_BYTES (int): Byte budget of the persistent TTS audio cache.
+        TTS_DISK_CACHE_SEGMENT_BYTES (int): Maximum size of one persistent cache segment file.
+        TTS_CHUNK_MAX_BYTES (int): Upstream byte limit that long texts are split under.
+        TTS_CHUNK_PARALLELISM (int): Chunks of one long text synthesized concurrently.
+        TTS_BATCH_MAX_ITEMS (int): Maximum number of items in one batch TTS request.
+        TTS_BATCH_PARALLELISM (int): Distinct batch items synthesized concurrently.
+        TTS_VOICE_CATALOG_ENABLED (bool): Validates voices against a cached upstream voice list.
+        TTS_VOICE_CATALOG_REFRESH_SECONDS (float): Seconds between voice list refreshes.
+        TTS_VOICE_CATALOG_RETRY_SECONDS (float): Seconds before retrying a failed voice list refresh.
+        STT_MAX_UPLOAD_BYTES (int): Largest audio upload accepted by /api/stt.
+        STT_TARGET_SAMPLE_RATE (int): Rate LINEAR16 audio is downmixed and resampled to (0 disables it).
+        STT_PROBE_AUDIO_HEADERS (bool): Takes format, rate and channel count from the audio header over the request.
+        STT_SYNC_MAX_AUDIO_SECONDS (float): Longest audio sent in one synchronous call (0 disables the check).
+        STT_LONG_AUDIO_MAX_SEGMENT_SECONDS (float): Longest segment long audio is split into.
+        STT_LONG_AUDIO_MIN_SILENCE_MS (int): Shortest pause a long audio segment may end in.
+        STT_LONG_AUDIO_SILENCE_DB (float): Frame energy in dBFS below which audio counts as silence.
+        STT_LONG_AUDIO_PARALLELISM (int): Segments of one long audio transcribed concurrently.
+        STT_VAD_ENABLED (bool): Drops silence from WAV/LINEAR16 audio before it is sent upstream.
+        STT_VAD_THRESHOLD_DB (float): Frame energy in dBFS above which audio counts as speech.
+        STT_VAD_HANGOVER_MS (int): Audio kept after speech ends.
+        STT_VAD_MAX_PAUSE_MS (int): Longest pause left inside batch audio.
+        STT_VAD_KEEPALIVE_MS (int): Interval at which one frame of streamed silence is still sent.
+        STT_STREAMING_MAX_SESSIONS (int): Concurrent streaming recognition sessions per process.
+        STT_STREAMING_ALLOW_JSON_AUDIO (bool): Deprecated; still accepts audio sent as JSON lists of bytes.
+        STT_STREAMING_EVENT_LOOPS (int): Shared event loops that run all streaming sessions.
+        STT_STREAMING_EMIT_THREADS (int): Threads that send streaming events to clients off the event loops.
+        STT_STREAMING_METRICS_ENABLED (bool): Records streaming latency histograms.
+        STT_ENDLESS_STREAM_LIMIT_SECONDS (float): Seconds after which an endless stream rolls over upstream.
+        STT_ENDLESS_REPLAY_MAX_BYTES (int): Audio kept per endless stream for replay after a rollover.
+        STT_INGRESS_MAX_BYTES (int): Audio buffered per streaming session while upstream catches up.
+        STT_INGRESS_POLICY (str): What gives way when that buffer is full (drop_oldest, drop_newest, block).
+        STT_INGRESS_HIGH_WATERMARK (float): Buffer fill ratio at which the client is asked to pause.
+        STT_INGRESS_LOW_WATERMARK (float): Buffer fill ratio at which the client is told to resume.
+        STT_FRAME_TARGET_MS (int): Audio per upstream request that streamed chunks are re-framed to.
+        STT_FRAME_MAX_DELAY_MS (int): Longest a partial frame waits for more audio before it is sent.
+        STT_INTERIM_MAX_RATE (float): Interim results sent per second and session (0 is unlimited).
+        STT_INTERIM_MIN_CHANGE (int): Characters an interim transcript must change by to be sent.
+        STT_INTERIM_DELTA (bool): Sends interim transcripts as the changed suffix only.
+        STT_SESSION_IDLE_TIMEOUT_SECONDS (float): Seconds without audio before a stream is stopped.
+        STT_SESSION_MAX_DURATION_SECONDS (float): Longest a configured stream may run.
+        STT_SESSION_NO_AUDIO_TIMEOUT_SECONDS (float): Seconds a configured stream may wait for its first audio.
+        STT_SESSION_REAP_INTERVAL_SECONDS (float): Seconds between checks for expired streams.
+        JOBS_ENABLED (bool): Runs the asynchronous job worker pool in this process.
+        JOBS_DB_PATH (str): SQLite database holding the asynchronous job queue.
+        JOBS_WORKERS (int): Worker threads draining the job queue.
+        JOBS_POLL_INTERVAL (float): Seconds an idle worker waits before polling again.
+        JOBS_LEASE_SECONDS (float): Seconds before a running job is presumed abandoned.
+        JOBS_RETRY_BACKOFF (float): Base delay in seconds before retrying a failed job.
+        JOBS_RESULT_TTL (float): Seconds finished jobs and their results are kept.
+        UPSTREAM_MAX_WORKERS (int): Concurrent upstream calls per service after coalescing.
+        UPSTREAM_TIMEOUT (float): Seconds a request waits on a coalesced upstream call.
     """
 
     DEBUG = os.environ.get("DEBUG", "False").lower() == "true"
@@ -37,8 +95,111 @@ class Config:
     PORT = int(os.environ.get("PORT", 5003))
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "*")
 
+    SERVER_WORKERS = int(os.environ.get("SERVER_WORKERS", 1))
+    SERVER_THREADS = int(os.environ.get("SERVER_THREADS", 100))
+    WORKER_ID = os.environ.get("WORKER_ID", "")
+    SOCKETIO_MESSAGE_QUEUE = os.environ.get("SOCKETIO_MESSAGE_QUEUE", "")
+    SOCKETIO_CHANNEL = os.environ.get("SOCKETIO_CHANNEL", "tts-engine")
+
     DEFAULT_RATE_LIMITS = ["1000 per day", "500 per minute"]
 
+    TTS_CACHE_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    TTS_DISK_CACHE_DIR = os.environ.get("TTS_DISK_CACHE_DIR", "")
+    TTS_DISK_CACHE_MAX_BYTES = int(
+        os.environ.get("TTS_DISK_CACHE_MAX_BYTES", 1024 * 1024 * 1024)
+    )
+    TTS_DISK_CACHE_SEGMENT_BYTES = int(
+        os.environ.get("TTS_DISK_CACHE_SEGMENT_BYTES", 64 * 1024 * 1024)
+    )
+
+    TTS_CHUNK_MAX_BYTES = int(os.environ.get("TTS_CHUNK_MAX_BYTES", 5000))
+    TTS_CHUNK_PARALLELISM = int(os.environ.get("TTS_CHUNK_PARALLELISM", 4))
+
+    TTS_BATCH_MAX_ITEMS = int(os.environ.get("TTS_BATCH_MAX_ITEMS", 1000))
+    TTS_BATCH_PARALLELISM = int(os.environ.get("TTS_BATCH_PARALLELISM", 8))
+
+    TTS_VOICE_CATALOG_ENABLED = (
+        os.environ.get("TTS_VOICE_CATALOG_ENABLED", "True").lower() == "true"
+    )
+    TTS_VOICE_CATALOG_REFRESH_SECONDS = float(
+        os.environ.get("TTS_VOICE_CATALOG_REFRESH_SECONDS", 3600)
+    )
+    TTS_VOICE_CATALOG_RETRY_SECONDS = float(
+        os.environ.get("TTS_VOICE_CATALOG_RETRY_SECONDS", 30)
+    )
+
+    STT_MAX_UPLOAD_BYTES = int(os.environ.get("STT_MAX_UPLOAD_BYTES", 64 * 1024**2))
+    STT_TARGET_SAMPLE_RATE = int(os.environ.get("STT_TARGET_SAMPLE_RATE", 16000))
+    STT_PROBE_AUDIO_HEADERS = (
+        os.environ.get("STT_PROBE_AUDIO_HEADERS", "True").lower() == "true"
+    )
+    STT_SYNC_MAX_AUDIO_SECONDS = float(os.environ.get("STT_SYNC_MAX_AUDIO_SECONDS", 60))
+    STT_LONG_AUDIO_MAX_SEGMENT_SECONDS = float(
+        os.environ.get("STT_LONG_AUDIO_MAX_SEGMENT_SECONDS", 50)
+    )
+    STT_LONG_AUDIO_MIN_SILENCE_MS = int(
+        os.environ.get("STT_LONG_AUDIO_MIN_SILENCE_MS", 300)
+    )
+    STT_LONG_AUDIO_SILENCE_DB = float(os.environ.get("STT_LONG_AUDIO_SILENCE_DB", -40))
+    STT_LONG_AUDIO_PARALLELISM = int(os.environ.get("STT_LONG_AUDIO_PARALLELISM", 8))
+    STT_VAD_ENABLED = os.environ.get("STT_VAD_ENABLED", "False").lower() == "true"
+    STT_VAD_THRESHOLD_DB = float(os.environ.get("STT_VAD_THRESHOLD_DB", -45))
+    STT_VAD_HANGOVER_MS = int(os.environ.get("STT_VAD_HANGOVER_MS", 300))
+    STT_VAD_MAX_PAUSE_MS = int(os.environ.get("STT_VAD_MAX_PAUSE_MS", 500))
+    STT_VAD_KEEPALIVE_MS = int(os.environ.get("STT_VAD_KEEPALIVE_MS", 5000))
+    STT_STREAMING_MAX_SESSIONS = int(os.environ.get("STT_STREAMING_MAX_SESSIONS", 100))
+    STT_STREAMING_ALLOW_JSON_AUDIO = (
+        os.environ.get("STT_STREAMING_ALLOW_JSON_AUDIO", "True").lower() == "true"
+    )
+    STT_STREAMING_EVENT_LOOPS = int(os.environ.get("STT_STREAMING_EVENT_LOOPS", 1))
+    STT_STREAMING_EMIT_THREADS = int(os.environ.get("STT_STREAMING_EMIT_THREADS", 4))
+    STT_STREAMING_METRICS_ENABLED = (
+        os.environ.get("STT_STREAMING_METRICS_ENABLED", "True").lower() == "true"
+    )
+    STT_ENDLESS_STREAM_LIMIT_SECONDS = float(
+        os.environ.get("STT_ENDLESS_STREAM_LIMIT_SECONDS", 290)
+    )
+    STT_ENDLESS_REPLAY_MAX_BYTES = int(
+        os.environ.get("STT_ENDLESS_REPLAY_MAX_BYTES", 4 * 1024 * 1024)
+    )
+
+    STT_INGRESS_MAX_BYTES = int(os.environ.get("STT_INGRESS_MAX_BYTES", 1024 * 1024))
+    STT_INGRESS_POLICY = os.environ.get("STT_INGRESS_POLICY", "drop_oldest")
+    STT_INGRESS_HIGH_WATERMARK = float(
+        os.environ.get("STT_INGRESS_HIGH_WATERMARK", 0.75)
+    )
+    STT_INGRESS_LOW_WATERMARK = float(os.environ.get("STT_INGRESS_LOW_WATERMARK", 0.25))
+
+    STT_FRAME_TARGET_MS = int(os.environ.get("STT_FRAME_TARGET_MS", 100))
+    STT_FRAME_MAX_DELAY_MS = int(os.environ.get("STT_FRAME_MAX_DELAY_MS", 150))
+
+    STT_INTERIM_MAX_RATE = float(os.environ.get("STT_INTERIM_MAX_RATE", 10))
+    STT_INTERIM_MIN_CHANGE = int(os.environ.get("STT_INTERIM_MIN_CHANGE", 1))
+    STT_INTERIM_DELTA = os.environ.get("STT_INTERIM_DELTA", "False").lower() == "true"
+    STT_SESSION_IDLE_TIMEOUT_SECONDS = float(
+        os.environ.get("STT_SESSION_IDLE_TIMEOUT_SECONDS", 30)
+    )
+    STT_SESSION_MAX_DURATION_SECONDS = float(
+        os.environ.get("STT_SESSION_MAX_DURATION_SECONDS", 14400)
+    )
+    STT_SESSION_NO_AUDIO_TIMEOUT_SECONDS = float(
+        os.environ.get("STT_SESSION_NO_AUDIO_TIMEOUT_SECONDS", 10)
+    )
+    STT_SESSION_REAP_INTERVAL_SECONDS = float(
+        os.environ.get("STT_SESSION_REAP_INTERVAL_SECONDS", 1)
+    )
+
+    JOBS_ENABLED = os.environ.get("JOBS_ENABLED", "True").lower() == "true"
+    JOBS_DB_PATH = os.environ.get("JOBS_DB_PATH", "jobs.sqlite3")
+    JOBS_WORKERS = int(os.environ.get("JOBS_WORKERS", 2))
+    JOBS_POLL_INTERVAL = float(os.environ.get("JOBS_POLL_INTERVAL", 0.5))
+    JOBS_LEASE_SECONDS = float(os.environ.get("JOBS_LEASE_SECONDS", 600))
+    JOBS_RETRY_BACKOFF = float(os.environ.get("JOBS_RETRY_BACKOFF", 5))
+    JOBS_RESULT_TTL = float(os.environ.get("JOBS_RESULT_TTL", 3600))
+
+    UPSTREAM_MAX_WORKERS = int(os.environ.get("UPSTREAM_MAX_WORKERS", 64))
+    UPSTREAM_TIMEOUT = float(os.environ.get("UPSTREAM_TIMEOUT", 60))
+
 
 class DevelopmentConfig(Config):
     """
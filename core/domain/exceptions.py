@@ -38,3 +38,22 @@ class STTValidationError(STTException):
 class STTConfigurationError(STTException):
     def __init__(self, message: str = "STT configuration error") -> None:
         super().__init__(message)
+
+
+class STTSessionLimitError(STTException):
+    def __init__(self, message: str = "Too many concurrent streaming sessions") -> None:
+        super().__init__(message)
+
+
+class JobException(Exception):
+    def __init__(self, message: str = "Job operation failed") -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class JobExecutionError(JobException):
+    def __init__(
+        self, message: str = "Job execution failed", retryable: bool = True
+    ) -> None:
+        self.retryable = retryable
+        super().__init__(message)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+JOB_TYPES = ("tts", "stt")
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    job_id: str
+    job_type: str
+    payload: Dict[str, Any]
+    status: str = JobStatus.QUEUED
+    priority: int = 0
+    attempts: int = 0
+    max_attempts: int = 3
+    result: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    run_after: float = 0.0
+    finished_at: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.job_type not in JOB_TYPES:
+            raise ValueError(f"Unsupported job type: {self.job_type}")
+        if self.max_attempts < 1:
+            raise ValueError("Max attempts must be at least 1")
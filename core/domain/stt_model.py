@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+import hashlib
+import json
+from dataclasses import asdict, dataclass
 from typing import Optional, List
 
+NO_SPEECH_DETECTED = "No speech detected"
+
 
 @dataclass
 class WordTimestamp:
@@ -11,22 +15,33 @@ class WordTimestamp:
 
 @dataclass
 class STTRequest:
-    audio_data: str
+    audio_data: bytes
     format: str = "webm"
     language: str = "en-US"
     enable_word_timestamps: bool = False
     sample_rate: int = 48000
     enable_automatic_punctuation: bool = True
     model: str = "latest_long"
+    long_audio: bool = False
+    audio_channel_count: int = 1
 
     def __post_init__(self) -> None:
-        if not self.audio_data.strip():
+        if not self.audio_data:
             raise ValueError("Audio data cannot be empty")
         if self.format not in ["webm", "wav", "mp3", "flac", "opus"]:
             raise ValueError(f"Unsupported audio format: {self.format}")
         if self.sample_rate < 8000 or self.sample_rate > 48000:
             raise ValueError("Sample rate must be between 8000 and 48000 Hz")
 
+    def cache_key(self) -> str:
+        params = asdict(self)
+        del params["audio_data"]
+        hasher = hashlib.sha256(
+            json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        )
+        hasher.update(self.audio_data)
+        return hasher.hexdigest()
+
 
 @dataclass
 class STTResponse:
@@ -1,5 +1,29 @@
-from dataclasses import dataclass
-from typing import Optional
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple, Union
+
+MAX_TEXT_LENGTH = 100000
+
+AudioBytes = Union[bytes, memoryview]
+
+AUDIO_ENCODING_MIMETYPES = {
+    "MP3": "audio/mpeg",
+    "OGG_OPUS": "audio/ogg",
+    "LINEAR16": "audio/wav",
+    "MULAW": "audio/wav",
+    "ALAW": "audio/wav",
+}
+
+SSML_GENDERS = ("SSML_VOICE_GENDER_UNSPECIFIED", "MALE", "FEMALE", "NEUTRAL")
+
+
+@dataclass(frozen=True)
+class Voice:
+    name: str
+    language_codes: Tuple[str, ...]
+    ssml_gender: str
+    natural_sample_rate_hertz: int
 
 
 @dataclass
@@ -9,8 +33,21 @@ class VoiceConfig:
     ssml_gender: str = "NEUTRAL"
     speaking_rate: float = 1.0
     pitch: float = 0.0
+    audio_encoding: str = "MP3"
+    sample_rate_hertz: Optional[int] = None
 
     def __post_init__(self) -> None:
+        self.speaking_rate = float(self.speaking_rate)
+        self.pitch = float(self.pitch)
+        if not isinstance(self.audio_encoding, str):
+            raise ValueError(f"Unsupported audio encoding: {self.audio_encoding}")
+        self.audio_encoding = self.audio_encoding.upper()
+        if self.audio_encoding not in AUDIO_ENCODING_MIMETYPES:
+            raise ValueError(f"Unsupported audio encoding: {self.audio_encoding}")
+        if self.sample_rate_hertz is not None:
+            self.sample_rate_hertz = int(self.sample_rate_hertz)
+            if not 8000 <= self.sample_rate_hertz <= 48000:
+                raise ValueError("Sample rate must be between 8000 and 48000 Hz")
         if not 0.25 <= self.speaking_rate <= 4.0:
             raise ValueError("Speaking rate must be between 0.25 and 4.0")
         if not -20.0 <= self.pitch <= 20.0:
@@ -25,13 +62,28 @@ class TTSRequest:
     def __post_init__(self) -> None:
         if not self.text.strip():
             raise ValueError("Text cannot be empty")
-        if len(self.text) > 5000:
-            raise ValueError("Text exceeds maximum length of 5000 characters")
+        if len(self.text) > MAX_TEXT_LENGTH:
+            raise ValueError(
+                f"Text exceeds maximum length of {MAX_TEXT_LENGTH} characters"
+            )
+
+    def cache_key(self) -> str:
+        canonical = json.dumps(
+            {"text": self.text, "voice_config": asdict(self.voice_config)},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def mimetype(self) -> str:
+        return AUDIO_ENCODING_MIMETYPES[self.voice_config.audio_encoding]
 
 
 @dataclass
 class TTSResponse:
-    audio_content: str
+    audio_content: AudioBytes
     success: bool
     error_message: Optional[str] = None
 
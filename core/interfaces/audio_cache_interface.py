@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from core.domain.tts_model import AudioBytes
+
+
+class AudioCacheInterface(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[AudioBytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, audio: AudioBytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Optional
 
 
 class GoogleSTTStreamingClientInterface(ABC):
     @abstractmethod
-    def setup_config(self, config_data: Dict[str, Any]) -> None:
+    def setup_config(
+        self,
+        config_data: Dict[str, Any],
+        on_backpressure: Optional[Callable[[bool], None]] = None,
+    ) -> None:
         raise NotImplementedError
 
     @abstractmethod
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
-from core.domain.tts_model import TTSRequest, TTSResponse
+from typing import List
+
+from core.domain.tts_model import TTSRequest, TTSResponse, Voice
 
 
 class GoogleTTSClientInterface(ABC):
     @abstractmethod
     def synthesize_speech(self, request: TTSRequest) -> TTSResponse:
         raise NotImplementedError
+
+    @abstractmethod
+    def list_voices(self) -> List[Voice]:
+        raise NotImplementedError
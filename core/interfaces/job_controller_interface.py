@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class JobControllerInterface(ABC):
+    @abstractmethod
+    def submit_job(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_job(self, job_id: str):
+        raise NotImplementedError
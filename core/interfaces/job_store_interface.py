@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from core.domain.job_model import Job
+
+
+class JobStoreInterface(ABC):
+    @abstractmethod
+    def enqueue(self, job: Job) -> Job:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_next(self, lease_seconds: float) -> Optional[Job]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def fail(self, job_id: str, error_message: str, retry_at: Optional[float]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def requeue_expired_leases(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge_finished(self, older_than: float) -> int:
+        raise NotImplementedError
@@ -5,3 +5,15 @@ class TTSControllerInterface(ABC):
     @abstractmethod
     async def synthesize_speech(self):
         raise NotImplementedError
+
+    @abstractmethod
+    def stream_speech(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def synthesize_batch(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_voices(self):
+        raise NotImplementedError
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Sequence, Tuple
+
 from core.domain.tts_model import TTSRequest, TTSResponse
 
 
@@ -7,3 +9,13 @@ class TTSDomainServiceInterface(ABC):
     def process_tts_request(self, request: TTSRequest) -> TTSResponse:
 
         raise NotImplementedError
+
+    @abstractmethod
+    def stream_tts_request(self, request: TTSRequest) -> Iterator[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def process_tts_batch(
+        self, requests: Sequence[TTSRequest]
+    ) -> Iterator[Tuple[int, TTSResponse]]:
+        raise NotImplementedError
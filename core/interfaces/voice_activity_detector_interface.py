@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class VoiceActivityDetectorInterface(ABC):
+    frame_ms: int
+
+    @abstractmethod
+    def speech_frames(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Return one boolean per complete ``frame_ms`` frame of ``samples``."""
+        raise NotImplementedError
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from core.domain.tts_model import Voice, VoiceConfig
+
+
+class VoiceCatalogInterface(ABC):
+    @abstractmethod
+    def is_loaded(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def validate(self, voice_config: VoiceConfig) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_voices(
+        self, language_code: Optional[str] = None, ssml_gender: Optional[str] = None
+    ) -> List[Voice]:
+        raise NotImplementedError
@@ -0,0 +1,74 @@
+import asyncio
+import itertools
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """
+    A fixed set of long-lived asyncio event loops, each on its own thread.
+
+    Work is scheduled as tasks from any thread and spread over the loops
+    round-robin, so thousands of mostly idle sessions cost one task each
+    instead of a thread and an event loop each.
+    """
+
+    def __init__(self, loops: int = 1, name: str = "async-runtime") -> None:
+        self.name = name
+        self._loop_count = max(1, loops)
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._threads: List[threading.Thread] = []
+        self._next_loop = itertools.count()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._loops:
+                return
+            for index in range(self._loop_count):
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run,
+                    args=(loop, ready),
+                    name=f"{self.name}-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                ready.wait()
+                self._loops.append(loop)
+                self._threads.append(thread)
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> "Future[T]":
+        if not self._loops:
+            self.start()
+        loop = self._loops[next(self._next_loop) % len(self._loops)]
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        with self._lock:
+            loops, threads = self._loops, self._threads
+            self._loops, self._threads = [], []
+        for loop in loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for thread in threads:
+            thread.join(timeout)
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+            loop.close()
@@ -0,0 +1,175 @@
+import struct
+from typing import Optional, Sequence, Tuple
+
+from core.domain.tts_model import AUDIO_ENCODING_MIMETYPES, AudioBytes
+
+_MP3_BITRATES_KBPS = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000],
+}
+_STREAMING_WAV_SIZE = 0xFFFFFFFF
+
+
+def _skip_id3v2(data: AudioBytes) -> int:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _mp3_frame_length(data: AudioBytes, offset: int) -> Optional[int]:
+    if offset + 4 > len(data):
+        return None
+    header = int.from_bytes(data[offset : offset + 4], "big")
+    if header >> 21 != 0x7FF:
+        return None
+
+    version_bits = (header >> 19) & 0x3
+    layer_bits = (header >> 17) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 0x3
+    padding = (header >> 9) & 0x1
+    if (
+        version_bits == 1
+        or layer_bits != 1
+        or bitrate_index in (0, 15)
+        or sample_rate_index == 3
+    ):
+        return None
+
+    table = 1 if version_bits == 3 else 2
+    bitrate = _MP3_BITRATES_KBPS[table][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version_bits][sample_rate_index]
+    coefficient = 144 if version_bits == 3 else 72
+    return coefficient * bitrate // sample_rate + padding
+
+
+def _is_vbr_info_frame(data: AudioBytes, offset: int) -> bool:
+    header = int.from_bytes(data[offset : offset + 4], "big")
+    mpeg1 = ((header >> 19) & 0x3) == 3
+    mono = ((header >> 6) & 0x3) == 3
+    if mpeg1:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    tag_offset = offset + 4 + side_info
+    return data[tag_offset : tag_offset + 4] in (b"Xing", b"Info")
+
+
+def mp3_frames(data: AudioBytes) -> memoryview:
+    """
+    Return the MPEG audio frames of an MP3 clip without ID3 tags or the
+    Xing/Info header frame, which describe a single clip and would report
+    the wrong duration once clips are joined.
+    """
+    start = _skip_id3v2(data)
+    end = len(data)
+    if end - start >= 128 and data[end - 128 : end - 125] == b"TAG":
+        end -= 128
+
+    frame_length = _mp3_frame_length(data, start)
+    if frame_length and _is_vbr_info_frame(data, start):
+        start += frame_length
+    return memoryview(data)[start:end]
+
+
+def join_mp3(parts: Sequence[AudioBytes]) -> AudioBytes:
+    """Concatenate MP3 clips into one continuous stream of frames."""
+    if len(parts) == 1:
+        return parts[0]
+    return b"".join(mp3_frames(part) for part in parts)
+
+
+def _wav_chunks(
+    data: AudioBytes,
+) -> Tuple[Optional[memoryview], Optional[memoryview]]:
+    view = memoryview(data)
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        return None, None
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset : offset + 4])
+        size = int.from_bytes(view[offset + 4 : offset + 8], "little")
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            fmt = view[body : body + size]
+        elif chunk_id == b"data":
+            if size in (0, _STREAMING_WAV_SIZE):
+                return fmt, view[body:]
+            return fmt, view[body : body + size]
+        offset = body + size + (size & 1)
+    return fmt, None
+
+
+def _wav_header(fmt: memoryview, data_size: int) -> bytes:
+    padding = b"\0" if len(fmt) & 1 else b""
+    riff_size = min(
+        4 + 8 + len(fmt) + len(padding) + 8 + data_size, _STREAMING_WAV_SIZE
+    )
+    return b"".join(
+        [
+            b"RIFF",
+            struct.pack("<I", riff_size),
+            b"WAVE",
+            b"fmt ",
+            struct.pack("<I", len(fmt)),
+            bytes(fmt),
+            padding,
+            b"data",
+            struct.pack("<I", data_size),
+        ]
+    )
+
+
+def join_wav(parts: Sequence[AudioBytes]) -> AudioBytes:
+    """
+    Concatenate WAV clips that share one format into a single WAV file.
+    Clips that cannot be parsed are joined as-is.
+    """
+    chunks = [_wav_chunks(part) for part in parts]
+    if any(fmt is None or pcm is None for fmt, pcm in chunks):
+        return b"".join(parts)
+
+    pcm_size = sum(len(pcm) for _, pcm in chunks)
+    header = _wav_header(chunks[0][0], pcm_size)
+    return b"".join([header] + [pcm for _, pcm in chunks])
+
+
+def join_audio(parts: Sequence[AudioBytes], audio_encoding: str) -> AudioBytes:
+    """
+    Concatenate clips synthesized with ``audio_encoding`` in order. Ogg Opus
+    clips are chained, which the Ogg format allows without re-muxing.
+    """
+    if len(parts) == 1:
+        return parts[0]
+    if audio_encoding == "MP3":
+        return join_mp3(parts)
+    if AUDIO_ENCODING_MIMETYPES[audio_encoding] == "audio/wav":
+        return join_wav(parts)
+    return b"".join(parts)
+
+
+def stream_segment(audio: AudioBytes, audio_encoding: str, first: bool) -> bytes:
+    """
+    Return the bytes of one clip to append to a progressively streamed file.
+    WAV clips keep only the first header, rewritten with open-ended sizes.
+    """
+    if audio_encoding == "MP3":
+        return bytes(mp3_frames(audio))
+    if AUDIO_ENCODING_MIMETYPES[audio_encoding] != "audio/wav":
+        return bytes(audio)
+
+    fmt, pcm = _wav_chunks(audio)
+    if fmt is None or pcm is None:
+        return bytes(audio)
+    if first:
+        return _wav_header(fmt, _STREAMING_WAV_SIZE) + bytes(pcm)
+    return bytes(pcm)
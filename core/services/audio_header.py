@@ -0,0 +1,248 @@
+import struct
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+_EBML_DOCTYPE = 0x4282
+_SEGMENT = 0x18538067
+_INFO = 0x1549A966
+_TIMECODE_SCALE = 0x2AD7B1
+_DURATION = 0x4489
+_TRACKS = 0x1654AE6B
+_TRACK_ENTRY = 0xAE
+_TRACK_TYPE = 0x83
+_CODEC_ID = 0x86
+_AUDIO = 0xE1
+_SAMPLING_FREQUENCY = 0xB5
+_CHANNELS = 0x9F
+_CLUSTER = 0x1F43B675
+_AUDIO_TRACK = 2
+
+
+@dataclass
+class AudioInfo:
+    """
+    What an audio file's header says about it. ``format`` uses the names
+    of ``STTRequest.format`` and ``encoding`` those of
+    ``RecognitionConfig.AudioEncoding``; ``duration`` is None when the
+    header does not record it. ``data_offset`` is where LINEAR16 samples
+    start.
+    """
+
+    format: str
+    encoding: Optional[str]
+    sample_rate: int
+    channels: int
+    duration: Optional[float] = None
+    data_offset: int = 0
+
+
+def probe_audio(data: bytes) -> Optional[AudioInfo]:
+    """
+    Identify WAV, FLAC, Ogg Opus and WebM audio from its leading bytes.
+    Returns None for anything else, including headers cut short or too
+    damaged to read.
+    """
+    start = _skip_id3(data)
+    for magic, parse in _PARSERS:
+        if data[start : start + len(magic)] == magic:
+            try:
+                return parse(data, start)
+            except (struct.error, IndexError, ValueError):
+                return None
+    return None
+
+
+def _skip_id3(data: bytes) -> int:
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = size << 7 | (byte & 0x7F)
+    return 10 + size
+
+
+def _parse_wav(data: bytes, start: int) -> Optional[AudioInfo]:
+    if data[start + 8 : start + 12] != b"WAVE":
+        return None
+    fmt = None
+    position = start + 12
+    while position + 8 <= len(data):
+        chunk_id = data[position : position + 4]
+        (size,) = struct.unpack_from("<I", data, position + 4)
+        body = position + 8
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack_from("<HHIIHH", data, body)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            audio_format, channels, rate, byte_rate, _, bits = fmt
+            pcm16 = audio_format in (1, 0xFFFE) and bits == 16
+            # Streaming writers leave the size at 0 or 0xFFFFFFFF.
+            duration = None
+            if byte_rate and 0 < size < 0xFFFFFFFF:
+                duration = size / byte_rate
+            return AudioInfo(
+                format="wav",
+                encoding="LINEAR16" if pcm16 else None,
+                sample_rate=rate,
+                channels=channels,
+                duration=duration,
+                data_offset=body,
+            )
+        position = body + size + (size & 1)
+    return None
+
+
+def _parse_flac(data: bytes, start: int) -> Optional[AudioInfo]:
+    block_type = data[start + 4] & 0x7F
+    if block_type != 0:
+        return None
+    streaminfo = data[start + 8 : start + 8 + 34]
+    if len(streaminfo) < 34:
+        return None
+    (packed,) = struct.unpack_from(">Q", streaminfo, 10)
+    rate = packed >> 44
+    channels = (packed >> 41 & 0x7) + 1
+    total_samples = packed & 0xFFFFFFFFF
+    return AudioInfo(
+        format="flac",
+        encoding="FLAC",
+        sample_rate=rate,
+        channels=channels,
+        duration=total_samples / rate if total_samples and rate else None,
+    )
+
+
+def _parse_ogg(data: bytes, start: int) -> Optional[AudioInfo]:
+    segment_count = data[start + 26]
+    packet = start + 27 + segment_count
+    if data[packet : packet + 8] != b"OpusHead":
+        return None
+    channels = data[packet + 9]
+    pre_skip, input_rate = struct.unpack_from("<HI", data, packet + 10)
+
+    # The granule position of the last page counts 48 kHz samples decoded
+    # up to its end, so this is the duration of the audio given.
+    duration = None
+    last_page = data.rfind(b"OggS", packet, len(data) - 10)
+    if last_page != -1:
+        (granule,) = struct.unpack_from("<q", data, last_page + 6)
+        if granule > pre_skip:
+            duration = (granule - pre_skip) / 48000
+    return AudioInfo(
+        format="opus",
+        encoding="OGG_OPUS",
+        sample_rate=input_rate if input_rate in OPUS_SAMPLE_RATES else 48000,
+        channels=channels,
+        duration=duration,
+    )
+
+
+def _parse_webm(data: bytes, start: int) -> Optional[AudioInfo]:
+    _, body, end = _read_element(data, start)
+    doc_type = b""
+    for child_id, child_body, child_end in _children(data, body, end):
+        if child_id == _EBML_DOCTYPE:
+            doc_type = data[child_body:child_end]
+    if doc_type.rstrip(b"\0") not in (b"webm", b"matroska"):
+        return None
+
+    segment_id, segment_body, segment_end = _read_element(data, end)
+    if segment_id != _SEGMENT:
+        return None
+    timecode_scale, duration, track = 1000000, None, None
+    for child_id, child_body, child_end in _children(data, segment_body, segment_end):
+        if child_id == _INFO:
+            fields = _fields(data, child_body, child_end)
+            if _TIMECODE_SCALE in fields:
+                timecode_scale = _uint(fields[_TIMECODE_SCALE])
+            if _DURATION in fields:
+                duration = _float(fields[_DURATION])
+        elif child_id == _TRACKS:
+            track = _audio_track(data, child_body, child_end)
+        elif child_id == _CLUSTER:
+            break
+    if track is None:
+        return None
+
+    codec, rate, channels = track
+    return AudioInfo(
+        format="webm",
+        encoding="WEBM_OPUS" if codec == "A_OPUS" else None,
+        sample_rate=rate if rate in OPUS_SAMPLE_RATES else 48000,
+        channels=channels,
+        duration=duration * timecode_scale / 1e9 if duration else None,
+    )
+
+
+def _audio_track(data: bytes, start: int, end: int) -> Optional[Tuple[str, int, int]]:
+    for entry_id, entry_body, entry_end in _children(data, start, end):
+        if entry_id != _TRACK_ENTRY:
+            continue
+        fields = _fields(data, entry_body, entry_end)
+        if _uint(fields.get(_TRACK_TYPE, b"")) != _AUDIO_TRACK:
+            continue
+        audio = fields.get(_AUDIO, b"")
+        settings = _fields(audio, 0, len(audio))
+        rate = settings.get(_SAMPLING_FREQUENCY)
+        return (
+            fields.get(_CODEC_ID, b"").rstrip(b"\0").decode("ascii", "replace"),
+            int(_float(rate)) if rate else 48000,
+            _uint(settings.get(_CHANNELS, b"\x01")),
+        )
+    return None
+
+
+def _read_vint(data: bytes, position: int, keep_marker: bool) -> Tuple[int, int, bool]:
+    first = data[position]
+    length = 1
+    while length <= 8 and not first & (0x80 >> (length - 1)):
+        length += 1
+    if length > 8:
+        raise ValueError("Invalid EBML variable-length integer")
+    value = first if keep_marker else first & (0xFF >> length)
+    for byte in data[position + 1 : position + length]:
+        value = value << 8 | byte
+    all_ones = value == (1 << (7 * length)) - 1
+    return value, position + length, all_ones
+
+
+def _read_element(data: bytes, position: int) -> Tuple[int, int, int]:
+    """Return the id, body start and body end of the element at ``position``."""
+    element_id, position, _ = _read_vint(data, position, keep_marker=True)
+    size, body, unknown = _read_vint(data, position, keep_marker=False)
+    end = len(data) if unknown else min(len(data), body + size)
+    return element_id, body, end
+
+
+def _children(data: bytes, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+    position = start
+    while position < end:
+        child = _read_element(data, position)
+        yield child
+        position = child[2]
+
+
+def _fields(data: bytes, start: int, end: int) -> Dict[int, bytes]:
+    return {
+        element_id: data[body:body_end]
+        for element_id, body, body_end in _children(data, start, end)
+    }
+
+
+def _uint(value: bytes) -> int:
+    return int.from_bytes(value, "big") if value else 0
+
+
+def _float(value: bytes) -> float:
+    return struct.unpack(">f" if len(value) == 4 else ">d", value)[0]
+
+
+_PARSERS: Tuple[Tuple[bytes, Callable[[bytes, int], Optional[AudioInfo]]], ...] = (
+    (b"RIFF", _parse_wav),
+    (b"fLaC", _parse_flac),
+    (b"OggS", _parse_ogg),
+    (b"\x1a\x45\xdf\xa3", _parse_webm),
+)
@@ -0,0 +1,141 @@
+import queue
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+INGRESS_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+PressureCallback = Callable[[bool], None]
+
+
+class AudioIngressBuffer:
+    """
+    Byte-budgeted FIFO between a client sending audio and the upstream
+    stream consuming it.
+
+    When the budget is full the ``policy`` decides what gives way:
+    ``drop_oldest`` discards the stalest audio so latency recovers,
+    ``drop_newest`` rejects the incoming chunk, and ``block`` makes the
+    producer wait up to ``block_timeout`` for room before rejecting it.
+    ``on_pressure(True)`` fires once when the buffered bytes reach the high
+    watermark and ``on_pressure(False)`` once they drain to the low one, so
+    the producer can be asked to pause and resume instead of losing audio.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        policy: str = "drop_oldest",
+        high_watermark: float = 0.75,
+        low_watermark: float = 0.25,
+        block_timeout: float = 1.0,
+        on_pressure: Optional[PressureCallback] = None,
+    ) -> None:
+        if policy not in INGRESS_POLICIES:
+            raise ValueError(f"Unsupported ingress policy: {policy}")
+        if not 0 <= low_watermark < high_watermark <= 1:
+            raise ValueError("Watermarks must satisfy 0 <= low < high <= 1")
+
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.high_bytes = int(max_bytes * high_watermark)
+        self.low_bytes = int(max_bytes * low_watermark)
+        self.block_timeout = block_timeout
+        self.on_pressure = on_pressure
+        self._chunks: Deque[bytes] = deque()
+        self._bytes = 0
+        self._paused = False
+        self._announced = False
+        self._closed = False
+        self._dropped_chunks = 0
+        self._dropped_bytes = 0
+        self._condition = threading.Condition()
+        self._signal_lock = threading.Lock()
+
+    def put(self, chunk: bytes) -> bool:
+        with self._condition:
+            accepted = self._admit(chunk)
+            if accepted:
+                self._chunks.append(chunk)
+                self._bytes += len(chunk)
+                self._condition.notify_all()
+            else:
+                self._dropped_chunks += 1
+                self._dropped_bytes += len(chunk)
+            self._update_pressure()
+
+        self._signal()
+        return accepted
+
+    def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Return the oldest chunk, ``None`` once the buffer is closed and
+        drained, or raise ``queue.Empty`` when nothing arrives in time.
+        """
+        with self._condition:
+            if not self._chunks and not self._closed:
+                self._condition.wait(timeout)
+            if not self._chunks:
+                if self._closed:
+                    return None
+                raise queue.Empty
+
+            chunk = self._chunks.popleft()
+            self._bytes -= len(chunk)
+            self._condition.notify_all()
+            self._update_pressure()
+
+        self._signal()
+        return chunk
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "bufferedBytes": self._bytes,
+                "bufferedChunks": len(self._chunks),
+                "droppedChunks": self._dropped_chunks,
+                "droppedBytes": self._dropped_bytes,
+            }
+
+    def _admit(self, chunk: bytes) -> bool:
+        if self._closed or len(chunk) > self.max_bytes:
+            return False
+        if self._bytes + len(chunk) <= self.max_bytes:
+            return True
+
+        if self.policy == "drop_oldest":
+            while self._bytes + len(chunk) > self.max_bytes:
+                dropped = self._chunks.popleft()
+                self._bytes -= len(dropped)
+                self._dropped_chunks += 1
+                self._dropped_bytes += len(dropped)
+            return True
+
+        if self.policy == "block":
+            self._condition.wait_for(
+                lambda: self._closed or self._bytes + len(chunk) <= self.max_bytes,
+                self.block_timeout,
+            )
+            return not self._closed and self._bytes + len(chunk) <= self.max_bytes
+
+        return False
+
+    def _update_pressure(self) -> None:
+        if not self._paused and self._bytes >= self.high_bytes:
+            self._paused = True
+        elif self._paused and self._bytes <= self.low_bytes:
+            self._paused = False
+
+    def _signal(self) -> None:
+        if self.on_pressure is None:
+            return
+        with self._signal_lock:
+            paused = self._paused
+            if paused != self._announced:
+                self._announced = paused
+                self.on_pressure(paused)
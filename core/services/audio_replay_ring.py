@@ -0,0 +1,54 @@
+from collections import deque
+from typing import Deque, List, Tuple
+
+
+class AudioReplayRing:
+    """
+    Remembers the audio sent on the current upstream recognition stream so
+    the part that has not been finalized yet can be replayed into the next
+    stream when the current one has to be rolled over.
+
+    Each chunk is appended with the duration of audio it carries, so the
+    stream's timeline covers everything sent, including trailing audio no
+    result has reached yet. The ring keeps at most ``max_bytes`` of the
+    newest chunks.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._chunks: Deque[Tuple[bytes, float]] = deque()
+        self._bytes = 0
+        self._evicted_ms = 0.0
+        self.final_end_ms = 0.0
+
+    def append(self, chunk: bytes, duration_ms: float) -> None:
+        self._chunks.append((chunk, duration_ms))
+        self._bytes += len(chunk)
+        while self._bytes > self.max_bytes and len(self._chunks) > 1:
+            evicted, evicted_ms = self._chunks.popleft()
+            self._bytes -= len(evicted)
+            self._evicted_ms += evicted_ms
+
+    def observe(self, result_end_ms: float, is_final: bool) -> None:
+        if is_final:
+            self.final_end_ms = max(self.final_end_ms, result_end_ms)
+
+    def rollover(self) -> Tuple[List[bytes], float]:
+        """
+        Start a new stream. Returns the chunks to replay into it, starting
+        with the one the last final result ends in, and how far into the old
+        stream's audio the first of them starts, in milliseconds.
+        """
+        replay: List[bytes] = []
+        offset_ms = self._evicted_ms
+        for chunk, duration_ms in self._chunks:
+            if replay or offset_ms + duration_ms > self.final_end_ms:
+                replay.append(chunk)
+            else:
+                offset_ms += duration_ms
+
+        self._chunks.clear()
+        self._bytes = 0
+        self._evicted_ms = 0.0
+        self.final_end_ms = 0.0
+        return replay, offset_ms
@@ -0,0 +1,82 @@
+import time
+from typing import Callable, List, Optional
+
+MAX_REQUEST_AUDIO_BYTES = 25600
+
+_COMPRESSED_BYTES_PER_SECOND = {
+    "WEBM_OPUS": 4000,
+    "OGG_OPUS": 4000,
+    "AMR": 1600,
+    "AMR_WB": 3000,
+}
+
+
+def audio_bytes_per_second(encoding: str, sample_rate_hertz: int) -> int:
+    """
+    Approximate byte rate of ``encoding`` audio. Compressed formats use a
+    typical bitrate, FLAC half of its PCM rate.
+    """
+    bytes_per_second = _COMPRESSED_BYTES_PER_SECOND.get(encoding)
+    if bytes_per_second is None:
+        bytes_per_second = sample_rate_hertz * 2
+        if encoding == "FLAC":
+            bytes_per_second //= 2
+    return bytes_per_second
+
+
+def frame_target_bytes(encoding: str, sample_rate_hertz: int, target_ms: int) -> int:
+    """Bytes of ``encoding`` audio that cover about ``target_ms``."""
+    target = audio_bytes_per_second(encoding, sample_rate_hertz) * target_ms // 1000
+    return max(1, min(target, MAX_REQUEST_AUDIO_BYTES))
+
+
+class FrameAggregator:
+    """
+    Re-frames audio chunks of any size into requests of ``target_bytes``.
+
+    Small chunks are coalesced and large ones split, so the upstream sees a
+    steady request cadence whatever the client's chunking. A partial frame
+    is due for flushing ``max_delay`` seconds after its first byte arrived,
+    which bounds the latency coalescing adds when audio trickles in.
+    """
+
+    def __init__(
+        self,
+        target_bytes: int,
+        max_delay: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.target_bytes = target_bytes
+        self.max_delay = max_delay
+        self.clock = clock
+        self._buffer = bytearray()
+        self._first_at: Optional[float] = None
+
+    def push(self, chunk: bytes) -> List[bytes]:
+        if not self._buffer and len(chunk) == self.target_bytes:
+            return [chunk]
+
+        if not self._buffer:
+            self._first_at = self.clock()
+        self._buffer += chunk
+
+        frames = []
+        while len(self._buffer) >= self.target_bytes:
+            frames.append(bytes(self._buffer[: self.target_bytes]))
+            del self._buffer[: self.target_bytes]
+        if frames:
+            self._first_at = self.clock() if self._buffer else None
+        return frames
+
+    def flush_at(self) -> Optional[float]:
+        if self._first_at is None:
+            return None
+        return self._first_at + self.max_delay
+
+    def flush(self) -> Optional[bytes]:
+        if not self._buffer:
+            return None
+        frame = bytes(self._buffer)
+        self._buffer.clear()
+        self._first_at = None
+        return frame
@@ -0,0 +1,86 @@
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class InterimResultThrottle:
+    """
+    Decides which streaming results are worth sending to a client.
+
+    Final results always pass. Interim results that arrive sooner than
+    ``1 / max_rate`` seconds after the last one sent (0 disables the limit)
+    are held back; the latest of them is returned by ``flush`` once
+    ``flush_delay`` has passed, unless another result replaces it first.
+    Interim results that change fewer than ``min_change`` characters of the
+    last one sent are dropped. With
+    ``delta`` enabled an interim result carries only what changed: the
+    client keeps the first ``offset`` characters of the previous interim
+    transcript and appends ``text``.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = 10.0,
+        min_change: int = 1,
+        delta: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.min_change = min_change
+        self.delta = delta
+        self.clock = clock
+        self._last_transcript = ""
+        self._last_sent_at: Optional[float] = None
+        self._pending: Optional[Dict[str, Any]] = None
+
+    def filter(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        result_type = result.get("type")
+        if result_type == "final_result":
+            self._last_transcript = ""
+            self._last_sent_at = None
+            self._pending = None
+            return result
+        if result_type != "interim_result":
+            return result
+
+        now = self.clock()
+        if (
+            self._last_sent_at is not None
+            and now - self._last_sent_at < self.min_interval
+        ):
+            self._pending = result
+            return None
+        self._pending = None
+        return self._send(result, now)
+
+    def flush_delay(self) -> Optional[float]:
+        """Seconds until the held back interim result is due, or None."""
+        if self._pending is None:
+            return None
+        return max(0.0, self._last_sent_at + self.min_interval - self.clock())
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Return the held back interim result if it still changes enough."""
+        result, self._pending = self._pending, None
+        if result is None:
+            return None
+        return self._send(result, self.clock())
+
+    def _send(self, result: Dict[str, Any], now: float) -> Optional[Dict[str, Any]]:
+        transcript = result.get("transcript", "")
+        previous = self._last_transcript
+        offset = len(os.path.commonprefix([previous, transcript]))
+        changed = (len(previous) - offset) + (len(transcript) - offset)
+        if changed < self.min_change:
+            return None
+
+        self._last_transcript = transcript
+        self._last_sent_at = now
+        if not self.delta:
+            return result
+
+        delta_result = {
+            key: value for key, value in result.items() if key != "transcript"
+        }
+        delta_result["delta"] = {"offset": offset, "text": transcript[offset:]}
+        return delta_result
@@ -0,0 +1,71 @@
+import queue
+import threading
+import zlib
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional
+
+
+class OrderedDispatcher:
+    """
+    Runs blocking calls, such as Socket.IO emits that publish to a message
+    queue, on a fixed set of worker threads instead of the caller's thread.
+
+    Calls submitted under the same key always run on the same worker, so
+    they happen in the order they were submitted; different keys spread
+    over the workers and do not wait on each other.
+    """
+
+    def __init__(self, workers: int = 4, name: str = "dispatcher") -> None:
+        self.name = name
+        self._worker_count = max(1, workers)
+        self._queues: List["queue.SimpleQueue[Any]"] = []
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._queues:
+                return
+            for index in range(self._worker_count):
+                calls: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+                thread = threading.Thread(
+                    target=self._run,
+                    args=(calls,),
+                    name=f"{self.name}-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._queues.append(calls)
+                self._threads.append(thread)
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any) -> "Future[Any]":
+        if not self._queues:
+            self.start()
+        queues = self._queues
+        future: "Future[Any]" = Future()
+        queues[zlib.crc32(key.encode("utf-8")) % len(queues)].put((future, fn, args))
+        return future
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Run the calls already submitted, then stop the workers."""
+        with self._lock:
+            queues, threads = self._queues, self._threads
+            self._queues, self._threads = [], []
+        for calls in queues:
+            calls.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    @staticmethod
+    def _run(calls: "queue.SimpleQueue[Any]") -> None:
+        while True:
+            item = calls.get()
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
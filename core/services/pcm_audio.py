@@ -0,0 +1,89 @@
+import io
+import wave
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.domain.exceptions import STTValidationError
+from core.services.resampler import Resampler, to_int16
+
+try:
+    import soundfile
+except ImportError:  # FLAC decoding is optional
+    soundfile = None
+
+DECODABLE_FORMATS = ("wav", "flac")
+
+
+@dataclass
+class PcmAudio:
+    """Mono 16-bit PCM samples."""
+
+    samples: np.ndarray
+    sample_rate: int
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    def slice(self, start: int, end: int) -> "PcmAudio":
+        return PcmAudio(self.samples[start:end], self.sample_rate)
+
+    def resampled(self, sample_rate: int) -> "PcmAudio":
+        if sample_rate == self.sample_rate:
+            return self
+        resampler = Resampler(self.sample_rate, sample_rate)
+        samples = np.concatenate((resampler.process(self.samples), resampler.flush()))
+        return PcmAudio(to_int16(samples), sample_rate)
+
+    def to_linear16(self) -> bytes:
+        return self.samples.astype("<i2", copy=False).tobytes()
+
+
+def decode_pcm(audio: bytes, audio_format: str, sample_rate: int) -> PcmAudio:
+    """
+    Decode WAV, headerless LINEAR16 (``wav`` without a RIFF header, read at
+    ``sample_rate``) or FLAC (needs ``soundfile``) into mono samples.
+    """
+    audio_format = audio_format.lower()
+    if audio_format == "wav":
+        if audio[:4] == b"RIFF":
+            return _decode_wav(audio)
+        samples = np.frombuffer(audio[: len(audio) // 2 * 2], dtype="<i2")
+        return PcmAudio(samples, sample_rate)
+
+    if audio_format == "flac":
+        if soundfile is None:
+            raise STTValidationError("FLAC decoding requires the soundfile package")
+        try:
+            samples, rate = soundfile.read(
+                io.BytesIO(audio), dtype="int16", always_2d=True
+            )
+        except RuntimeError as e:
+            raise STTValidationError(f"Invalid FLAC audio: {e}")
+        return PcmAudio(_downmix(samples), rate)
+
+    raise STTValidationError(f"Cannot decode {audio_format} audio")
+
+
+def _decode_wav(audio: bytes) -> PcmAudio:
+    try:
+        with wave.open(io.BytesIO(audio)) as wav:
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise STTValidationError(f"Invalid WAV audio: {e}")
+
+    if width != 2:
+        raise STTValidationError("Only 16-bit WAV audio can be decoded")
+    samples = np.frombuffer(frames[: len(frames) // 2 * 2], dtype="<i2")
+    samples = samples[: len(samples) // channels * channels]
+    return PcmAudio(_downmix(samples.reshape(-1, channels)), rate)
+
+
+def _downmix(samples: np.ndarray) -> np.ndarray:
+    if samples.shape[1] == 1:
+        return samples[:, 0]
+    return samples.mean(axis=1).astype(np.int16)
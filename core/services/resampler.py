@@ -0,0 +1,121 @@
+import math
+import threading
+
+import numpy as np
+
+
+class Resampler:
+    """
+    Polyphase FIR resampler for mono audio, fed in chunks of any size.
+
+    The rate ratio is reduced to ``up / down`` and a Kaiser-windowed sinc
+    low-pass, ``half_taps`` zero crossings either side, is split into ``up``
+    phases so each output sample costs one short dot product instead of
+    filtering the zero-stuffed signal. Input history is carried between
+    calls, so chunked output matches resampling the whole signal at once.
+    """
+
+    BLOCK = 4096
+
+    def __init__(
+        self, from_rate: int, to_rate: int, half_taps: int = 10, beta: float = 8.0
+    ) -> None:
+        divisor = math.gcd(from_rate, to_rate)
+        self.up = to_rate // divisor
+        self.down = from_rate // divisor
+        ratio = max(self.up, self.down)
+        self.delay = half_taps * ratio
+
+        t = np.arange(-self.delay, self.delay + 1)
+        taps = np.sinc(t / ratio) * np.kaiser(len(t), beta) * (self.up / ratio)
+        phase_taps = -(-len(taps) // self.up)
+        padded = np.zeros(phase_taps * self.up)
+        padded[: len(taps)] = taps
+        # _phases[p, k] is tap p + k * up, applied to input sample base - k.
+        self._phases = padded.reshape(phase_taps, self.up).T.astype(np.float32)
+        self._taps = phase_taps
+
+        self._history = np.zeros(phase_taps - 1, dtype=np.float32)
+        self._consumed = 0
+        self._next_output = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Return every output sample that ``samples`` completes."""
+        buffer = np.concatenate((self._history, samples.astype(np.float32)))
+        start = self._consumed - len(self._history)
+        self._consumed += len(samples)
+
+        last = self._consumed - 1
+        count = 0
+        if last >= 0:
+            count = max(0, (last * self.up - self.delay) // self.down + 1)
+            count -= self._next_output
+        output = self._compute(buffer, start, self._next_output, count)
+        self._next_output += count
+
+        keep_from = (
+            (self._next_output * self.down + self.delay) // self.up - self._taps + 1
+        )
+        self._history = buffer[max(0, keep_from - start) :]
+        return output
+
+    def flush(self) -> np.ndarray:
+        """Return the outputs still owed for the input given so far."""
+        total = -(-self._consumed * self.up // self.down)
+        if total <= self._next_output:
+            return np.zeros(0, dtype=np.float32)
+        tail = np.zeros(self.delay // self.up + 1, dtype=np.float32)
+        start = self._consumed - len(self._history)
+        buffer = np.concatenate((self._history, tail))
+        output = self._compute(
+            buffer, start, self._next_output, total - self._next_output
+        )
+        self._next_output = total
+        return output
+
+    def _compute(
+        self, buffer: np.ndarray, start: int, first: int, count: int
+    ) -> np.ndarray:
+        output = np.empty(count, dtype=np.float32)
+        offsets = np.arange(self._taps)
+        for block in range(0, count, self.BLOCK):
+            n = np.arange(first + block, first + min(count, block + self.BLOCK))
+            position = n * self.down + self.delay
+            base = position // self.up - start
+            indices = base[:, None] - offsets[None, :]
+            valid = indices >= 0
+            window = np.where(valid, buffer[np.clip(indices, 0, None)], 0.0)
+            output[block : block + len(n)] = np.einsum(
+                "nk,nk->n", self._phases[position % self.up], window
+            )
+        return output
+
+
+def to_int16(samples: np.ndarray) -> np.ndarray:
+    return np.clip(np.rint(samples), -32768, 32767).astype(np.int16)
+
+
+class PcmStreamConverter:
+    """
+    Downmixes and resamples a stream of interleaved LINEAR16 chunks. Bytes
+    of an incomplete frame are held back until the next chunk.
+    """
+
+    def __init__(self, channels: int, from_rate: int, to_rate: int) -> None:
+        self.channels = max(1, channels)
+        self.frame_bytes = 2 * self.channels
+        self.resampler = Resampler(from_rate, to_rate) if from_rate != to_rate else None
+        self._remainder = b""
+        self._lock = threading.Lock()
+
+    def convert(self, chunk: bytes) -> bytes:
+        with self._lock:
+            data = self._remainder + chunk
+            usable = len(data) // self.frame_bytes * self.frame_bytes
+            self._remainder = data[usable:]
+            frames = np.frombuffer(data[:usable], dtype="<i2")
+            if self.channels > 1:
+                frames = frames.reshape(-1, self.channels).mean(axis=1)
+            if self.resampler is not None:
+                frames = self.resampler.process(frames)
+            return to_int16(frames).astype("<i2").tobytes()
@@ -0,0 +1,79 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from core.services.pcm_audio import PcmAudio
+
+
+class SilenceSegmenter:
+    """
+    Splits long audio into segments of at most ``max_segment_seconds``,
+    cutting inside pauses so no word is split in two.
+
+    The energy of every ``frame_ms`` frame is computed in one vectorized
+    pass; frames quieter than ``silence_db`` dBFS count as silence. Each cut
+    goes in the middle of the longest pause of at least ``min_silence_ms``
+    found in the second half of the allowed window, falling back to its
+    quietest frame when the speaker never pauses.
+    """
+
+    def __init__(
+        self,
+        max_segment_seconds: float = 50.0,
+        min_silence_ms: int = 300,
+        silence_db: float = -40.0,
+        frame_ms: int = 20,
+    ) -> None:
+        self.max_segment_seconds = max_segment_seconds
+        self.min_silence_ms = min_silence_ms
+        self.silence_db = silence_db
+        self.frame_ms = frame_ms
+
+    def segments(self, audio: PcmAudio) -> List[Tuple[int, int]]:
+        """Return ``(start, end)`` sample ranges covering the whole audio."""
+        total = len(audio.samples)
+        frame = max(1, audio.sample_rate * self.frame_ms // 1000)
+        max_frames = max(2, int(self.max_segment_seconds * 1000 // self.frame_ms))
+        if total <= max_frames * frame:
+            return [(0, total)] if total else []
+
+        energy_db = self.frame_energy_db(audio.samples, frame)
+        silent = energy_db < self.silence_db
+        min_run = max(1, self.min_silence_ms // self.frame_ms)
+
+        cuts = [0]
+        start = 0
+        frame_count = len(energy_db)
+        while frame_count - start > max_frames:
+            window_start = start + max_frames // 2
+            window_end = start + max_frames
+            cut = self._pause_center(silent[window_start:window_end], min_run)
+            if cut is None:
+                cut = int(np.argmin(energy_db[window_start:window_end]))
+            start = window_start + cut
+            cuts.append(start)
+
+        bounds = [cut * frame for cut in cuts] + [total]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    @staticmethod
+    def frame_energy_db(samples: np.ndarray, frame: int) -> np.ndarray:
+        count = -(-len(samples) // frame)
+        padded = np.zeros(count * frame, dtype=np.float32)
+        padded[: len(samples)] = samples
+        frames = padded.reshape(count, frame) / 32768.0
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        return 20 * np.log10(np.maximum(rms, 1e-10))
+
+    @staticmethod
+    def _pause_center(silent: np.ndarray, min_run: int):
+        edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        if not len(starts):
+            return None
+        lengths = ends - starts
+        longest = int(np.argmax(lengths))
+        if lengths[longest] < min_run:
+            return None
+        return int((starts[longest] + ends[longest]) // 2)
@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    def __init__(self, future: "Future[T]") -> None:
+        self.future = future
+        self.waiters = 1
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls that share a key into one upstream execution.
+
+    The first caller for a key submits the call to a bounded worker pool and
+    every caller, including the first, waits on the same future. A result or
+    exception is fanned out to all waiters. A waiter that times out detaches
+    from the flight; when the last waiter leaves, a call that has not started
+    yet is cancelled and the key is forgotten so the next caller starts fresh.
+    """
+
+    def __init__(self, max_workers: int = 64, timeout: Optional[float] = None) -> None:
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="single-flight"
+        )
+        self._flights: Dict[str, _Flight[T]] = {}
+        self._lock = threading.RLock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = _Flight(self._executor.submit(fn))
+                self._flights[key] = flight
+                flight.future.add_done_callback(
+                    lambda _future, k=key, f=flight: self._land(k, f)
+                )
+            else:
+                flight.waiters += 1
+
+        try:
+            return flight.future.result(timeout=self.timeout)
+        except FutureTimeoutError as timeout_error:
+            self._detach(key, flight)
+            raise TimeoutError(
+                f"Upstream call did not complete within {self.timeout}s"
+            ) from timeout_error
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def _land(self, key: str, flight: _Flight[T]) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _detach(self, key: str, flight: _Flight[T]) -> None:
+        with self._lock:
+            flight.waiters -= 1
+            if flight.waiters > 0:
+                return
+            flight.future.cancel()
+            if self._flights.get(key) is flight:
+                del self._flights[key]
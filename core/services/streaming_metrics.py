@@ -0,0 +1,91 @@
+import bisect
+import threading
+from typing import Any, Dict, Sequence
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BACKLOG_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+DEPTH_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+class Histogram:
+    """
+    Thread-safe fixed-bucket histogram. Quantiles are estimated by linear
+    interpolation inside the bucket they fall in, so they are only as fine
+    as the bucket bounds.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts, count, total = list(self._counts), self._count, self._sum
+
+        cumulative, buckets = 0, []
+        for bound, bucket_count in zip(self.bounds, counts):
+            cumulative += bucket_count
+            buckets.append({"le": bound, "count": cumulative})
+        buckets.append({"le": "+Inf", "count": count})
+        return {
+            "count": count,
+            "sum": total,
+            "buckets": buckets,
+            "p50": self._quantile(counts, count, 0.5),
+            "p95": self._quantile(counts, count, 0.95),
+            "p99": self._quantile(counts, count, 0.99),
+        }
+
+    def _quantile(self, counts, count: int, q: float):
+        if not count:
+            return None
+        rank = q * count
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.bounds[-1]
+
+
+class StreamingMetrics:
+    """
+    Latency and backlog histograms of the streaming recognition path,
+    aggregated over all sessions of the process. Latencies are in seconds.
+    """
+
+    HISTOGRAMS = {
+        "configToUpstreamOpenSeconds": LATENCY_BUCKETS,
+        "firstAudioToFirstResultSeconds": LATENCY_BUCKETS,
+        "endOfSpeechToFinalSeconds": LATENCY_BUCKETS,
+        "emitSeconds": LATENCY_BUCKETS,
+        "ingressBacklogSeconds": BACKLOG_BUCKETS,
+        "ingressQueueDepthChunks": DEPTH_BUCKETS,
+    }
+
+    def __init__(self) -> None:
+        self._histograms = {
+            name: Histogram(buckets) for name, buckets in self.HISTOGRAMS.items()
+        }
+
+    def observe(self, name: str, value: float) -> None:
+        self._histograms[name].observe(value)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: histogram.snapshot() for name, histogram in self._histograms.items()
+        }
@@ -1,19 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
 from core.domain.exceptions import STTProcessingError, STTValidationError
-from core.domain.stt_model import STTRequest, STTResponse
+from core.domain.stt_model import (
+    NO_SPEECH_DETECTED,
+    STTRequest,
+    STTResponse,
+    WordTimestamp,
+)
 from core.interfaces.google_stt_client_interface import GoogleSTTClientInterface
 from core.interfaces.stt_domain_service_interface import STTDomainServiceInterface
+from core.interfaces.voice_activity_detector_interface import (
+    VoiceActivityDetectorInterface,
+)
+from core.services.audio_header import probe_audio
+from core.services.pcm_audio import DECODABLE_FORMATS, PcmAudio, decode_pcm
+from core.services.silence_segmenter import SilenceSegmenter
+from core.services.single_flight import SingleFlight
+from core.services.voice_activity import TimeMap, compress_silence
 
 
 class STTDomainService(STTDomainServiceInterface):
-    def __init__(self, google_client: GoogleSTTClientInterface) -> None:
+    def __init__(
+        self,
+        google_client: GoogleSTTClientInterface,
+        single_flight: Optional[SingleFlight[STTResponse]] = None,
+        segmenter: Optional[SilenceSegmenter] = None,
+        segment_parallelism: int = 8,
+        target_sample_rate: int = 16000,
+        voice_activity_detector: Optional[VoiceActivityDetectorInterface] = None,
+        vad_hangover_ms: int = 300,
+        vad_max_pause_ms: int = 500,
+        probe_headers: bool = True,
+        sync_max_seconds: float = 60.0,
+    ) -> None:
         self.google_client = google_client
+        self.single_flight = single_flight or SingleFlight()
+        self.segmenter = segmenter or SilenceSegmenter()
+        self.segment_parallelism = segment_parallelism
+        self.target_sample_rate = target_sample_rate
+        self.voice_activity_detector = voice_activity_detector
+        self.vad_hangover_ms = vad_hangover_ms
+        self.vad_max_pause_ms = vad_max_pause_ms
+        self.probe_headers = probe_headers
+        self.sync_max_seconds = sync_max_seconds
 
     def process_stt_request(self, request: STTRequest) -> STTResponse:
         try:
 
+            if self.probe_headers:
+                request = self._apply_audio_header(request)
             self._validate_request(request)
 
-            response = self.google_client.transcribe_speech(request)
+            transcribe = self._transcribe
+            if request.long_audio:
+                transcribe = self._transcribe_long
+
+            response = self.single_flight.do(
+                request.cache_key(), lambda: transcribe(request)
+            )
 
             if not response.success and response.error_message:
 
@@ -50,8 +96,207 @@ class STTDomainService(STTDomainServiceInterface):
                 error_message=f"System error during STT processing: {str(system_error)}",
             )
 
+    def _apply_audio_header(self, request: STTRequest) -> STTRequest:
+        """
+        Replace the declared format, rate and channel count with what the
+        audio header says, and send audio too long for a synchronous call
+        through long audio mode.
+        """
+        info = probe_audio(request.audio_data)
+        if info is None or info.encoding is None:
+            return request
+
+        sample_rate = request.sample_rate
+        if 8000 <= info.sample_rate <= 48000:
+            sample_rate = info.sample_rate
+        request = replace(
+            request,
+            format=info.format,
+            sample_rate=sample_rate,
+            audio_channel_count=info.channels,
+        )
+
+        too_long = (
+            self.sync_max_seconds
+            and info.duration is not None
+            and info.duration > self.sync_max_seconds
+        )
+        if too_long and not request.long_audio:
+            if info.format not in DECODABLE_FORMATS:
+                raise STTValidationError(
+                    f"Audio is {info.duration:.0f} s long; {info.format} audio "
+                    f"longer than {self.sync_max_seconds:.0f} s is not supported"
+                )
+            request = replace(request, long_audio=True)
+        return request
+
+    def _transcribe(self, request: STTRequest) -> STTResponse:
+        if request.format.lower() == "wav" and self.voice_activity_detector:
+            return self._transcribe_speech_only(request)
+        if request.format.lower() == "wav" and self.target_sample_rate:
+            request = self._preprocess_linear16(request)
+        return self.google_client.transcribe_speech(request)
+
+    def _transcribe_speech_only(self, request: STTRequest) -> STTResponse:
+        audio = self._downsample(
+            decode_pcm(request.audio_data, "wav", request.sample_rate)
+        )
+        audio, time_map = self._drop_silence(audio)
+        if not len(audio.samples):
+            return self._no_speech()
+
+        response = self.google_client.transcribe_speech(
+            replace(
+                request,
+                audio_data=audio.to_linear16(),
+                sample_rate=audio.sample_rate,
+                audio_channel_count=1,
+            )
+        )
+        return self._remap_words(response, time_map)
+
+    def _preprocess_linear16(self, request: STTRequest) -> STTRequest:
+        """
+        Send WAV files and PCM above the target rate as headerless mono
+        LINEAR16 at the target rate; other PCM is passed through untouched.
+        """
+        is_wav_file = request.audio_data[:4] == b"RIFF"
+        if not is_wav_file and request.sample_rate <= self.target_sample_rate:
+            return request
+        audio = self._downsample(
+            decode_pcm(request.audio_data, "wav", request.sample_rate)
+        )
+        return replace(
+            request,
+            audio_data=audio.to_linear16(),
+            sample_rate=audio.sample_rate,
+            audio_channel_count=1,
+        )
+
+    def _transcribe_long(self, request: STTRequest) -> STTResponse:
+        audio = self._downsample(
+            decode_pcm(request.audio_data, request.format, request.sample_rate)
+        )
+        time_map = None
+        if self.voice_activity_detector:
+            audio, time_map = self._drop_silence(audio)
+            if not len(audio.samples):
+                return self._no_speech()
+
+        bounds = self.segmenter.segments(audio)
+        if not bounds:
+            raise STTValidationError("Audio data cannot be empty")
+
+        segments = [audio.slice(start, end) for start, end in bounds]
+        with ThreadPoolExecutor(
+            max_workers=min(self.segment_parallelism, len(segments)),
+            thread_name_prefix="stt-segment",
+        ) as executor:
+            responses = list(
+                executor.map(
+                    lambda segment: self._transcribe_segment(request, segment),
+                    segments,
+                )
+            )
+
+        response = self._merge_segments(
+            responses, [start / audio.sample_rate for start, _ in bounds]
+        )
+        return self._remap_words(response, time_map)
+
+    def _transcribe_segment(
+        self, request: STTRequest, segment: PcmAudio
+    ) -> Optional[STTResponse]:
+        segment_request = STTRequest(
+            audio_data=segment.to_linear16(),
+            format="wav",
+            language=request.language,
+            enable_word_timestamps=request.enable_word_timestamps,
+            sample_rate=segment.sample_rate,
+            enable_automatic_punctuation=request.enable_automatic_punctuation,
+            model=request.model,
+        )
+        response = self.google_client.transcribe_speech(segment_request)
+        if response.success:
+            return response
+        if response.error_message == NO_SPEECH_DETECTED:
+            return None
+        raise STTProcessingError(
+            f"Segment transcription failed: {response.error_message}"
+        )
+
+    def _downsample(self, audio: PcmAudio) -> PcmAudio:
+        if self.target_sample_rate and audio.sample_rate > self.target_sample_rate:
+            return audio.resampled(self.target_sample_rate)
+        return audio
+
+    def _drop_silence(self, audio: PcmAudio) -> Tuple[PcmAudio, TimeMap]:
+        return compress_silence(
+            audio,
+            self.voice_activity_detector,
+            hangover_ms=self.vad_hangover_ms,
+            max_pause_ms=self.vad_max_pause_ms,
+        )
+
+    @staticmethod
+    def _remap_words(response: STTResponse, time_map: Optional[TimeMap]) -> STTResponse:
+        if time_map is None or not response.word_timestamps:
+            return response
+        return replace(
+            response,
+            word_timestamps=[
+                WordTimestamp(
+                    word=word.word,
+                    start_time=time_map.original(word.start_time),
+                    end_time=time_map.original(word.end_time),
+                )
+                for word in response.word_timestamps
+            ],
+        )
+
+    @staticmethod
+    def _no_speech() -> STTResponse:
+        return STTResponse(
+            transcription="",
+            confidence=0.0,
+            success=False,
+            error_message=NO_SPEECH_DETECTED,
+        )
+
+    @staticmethod
+    def _merge_segments(
+        responses: List[Optional[STTResponse]], offsets: List[float]
+    ) -> STTResponse:
+        transcripts, words = [], []
+        weighted_confidence, characters = 0.0, 0
+        for response, offset in zip(responses, offsets):
+            if response is None:
+                continue
+            transcripts.append(response.transcription.strip())
+            weighted_confidence += response.confidence * len(response.transcription)
+            characters += len(response.transcription)
+            for word in response.word_timestamps or []:
+                words.append(
+                    WordTimestamp(
+                        word=word.word,
+                        start_time=word.start_time + offset,
+                        end_time=word.end_time + offset,
+                    )
+                )
+
+        if not transcripts:
+            return STTDomainService._no_speech()
+
+        transcription = " ".join(transcripts)
+        return STTResponse(
+            transcription=transcription,
+            confidence=min(1.0, weighted_confidence / max(1, characters)),
+            success=True,
+            word_timestamps=words or None,
+        )
+
     def _validate_request(self, request: STTRequest) -> None:
-        if not request.audio_data.strip():
+        if not request.audio_data:
             raise STTValidationError("Audio data cannot be empty")
 
         if request.format.lower() not in ["webm", "wav", "mp3", "flac", "opus"]:
@@ -65,3 +310,8 @@ class STTDomainService(STTDomainServiceInterface):
 
         if request.model not in ["latest_long", "latest_short", "phone_call", "video"]:
             raise STTValidationError(f"Unsupported recognition model: {request.model}")
+
+        if request.long_audio and request.format.lower() not in DECODABLE_FORMATS:
+            raise STTValidationError(
+                f"Long audio mode supports {', '.join(DECODABLE_FORMATS)} audio only"
+            )
@@ -0,0 +1,42 @@
+from typing import Optional
+
+from core.services.stt_streaming_session_manager import STTStreamingSession
+
+
+class STTSessionLifecycle:
+    """
+    Decides when a configured streaming session has to be stopped.
+
+    A stream expires ``max_duration`` seconds after it was configured, when
+    no audio arrived within ``no_audio_timeout`` seconds of configuring it,
+    or when the client sent nothing for ``idle_timeout`` seconds. A timeout
+    of 0 is disabled.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = 30.0,
+        max_duration: float = 14400.0,
+        no_audio_timeout: float = 10.0,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_duration = max_duration
+        self.no_audio_timeout = no_audio_timeout
+
+    def expiry_reason(self, session: STTStreamingSession, now: float) -> Optional[str]:
+        configured_at = session.configured_at
+        if not session.configured or configured_at is None:
+            return None
+
+        if self.max_duration and now - configured_at >= self.max_duration:
+            return "max_duration"
+
+        last_audio_at = session.last_audio_at
+        if last_audio_at is None:
+            if self.no_audio_timeout and now - configured_at >= self.no_audio_timeout:
+                return "no_audio"
+            return None
+
+        if self.idle_timeout and now - last_audio_at >= self.idle_timeout:
+            return "idle_timeout"
+        return None
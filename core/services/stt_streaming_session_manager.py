@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from core.domain.exceptions import STTSessionLimitError
+from core.services.interim_throttle import InterimResultThrottle
+from core.interfaces.google_stt_streaming_client_interface import (
+    GoogleSTTStreamingClientInterface,
+)
+
+StreamingClientFactory = Callable[[], GoogleSTTStreamingClientInterface]
+
+
+class STTStreamingSession:
+    def __init__(
+        self, session_id: str, client: GoogleSTTStreamingClientInterface
+    ) -> None:
+        self.session_id = session_id
+        self.client = client
+        self.configured = False
+        self.streaming = False
+        self.task: Optional[Future] = None
+        self.interim_throttle: Optional[InterimResultThrottle] = None
+        self.created_at = time.time()
+        self.configured_at: Optional[float] = None
+        self.last_audio_at: Optional[float] = None
+
+
+class STTStreamingSessionManager:
+    """
+    Thread-safe registry giving every streaming connection its own recognizer.
+
+    Each session owns a client, and with it its own config, audio queue and
+    stop signal, so sessions never see each other's audio and stopping one
+    leaves the rest running. ``max_sessions`` caps how many may be open at once.
+    """
+
+    def __init__(
+        self, client_factory: StreamingClientFactory, max_sessions: int = 100
+    ) -> None:
+        self.client_factory = client_factory
+        self.max_sessions = max_sessions
+        self._sessions: Dict[str, STTStreamingSession] = {}
+        self._lock = threading.Lock()
+
+    def open(self, session_id: str) -> STTStreamingSession:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                return session
+            if len(self._sessions) >= self.max_sessions:
+                raise STTSessionLimitError(
+                    f"Streaming session limit of {self.max_sessions} reached"
+                )
+            session = STTStreamingSession(session_id, self.client_factory())
+            self._sessions[session_id] = session
+            return session
+
+    def get(self, session_id: str) -> Optional[STTStreamingSession]:
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def reset(self, session_id: str) -> Optional[STTStreamingSession]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            previous_client = session.client
+            self._replace_client(session)
+        previous_client.stop_streaming()
+        return session
+
+    def expire(
+        self, session_id: str, client: GoogleSTTStreamingClientInterface
+    ) -> bool:
+        """
+        Stop the session's stream and leave it unconfigured, unless its
+        client is no longer ``client`` because it was reconfigured meanwhile.
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session.client is not client:
+                return False
+            task = session.task
+            self._replace_client(session)
+        client.stop_streaming()
+        if task is not None:
+            task.cancel()
+        return True
+
+    def close(self, session_id: str) -> Optional[STTStreamingSession]:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._shutdown(session)
+        return session
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            self._shutdown(session)
+
+    def _replace_client(self, session: STTStreamingSession) -> None:
+        session.client = self.client_factory()
+        session.configured = False
+        session.streaming = False
+        session.task = None
+        session.configured_at = None
+        session.last_audio_at = None
+
+    @staticmethod
+    def _shutdown(session: STTStreamingSession) -> None:
+        session.client.stop_streaming()
+        if session.task is not None:
+            session.task.cancel()
+
+    def sessions(self) -> List[STTStreamingSession]:
+        with self._lock:
+            return list(self._sessions.values())
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._sessions)
@@ -0,0 +1,75 @@
+import re
+from typing import Iterator, List
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;…。！？])\s+|\n\s*\n")
+_CLAUSE_END = re.compile(r"(?<=[,:、，])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _byte_length(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _hard_split(text: str, max_bytes: int) -> Iterator[str]:
+    encoded = text.encode("utf-8")
+    start = 0
+    while start < len(encoded):
+        end = min(start + max_bytes, len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        yield encoded[start:end].decode("utf-8")
+        start = end
+
+
+def _pack(pieces: List[str], separator: str, max_bytes: int) -> Iterator[str]:
+    current = ""
+    for piece in pieces:
+        candidate = f"{current}{separator}{piece}" if current else piece
+        if _byte_length(candidate) <= max_bytes:
+            current = candidate
+            continue
+        if current:
+            yield current
+        current = piece
+    if current:
+        yield current
+
+
+def _split_oversized(sentence: str, max_bytes: int) -> Iterator[str]:
+    if _byte_length(sentence) <= max_bytes:
+        yield sentence
+        return
+
+    for pattern in (_CLAUSE_END, _WHITESPACE):
+        pieces = [piece for piece in pattern.split(sentence) if piece]
+        if len(pieces) > 1:
+            for packed in _pack(pieces, " ", max_bytes):
+                yield from _split_oversized(packed, max_bytes)
+            return
+
+    yield from _hard_split(sentence, max_bytes)
+
+
+def split_sentences(text: str, max_bytes: int) -> List[str]:
+    """
+    Split text into sentences, each at most ``max_bytes`` of UTF-8.
+
+    Sentences longer than the limit fall back to clause, then word, then
+    character boundaries, so a multi-byte character is never cut in half.
+    """
+    sentences = [s.strip() for s in _SENTENCE_END.split(text) if s and s.strip()]
+    return [
+        piece
+        for sentence in sentences
+        for piece in _split_oversized(sentence, max_bytes)
+    ]
+
+
+def split_text(text: str, max_bytes: int) -> List[str]:
+    """
+    Split text into as few chunks of at most ``max_bytes`` of UTF-8 as
+    possible, breaking only between sentences where the text allows it.
+    """
+    if _byte_length(text) <= max_bytes:
+        return [text]
+    return list(_pack(split_sentences(text, max_bytes), " ", max_bytes))
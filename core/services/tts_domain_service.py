@@ -1,32 +1,50 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
 from core.domain.exceptions import TTSProcessingError, TTSValidationError
-from core.domain.tts_model import TTSRequest, TTSResponse
+from core.domain.tts_model import MAX_TEXT_LENGTH, TTSRequest, TTSResponse
 from core.interfaces.google_tts_client_interface import GoogleTTSClientInterface
 from core.interfaces.tts_domain_service_interface import TTSDomainServiceInterface
+from core.interfaces.voice_catalog_interface import VoiceCatalogInterface
+from core.services.audio_concat import join_audio, stream_segment
+from core.services.single_flight import SingleFlight
+from core.services.text_chunker import split_sentences, split_text
 
 
 class TTSDomainService(TTSDomainServiceInterface):
-    def __init__(self, google_client: GoogleTTSClientInterface) -> None:
+    def __init__(
+        self,
+        google_client: GoogleTTSClientInterface,
+        single_flight: Optional[SingleFlight[TTSResponse]] = None,
+        chunk_max_bytes: int = 5000,
+        chunk_parallelism: int = 4,
+        batch_parallelism: int = 8,
+        voice_catalog: Optional[VoiceCatalogInterface] = None,
+    ) -> None:
         self.google_client = google_client
+        self.single_flight = single_flight or SingleFlight()
+        self.chunk_max_bytes = chunk_max_bytes
+        self.chunk_parallelism = chunk_parallelism
+        self.batch_parallelism = batch_parallelism
+        self.voice_catalog = voice_catalog
 
     def process_tts_request(self, request: TTSRequest) -> TTSResponse:
         try:
 
             self._validate_request(request)
 
-            response = self.google_client.synthesize_speech(request)
-
-            if not response.success and response.error_message:
-
-                raise TTSProcessingError(
-                    f"Speech synthesis failed: {response.error_message}"
-                )
+            chunks = split_text(request.text, self.chunk_max_bytes)
+            if len(chunks) == 1:
+                return self._synthesize(request)
 
-            return response
+            return self._synthesize_chunks(request, chunks)
 
         except (TTSValidationError, TTSProcessingError) as tts_error:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=str(tts_error),
             )
@@ -34,7 +52,7 @@ class TTSDomainService(TTSDomainServiceInterface):
         except (ValueError, TypeError, AttributeError) as e:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"Processing error during TTS synthesis: {str(e)}",
             )
@@ -42,20 +60,125 @@ class TTSDomainService(TTSDomainServiceInterface):
         except (OSError, IOError, RuntimeError) as system_error:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"System error during TTS processing: {str(system_error)}",
             )
 
+    def process_tts_batch(
+        self, requests: Sequence[TTSRequest]
+    ) -> Iterator[Tuple[int, TTSResponse]]:
+        positions_by_key: Dict[str, List[int]] = {}
+        for position, request in enumerate(requests):
+            positions_by_key.setdefault(request.cache_key(), []).append(position)
+
+        if not positions_by_key:
+            return iter(())
+        return self._run_batch(requests, list(positions_by_key.values()))
+
+    def _run_batch(
+        self, requests: Sequence[TTSRequest], position_groups: List[List[int]]
+    ) -> Iterator[Tuple[int, TTSResponse]]:
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.batch_parallelism, len(position_groups)),
+            thread_name_prefix="tts-batch",
+        )
+        try:
+            futures = {}
+            for positions in position_groups:
+                future = executor.submit(
+                    self.process_tts_request, requests[positions[0]]
+                )
+                futures[future] = positions
+
+            for future in as_completed(futures):
+                response = future.result()
+                for position in futures[future]:
+                    yield position, response
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stream_tts_request(self, request: TTSRequest) -> Iterator[bytes]:
+        self._validate_request(request)
+        sentences = split_sentences(request.text, self.chunk_max_bytes)
+        return self._stream_sentences(request, sentences)
+
+    def _stream_sentences(
+        self, request: TTSRequest, sentences: List[str]
+    ) -> Iterator[bytes]:
+        sentence_requests = iter(
+            TTSRequest(text=sentence, voice_config=request.voice_config)
+            for sentence in sentences
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=self.chunk_parallelism, thread_name_prefix="tts-stream"
+        )
+        try:
+            pending = deque(
+                executor.submit(self._synthesize, sentence_request)
+                for sentence_request in islice(
+                    sentence_requests, self.chunk_parallelism
+                )
+            )
+            first = True
+            while pending:
+                response = pending.popleft().result()
+                next_request = next(sentence_requests, None)
+                if next_request is not None:
+                    pending.append(executor.submit(self._synthesize, next_request))
+                yield stream_segment(
+                    response.audio_content, request.voice_config.audio_encoding, first
+                )
+                first = False
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _synthesize(self, request: TTSRequest) -> TTSResponse:
+        response = self.single_flight.do(
+            request.cache_key(),
+            lambda: self.google_client.synthesize_speech(request),
+        )
+
+        if not response.success and response.error_message:
+
+            raise TTSProcessingError(
+                f"Speech synthesis failed: {response.error_message}"
+            )
+
+        return response
+
+    def _synthesize_chunks(self, request: TTSRequest, chunks: List[str]) -> TTSResponse:
+        chunk_requests = [
+            TTSRequest(text=chunk, voice_config=request.voice_config)
+            for chunk in chunks
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.chunk_parallelism, len(chunk_requests)),
+            thread_name_prefix="tts-chunk",
+        ) as executor:
+            responses = list(executor.map(self._synthesize, chunk_requests))
+
+        audio = join_audio(
+            [response.audio_content for response in responses],
+            request.voice_config.audio_encoding,
+        )
+        return TTSResponse(audio_content=audio, success=True)
+
     def _validate_request(self, request: TTSRequest) -> None:
         if not request.text.strip():
             raise TTSValidationError("Text cannot be empty")
 
-        if len(request.text) > 5000:
-            raise TTSValidationError("Text exceeds maximum length of 5000 characters")
+        if len(request.text) > MAX_TEXT_LENGTH:
+            raise TTSValidationError(
+                f"Text exceeds maximum length of {MAX_TEXT_LENGTH} characters"
+            )
 
         if not request.voice_config.language_code:
             raise TTSValidationError("Language code is required")
 
         if not request.voice_config.name:
             raise TTSValidationError("Voice name is required")
+
+        if self.voice_catalog is not None:
+            self.voice_catalog.validate(request.voice_config)
@@ -0,0 +1,209 @@
+import threading
+from bisect import bisect_right
+from collections import deque
+from typing import Deque, List, Tuple
+
+import numpy as np
+
+from core.interfaces.voice_activity_detector_interface import (
+    VoiceActivityDetectorInterface,
+)
+from core.services.pcm_audio import PcmAudio
+
+
+class EnergyZcrVad(VoiceActivityDetectorInterface):
+    """
+    Frame-level voice activity from energy and zero-crossing rate.
+
+    A frame is speech when it is louder than ``threshold_db`` dBFS, or when
+    it is within ``fricative_margin_db`` of that and crosses zero often
+    enough (``zcr_threshold`` crossings per sample) to be an unvoiced sound
+    such as "s" or "f" rather than background hum.
+    """
+
+    def __init__(
+        self,
+        threshold_db: float = -45.0,
+        fricative_margin_db: float = 10.0,
+        zcr_threshold: float = 0.25,
+        frame_ms: int = 20,
+    ) -> None:
+        self.threshold_db = threshold_db
+        self.fricative_margin_db = fricative_margin_db
+        self.zcr_threshold = zcr_threshold
+        self.frame_ms = frame_ms
+
+    def speech_frames(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        frame = sample_rate * self.frame_ms // 1000
+        count = len(samples) // frame
+        if not count:
+            return np.zeros(0, dtype=bool)
+
+        frames = samples[: count * frame].reshape(count, frame).astype(np.float32)
+        frames /= 32768.0
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        energy_db = 20 * np.log10(np.maximum(rms, 1e-10))
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame
+
+        loud = energy_db > self.threshold_db
+        fricative = (energy_db > self.threshold_db - self.fricative_margin_db) & (
+            zcr > self.zcr_threshold
+        )
+        return loud | fricative
+
+
+class TimeMap:
+    """
+    Maps times in audio that had silence removed back to the original
+    recording. Each span records, in ``unit_seconds`` steps, where a run of
+    kept audio starts in both timelines; spans are only ever appended.
+    """
+
+    def __init__(self, unit_seconds: float) -> None:
+        self.unit_seconds = unit_seconds
+        self._compressed_starts: List[int] = []
+        self._original_starts: List[int] = []
+
+    def add(self, compressed_start: int, original_start: int) -> None:
+        if self._compressed_starts:
+            shift = self._original_starts[-1] - self._compressed_starts[-1]
+            if original_start - compressed_start == shift:
+                return
+        self._compressed_starts.append(compressed_start)
+        self._original_starts.append(original_start)
+
+    def original(self, compressed_seconds: float) -> float:
+        position = compressed_seconds / self.unit_seconds
+        index = bisect_right(self._compressed_starts, position) - 1
+        if index < 0:
+            return compressed_seconds
+        shift = self._original_starts[index] - self._compressed_starts[index]
+        return compressed_seconds + shift * self.unit_seconds
+
+
+def compress_silence(
+    audio: PcmAudio,
+    detector: VoiceActivityDetectorInterface,
+    hangover_ms: int = 300,
+    max_pause_ms: int = 500,
+) -> Tuple[PcmAudio, TimeMap]:
+    """
+    Drop leading and trailing silence and shorten inner pauses. Speech is
+    padded by ``hangover_ms`` after and half that before it so word edges
+    survive; of the silence between padded speech at most ``max_pause_ms``
+    is kept.
+    """
+    frame = audio.sample_rate * detector.frame_ms // 1000
+    speech = detector.speech_frames(audio.samples, audio.sample_rate)
+    after = hangover_ms // detector.frame_ms
+    before = after // 2
+    # Frame i is kept when there is speech from ``after`` frames before it
+    # to ``before`` frames after it.
+    kernel = np.ones(before + after + 1)
+    padded = np.convolve(speech.astype(np.float32), kernel)
+    keep = padded[before : before + len(speech)] > 0
+
+    max_pause = max_pause_ms // detector.frame_ms
+    edges = np.diff(np.concatenate(([0], (~keep).astype(np.int8), [0])))
+    for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        if start == 0 or end == len(keep):
+            continue
+        if end - start > max_pause:
+            # Keep the edges of a long pause so it shrinks to max_pause.
+            keep[start : start + max_pause // 2] = True
+            keep[end - (max_pause - max_pause // 2) : end] = True
+        else:
+            keep[start:end] = True
+
+    time_map = TimeMap(detector.frame_ms / 1000)
+    pieces = []
+    compressed = 0
+    edges = np.diff(np.concatenate(([0], keep.astype(np.int8), [0])))
+    for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        time_map.add(compressed, int(start))
+        pieces.append(audio.samples[start * frame : end * frame])
+        compressed += int(end - start)
+
+    samples = np.concatenate(pieces) if pieces else audio.samples[:0]
+    return PcmAudio(samples, audio.sample_rate), time_map
+
+
+class StreamingVadGate:
+    """
+    Holds back silence from a LINEAR16 mono stream as it arrives.
+
+    Speech frames pass, followed by ``hangover_ms`` of whatever comes after
+    them; the last ``preroll_ms`` of silence is kept aside and released when
+    speech resumes. While silence is being dropped, one frame is let through
+    every ``keepalive_ms`` so the upstream stream does not time out. The
+    ``time_map`` translates upstream times back to the client's timeline.
+    """
+
+    def __init__(
+        self,
+        detector: VoiceActivityDetectorInterface,
+        sample_rate: int,
+        hangover_ms: int = 300,
+        preroll_ms: int = 150,
+        keepalive_ms: int = 5000,
+    ) -> None:
+        self.detector = detector
+        self.sample_rate = sample_rate
+        self.frame_bytes = 2 * sample_rate * detector.frame_ms // 1000
+        self.hangover_frames = hangover_ms // detector.frame_ms
+        self.keepalive_frames = max(1, keepalive_ms // detector.frame_ms)
+        self.time_map = TimeMap(detector.frame_ms / 1000)
+        self._preroll: Deque[Tuple[int, bytes]] = deque(
+            maxlen=max(1, preroll_ms // detector.frame_ms)
+        )
+        self._remainder = b""
+        self._hangover = 0
+        self._dropped = 0
+        self._received_frames = 0
+        self._sent_frames = 0
+        self._lock = threading.Lock()
+
+    def process(self, chunk: bytes) -> bytes:
+        with self._lock:
+            data = self._remainder + chunk
+            usable = len(data) // self.frame_bytes * self.frame_bytes
+            self._remainder = data[usable:]
+            if not usable:
+                return b""
+
+            samples = np.frombuffer(data[:usable], dtype="<i2")
+            speech = self.detector.speech_frames(samples, self.sample_rate)
+            out = []
+            for index, is_speech in enumerate(speech):
+                position = self._received_frames + index
+                frame = data[index * self.frame_bytes : (index + 1) * self.frame_bytes]
+                if is_speech:
+                    while self._preroll:
+                        out.append(self._send(*self._preroll.popleft()))
+                    self._hangover = self.hangover_frames
+                    out.append(self._send(position, frame))
+                elif self._hangover:
+                    self._hangover -= 1
+                    out.append(self._send(position, frame))
+                else:
+                    self._hold(position, frame, out)
+            self._received_frames += len(speech)
+            return b"".join(out)
+
+    def original_time(self, upstream_seconds: float) -> float:
+        with self._lock:
+            return self.time_map.original(upstream_seconds)
+
+    def _hold(self, position: int, frame: bytes, out: List[bytes]) -> None:
+        if len(self._preroll) == self._preroll.maxlen:
+            self._dropped += 1
+        self._preroll.append((position, frame))
+        if self._dropped >= self.keepalive_frames:
+            self._dropped = 0
+            out.append(self._send(*self._preroll.popleft()))
+
+    def _send(self, position: int, frame: bytes) -> bytes:
+        self.time_map.add(self._sent_frames, position)
+        self._sent_frames += 1
+        return frame
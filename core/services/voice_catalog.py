@@ -0,0 +1,96 @@
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from core.domain.exceptions import TTSValidationError
+from core.domain.tts_model import Voice, VoiceConfig
+from core.interfaces.voice_catalog_interface import VoiceCatalogInterface
+
+_WILDCARD_GENDERS = ("SSML_VOICE_GENDER_UNSPECIFIED", "NEUTRAL")
+
+
+def _language_keys(language_code: str) -> Tuple[str, ...]:
+    language_code = language_code.lower()
+    primary = language_code.split("-", 1)[0]
+    return (language_code,) if primary == language_code else (language_code, primary)
+
+
+class _VoiceIndex:
+    def __init__(self, voices: Iterable[Voice]) -> None:
+        self.voices = tuple(sorted(voices, key=lambda voice: voice.name))
+        self.by_name: Dict[str, Voice] = {}
+        self.languages_by_name: Dict[str, FrozenSet[str]] = {}
+        self.by_language: Dict[str, List[Voice]] = {}
+        self.by_gender: Dict[str, List[Voice]] = {}
+
+        for voice in self.voices:
+            self.by_name[voice.name] = voice
+            self.by_gender.setdefault(voice.ssml_gender, []).append(voice)
+            keys = {
+                key for code in voice.language_codes for key in _language_keys(code)
+            }
+            self.languages_by_name[voice.name] = frozenset(keys)
+            for key in keys:
+                self.by_language.setdefault(key, []).append(voice)
+
+
+class VoiceCatalog(VoiceCatalogInterface):
+    """
+    In-memory index of the voices the TTS upstream offers.
+
+    Lookups read an immutable snapshot, and ``replace`` swaps in a freshly
+    built one, so a background refresh never blocks or tears a validation.
+    Until the first snapshot is loaded every voice is let through, leaving
+    the upstream as the only judge.
+    """
+
+    def __init__(self) -> None:
+        self._index: Optional[_VoiceIndex] = None
+        self.updated_at: Optional[float] = None
+
+    def replace(self, voices: Iterable[Voice]) -> None:
+        self._index = _VoiceIndex(voices)
+        self.updated_at = time.time()
+
+    def is_loaded(self) -> bool:
+        return self._index is not None
+
+    def validate(self, voice_config: VoiceConfig) -> None:
+        index = self._index
+        if index is None:
+            return
+
+        voice = index.by_name.get(voice_config.name)
+        if voice is None:
+            raise TTSValidationError(f"Unknown voice: {voice_config.name}")
+
+        language_code = voice_config.language_code.lower()
+        if language_code not in index.languages_by_name[voice.name]:
+            raise TTSValidationError(
+                f"Voice {voice.name} does not support language "
+                f"{voice_config.language_code}"
+            )
+
+        ssml_gender = voice_config.ssml_gender.upper()
+        if ssml_gender not in _WILDCARD_GENDERS and ssml_gender != voice.ssml_gender:
+            raise TTSValidationError(
+                f"Voice {voice.name} is {voice.ssml_gender}, not {ssml_gender}"
+            )
+
+    def list_voices(
+        self, language_code: Optional[str] = None, ssml_gender: Optional[str] = None
+    ) -> List[Voice]:
+        index = self._index
+        if index is None:
+            return []
+
+        if language_code:
+            voices = index.by_language.get(language_code.lower(), [])
+        elif ssml_gender:
+            voices = index.by_gender.get(ssml_gender.upper(), [])
+        else:
+            voices = list(index.voices)
+
+        if ssml_gender:
+            ssml_gender = ssml_gender.upper()
+            voices = [voice for voice in voices if voice.ssml_gender == ssml_gender]
+        return list(voices)
@@ -0,0 +1,15 @@
+from typing import Iterator, Sequence, Tuple
+
+from core.domain.tts_model import TTSRequest, TTSResponse
+from core.interfaces.tts_domain_service_interface import TTSDomainServiceInterface
+from core.interfaces.use_case_interfaces import UseCaseInterface
+
+
+class BatchSynthesizeSpeechUseCase(UseCaseInterface):
+    def __init__(self, service: TTSDomainServiceInterface) -> None:
+        self.service = service
+
+    def execute(
+        self, request: Sequence[TTSRequest]
+    ) -> Iterator[Tuple[int, TTSResponse]]:
+        return self.service.process_tts_batch(request)
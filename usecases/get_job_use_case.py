@@ -0,0 +1,13 @@
+from typing import Optional
+
+from core.domain.job_model import Job
+from core.interfaces.job_store_interface import JobStoreInterface
+from core.interfaces.use_case_interfaces import UseCaseInterface
+
+
+class GetJobUseCase(UseCaseInterface):
+    def __init__(self, store: JobStoreInterface) -> None:
+        self.store = store
+
+    def execute(self, request: str) -> Optional[Job]:
+        return self.store.get(request)
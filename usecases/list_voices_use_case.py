@@ -0,0 +1,18 @@
+from typing import Dict, List, Optional
+
+from core.domain.tts_model import Voice
+from core.interfaces.use_case_interfaces import UseCaseInterface
+from core.interfaces.voice_catalog_interface import VoiceCatalogInterface
+
+
+class ListVoicesUseCase(UseCaseInterface):
+    def __init__(self, catalog: VoiceCatalogInterface) -> None:
+        self.catalog = catalog
+
+    def execute(self, request: Dict[str, Optional[str]]) -> Optional[List[Voice]]:
+        if not self.catalog.is_loaded():
+            return None
+        return self.catalog.list_voices(
+            language_code=request.get("language_code"),
+            ssml_gender=request.get("ssml_gender"),
+        )
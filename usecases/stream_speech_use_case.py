@@ -0,0 +1,13 @@
+from typing import Iterator
+
+from core.domain.tts_model import TTSRequest
+from core.interfaces.tts_domain_service_interface import TTSDomainServiceInterface
+from core.interfaces.use_case_interfaces import UseCaseInterface
+
+
+class StreamSpeechUseCase(UseCaseInterface):
+    def __init__(self, service: TTSDomainServiceInterface) -> None:
+        self.service = service
+
+    def execute(self, request: TTSRequest) -> Iterator[bytes]:
+        return self.service.stream_tts_request(request)
@@ -1,35 +1,196 @@
 import asyncio
-from typing import Dict, Any, Callable
+import time
+from concurrent.futures import Future
+from typing import Dict, Any, Callable, List, Optional, Tuple
 
-from core.interfaces.google_stt_streaming_client_interface import (
-    GoogleSTTStreamingClientInterface,
-)
 from core.interfaces.use_case_interfaces import UseCaseInterface
+from core.services.async_runtime import AsyncRuntime
+from core.services.interim_throttle import InterimResultThrottle
+from core.services.ordered_dispatcher import OrderedDispatcher
+from core.services.stt_session_lifecycle import STTSessionLifecycle
+from core.services.streaming_metrics import StreamingMetrics
+from core.services.stt_streaming_session_manager import (
+    STTStreamingSession,
+    STTStreamingSessionManager,
+)
 
 
 class STTStreamingUseCase(UseCaseInterface):
-    def __init__(self, streaming_client: GoogleSTTStreamingClientInterface) -> None:
-        self.streaming_client = streaming_client
+    def __init__(
+        self,
+        session_manager: STTStreamingSessionManager,
+        runtime: AsyncRuntime,
+        interim_max_rate: float = 10.0,
+        interim_min_change: int = 1,
+        interim_delta: bool = False,
+        lifecycle: Optional[STTSessionLifecycle] = None,
+        metrics: Optional[StreamingMetrics] = None,
+        emitter: Optional[OrderedDispatcher] = None,
+    ) -> None:
+        self.session_manager = session_manager
+        self.runtime = runtime
+        self.emitter = emitter
+        self.lifecycle = lifecycle
+        self.metrics = metrics
+        self.interim_max_rate = interim_max_rate
+        self.interim_min_change = interim_min_change
+        self.interim_delta = interim_delta
+
+    def open_session(self, session_id: str) -> STTStreamingSession:
+        return self.session_manager.open(session_id)
+
+    def get_session(self, session_id: str) -> Optional[STTStreamingSession]:
+        return self.session_manager.get(session_id)
 
-    def execute(self, request: Dict[str, Any]) -> None:
-        self.streaming_client.setup_config(request)
+    def close_session(self, session_id: str) -> None:
+        self.session_manager.close(session_id)
+
+    def execute(
+        self,
+        session_id: str,
+        request: Dict[str, Any],
+        on_backpressure: Optional[Callable[[bool], None]] = None,
+    ) -> Optional[STTStreamingSession]:
+        session = self.session_manager.get(session_id)
+        if session is not None and (session.configured or session.streaming):
+            session = self.session_manager.reset(session_id)
+        if session is None:
+            return None
+
+        if on_backpressure is not None:
+            on_backpressure = self._dispatched(session_id, on_backpressure)
+        session.client.setup_config(request, on_backpressure)
+        session.interim_throttle = InterimResultThrottle(
+            max_rate=self._option(request, "interimMaxRate", self.interim_max_rate),
+            min_change=self._option(
+                request, "interimMinChange", self.interim_min_change
+            ),
+            delta=self._option(request, "interimDelta", self.interim_delta),
+        )
+        session.configured = True
+        session.configured_at = time.monotonic()
+        return session
+
+    def launch_streaming(
+        self, session_id: str, result_callback: Callable[[Dict[str, Any]], None]
+    ) -> Optional[Future]:
+        session = self.session_manager.get(session_id)
+        if session is None:
+            return None
+        session.task = self.runtime.submit(
+            self.start_streaming(session_id, result_callback)
+        )
+        return session.task
 
     async def start_streaming(
-        self, result_callback: Callable[[Dict[str, Any]], None]
+        self, session_id: str, result_callback: Callable[[Dict[str, Any]], None]
     ) -> None:
+        session = self.session_manager.get(session_id)
+        if session is None:
+            return
+
+        throttle = session.interim_throttle
+        metrics = self.metrics
+        loop = asyncio.get_running_loop()
+        flush_handle: Optional[asyncio.TimerHandle] = None
+        flush_task: Optional[asyncio.Task] = None
+
         async def async_callback(result: Dict[str, Any]) -> None:
+            if throttle is not None:
+                result = throttle.filter(result)
+                schedule_flush(throttle.flush_delay())
+                if result is None:
+                    return
+            await emit(result)
+
+        def schedule_flush(delay: Optional[float]) -> None:
+            nonlocal flush_handle
+            if delay is None and flush_handle is not None:
+                flush_handle.cancel()
+                flush_handle = None
+            elif delay is not None and flush_handle is None:
+                flush_handle = loop.call_later(delay, start_flush)
+
+        def start_flush() -> None:
+            nonlocal flush_handle, flush_task
+            flush_handle = None
+            # Keep a reference so the task is not garbage collected early.
+            flush_task = loop.create_task(flush())
+
+        async def flush() -> None:
+            result = throttle.flush()
+            if result is not None:
+                await emit(result)
+
+        async def emit(result: Dict[str, Any]) -> None:
+            started_at = time.monotonic()
             if asyncio.iscoroutinefunction(result_callback):
                 await result_callback(result)
+            elif self.emitter is not None:
+                await asyncio.wrap_future(
+                    self.emitter.submit(session_id, result_callback, result)
+                )
             else:
                 result_callback(result)
+            if metrics is not None:
+                metrics.observe("emitSeconds", time.monotonic() - started_at)
+
+        client = session.client
+        session.streaming = True
+        try:
+            await client.start_streaming(async_callback)
+        finally:
+            schedule_flush(None)
+            if session.client is client:
+                session.streaming = False
 
-        await self.streaming_client.start_streaming(async_callback)
+    def add_audio_data(self, session_id: str, audio_data: bytes) -> None:
+        session = self.session_manager.get(session_id)
+        if session is not None:
+            session.last_audio_at = time.monotonic()
+            session.client.add_audio_chunk(audio_data)
 
-    def add_audio_data(self, audio_data: bytes) -> None:
-        self.streaming_client.add_audio_chunk(audio_data)
+    def stop_streaming(self, session_id: str) -> None:
+        session = self.session_manager.get(session_id)
+        if session is not None:
+            session.client.stop_streaming()
+            session.streaming = False
+
+    def is_streaming_active(self, session_id: str) -> bool:
+        session = self.session_manager.get(session_id)
+        return session is not None and session.client.is_active()
+
+    def expire_sessions(self, now: Optional[float] = None) -> List[Tuple[str, str]]:
+        """Stop every active stream the lifecycle says has expired."""
+        if self.lifecycle is None:
+            return []
+        now = time.monotonic() if now is None else now
+
+        expired = []
+        for session in self.session_manager.sessions():
+            client = session.client
+            if not client.is_active():
+                continue
+            reason = self.lifecycle.expiry_reason(session, now)
+            if reason and self.session_manager.expire(session.session_id, client):
+                expired.append((session.session_id, reason))
+        return expired
+
+    def dispatch(
+        self, session_id: str, callback: Callable[..., None], *args: Any
+    ) -> None:
+        """Run a blocking notification for a session off the calling thread."""
+        if self.emitter is None:
+            callback(*args)
+        else:
+            self.emitter.submit(session_id, callback, *args)
 
-    def stop_streaming(self) -> None:
-        self.streaming_client.stop_streaming()
+    def _dispatched(
+        self, session_id: str, callback: Callable[..., None]
+    ) -> Callable[..., None]:
+        return lambda *args: self.dispatch(session_id, callback, *args)
 
-    def is_streaming_active(self) -> bool:
-        return self.streaming_client.is_active()
+    @staticmethod
+    def _option(request: Dict[str, Any], key: str, default: Any) -> Any:
+        value = request.get(key)
+        return default if value is None else value
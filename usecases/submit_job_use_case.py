@@ -0,0 +1,11 @@
+from core.domain.job_model import Job
+from core.interfaces.job_store_interface import JobStoreInterface
+from core.interfaces.use_case_interfaces import UseCaseInterface
+
+
+class SubmitJobUseCase(UseCaseInterface):
+    def __init__(self, store: JobStoreInterface) -> None:
+        self.store = store
+
+    def execute(self, request: Job) -> Job:
+        return self.store.enqueue(request)